@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
+from array import array
 import asyncio
+from contextlib import nullcontext
 from datetime import timedelta
 import logging
-import threading
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Optional
 
-from pymodbus.client import ModbusTcpClient
-from pymodbus.exceptions import ConnectionException
-import voluptuous as vol
+from pymodbus.exceptions import ModbusException
 
 from homeassistant.helpers.entity import Entity
 from homeassistant.config_entries import ConfigEntry
@@ -19,17 +19,100 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_PORT,
     CONF_SCAN_INTERVAL,
+    CONF_TIMEOUT,
     Platform,
 )
 from homeassistant.core import HomeAssistant, callback
-import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.event import async_track_time_interval
-
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+import homeassistant.util.dt as dt_util
+
+
+from .const import (
+    CONF_BAUDRATE,
+    CONF_CODEC,
+    CONF_LOOP_THRESHOLD,
+    CONF_PIPELINE,
+    CONF_DEVICE_IDS,
+    CONF_PROXY_HOST,
+    CONF_PROXY_PORT,
+    CONF_TRAFFIC_LOG,
+    CONF_TRANSPORT,
+    DEFAULT_BAUDRATE,
+    DEFAULT_DEVICE_ID,
+    DEFAULT_LOOP_THRESHOLD,
+    DEFAULT_PROXY_HOST,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT,
+    CONFIRM_RETRY_INTERVAL,
+    DOMAIN,
+    FIRST_POLL_TIMEOUT,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+)
+from .registers import (
+    HOLDING_REGISTER_BASE,
+    HOLDING_REGISTERS,
+    MISSING_VALUE,
+    confirm_reads,
+    encode_parameters,
+    plan_reads,
+    plan_writes,
+    to_signed,
+)
+from .connection import async_get_connection, async_release_connection
+from .metrics import HubMetrics, block_name
+from .scheduler import async_get_scheduler
+from .services import async_setup_services
+from .transport import CODEC_PYMODBUS, TRANSPORT_TCP, FrameTiming
 
-from .const import DEFAULT_NAME, DEFAULT_SCAN_INTERVAL, DOMAIN
+if TYPE_CHECKING:
+    from .profiler import RefreshProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
+# Register spans the controller accepts in one read, as (client method, address,
+# count). Polls read them whole or in parts, see plan_poll
+READ_SPANS = (
+    ("read_input_registers", 10, 43),  # IR 10-52
+    ("read_input_registers", 60, 16),  # IR 60-75
+    ("read_holding_registers", 100, 51),  # HR 100-150
+)
+
+# Registers used by decode_registers
+NEEDED_REGISTERS = {
+    "read_input_registers": set(range(10, 53)) | set(range(60, 76)),
+    "read_holding_registers": {
+        address
+        for register in HOLDING_REGISTERS.values()
+        if register.readable
+        for address in range(register.address, register.address + register.width)
+    },
+}
+
+
+def plan_poll(
+    timing: FrameTiming, full: bool = False
+) -> tuple[tuple[str, int, int], ...]:
+    """Return the reads of a poll, with unused registers skipped where it pays off.
+
+    With ``full`` the spans are read whole, as the proxy has to answer reads
+    of any register in them.
+    """
+    if full:
+        return READ_SPANS
+    return tuple(
+        (method, address, count)
+        for method, span_address, span_count in READ_SPANS
+        for address, count in plan_reads(
+            [(span_address, span_count)],
+            NEEDED_REGISTERS[method],
+            timing.max_bridged_gap,
+        )
+    )
+
 # PLATFORMS = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.SELECT]
 PLATFORMS = [
     Platform.SELECT,
@@ -45,6 +128,7 @@ PLATFORMS = [
 async def async_setup(hass, config):
     """Set up the HaHeliotherm modbus component."""
     hass.data[DOMAIN] = {}
+    async_setup_services(hass)
     return True
 
 
@@ -53,19 +137,113 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     host = entry.data[CONF_HOST]
     name = entry.data[CONF_NAME]
     port = entry.data[CONF_PORT]
-    scan_interval = DEFAULT_SCAN_INTERVAL
+    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    timeout = entry.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+    loop_threshold = entry.options.get(CONF_LOOP_THRESHOLD, DEFAULT_LOOP_THRESHOLD)
+
+    device_ids = entry.data.get(CONF_DEVICE_IDS, [DEFAULT_DEVICE_ID])
+    transport = {
+        "transport": entry.data.get(CONF_TRANSPORT, TRANSPORT_TCP),
+        "baudrate": entry.data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE),
+        "codec": entry.data.get(CONF_CODEC, CODEC_PYMODBUS),
+    }
 
     _LOGGER.debug("Setup %s.%s", DOMAIN, name)
 
-    hub = HaHeliothermModbusHub(hass, name, host, port, scan_interval)
-    # """Register the hub."""
+    await _async_migrate_snapshot(hass, entry.entry_id, device_ids[0])
+    hub = HaHeliothermModbusHub(
+        hass,
+        name,
+        host,
+        port,
+        scan_interval,
+        entry.entry_id,
+        timeout,
+        device_ids[0],
+        pipelined=entry.options.get(CONF_PIPELINE, False),
+        traffic_log=_traffic_log_path(hass, entry),
+        loop_threshold=loop_threshold,
+        **transport,
+    )
+    # Further units behind the same gateway are polled together with the hub
+    for device_id in device_ids[1:]:
+        hub.units.append(
+            HaHeliothermModbusHub(
+                hass,
+                f"{name} {device_id}",
+                host,
+                port,
+                scan_interval,
+                entry.entry_id,
+                timeout,
+                device_id,
+                primary=hub,
+                loop_threshold=loop_threshold,
+                **transport,
+            )
+        )
     hass.data[DOMAIN][name] = {"hub": hub}
 
+    # Restore the last known register snapshot so entities start with values
+    for unit in hub.units:
+        await unit.async_restore_snapshot()
+    await hub.async_set_proxy_port(
+        entry.options.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT),
+        entry.options.get(CONF_PROXY_HOST, DEFAULT_PROXY_HOST),
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Connect and poll in the background so a slow gateway never blocks setup
+    entry.async_create_background_task(
+        hass, hub.async_start(), f"{DOMAIN}_{name}_start"
+    )
+
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry):
+    """Apply changed options to the running hub, reload for new connection or units."""
+    hub = hass.data[DOMAIN][entry.data[CONF_NAME]]["hub"]
+
+    if (
+        hub.transport,
+        hub.host,
+        hub.port,
+        hub.baudrate,
+        hub.codec,
+        hub.device_ids,
+    ) != (
+        entry.data.get(CONF_TRANSPORT, TRANSPORT_TCP),
+        entry.data[CONF_HOST],
+        entry.data[CONF_PORT],
+        entry.data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE),
+        entry.data.get(CONF_CODEC, CODEC_PYMODBUS),
+        entry.data.get(CONF_DEVICE_IDS, [DEFAULT_DEVICE_ID]),
+    ):
+        device_ids = entry.data.get(CONF_DEVICE_IDS, [DEFAULT_DEVICE_ID])
+        removed = [unit for unit in hub.units if unit.device_id not in device_ids]
+        await hass.config_entries.async_reload(entry.entry_id)
+        # Once unloaded, the removed units cannot schedule another save
+        for unit in removed:
+            await unit.async_remove_snapshot()
+        return
+
+    hub.async_apply_options(
+        entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        entry.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
+        entry.options.get(CONF_PIPELINE, False),
+        entry.options.get(CONF_LOOP_THRESHOLD, DEFAULT_LOOP_THRESHOLD),
+        _traffic_log_path(hass, entry),
+    )
+    await hub.async_set_proxy_port(
+        entry.options.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT),
+        entry.options.get(CONF_PROXY_HOST, DEFAULT_PROXY_HOST),
+    )
+
+
 async def async_unload_entry(hass, entry):
     """Unload HaHeliotherm mobus entry."""
     unload_ok = all(
@@ -79,12 +257,56 @@ async def async_unload_entry(hass, entry):
     if not unload_ok:
         return False
 
-    hass.data[DOMAIN].pop(entry.data["name"])
+    hub = hass.data[DOMAIN].pop(entry.data["name"])["hub"]
+    await hub.async_stop()
     return True
 
 
+async def async_remove_entry(hass, entry):
+    """Remove the persisted register snapshots of a deleted entry."""
+    device_ids = entry.data.get(CONF_DEVICE_IDS, [DEFAULT_DEVICE_ID])
+    for key in [_legacy_snapshot_key(entry.entry_id)] + [
+        _snapshot_key(entry.entry_id, device_id) for device_id in device_ids
+    ]:
+        await Store(hass, SNAPSHOT_STORAGE_VERSION, key).async_remove()
+
+
+def _traffic_log_path(hass: HomeAssistant, entry: ConfigEntry) -> str | None:
+    """Return the traffic log file of an entry, None if logging is off."""
+    if not entry.options.get(CONF_TRAFFIC_LOG, False):
+        return None
+    return hass.config.path(f"{DOMAIN}_traffic_{slugify(entry.data[CONF_NAME])}.bin")
+
+
+def _snapshot_key(entry_id, device_id) -> str:
+    """Return the storage key of the register snapshot of a unit."""
+    return f"{DOMAIN}.{entry_id}_{device_id}"
+
+
+def _legacy_snapshot_key(entry_id) -> str:
+    """Return the key the snapshot of the primary unit was stored under before."""
+    return f"{DOMAIN}.{entry_id}"
+
+
+async def _async_migrate_snapshot(hass: HomeAssistant, entry_id, device_id) -> None:
+    """Move the snapshot of the primary unit to the key with its device ID."""
+    legacy = Store(hass, SNAPSHOT_STORAGE_VERSION, _legacy_snapshot_key(entry_id))
+    snapshot = await legacy.async_load()
+    if snapshot is None:
+        return
+    store = Store(hass, SNAPSHOT_STORAGE_VERSION, _snapshot_key(entry_id, device_id))
+    if await store.async_load() is None:
+        await store.async_save(snapshot)
+    await legacy.async_remove()
+
+
 class HaHeliothermModbusHub:
-    """Thread safe wrapper class for pymodbus."""
+    """Polls one heat pump over a (possibly shared) Modbus connection.
+
+    Further units (device IDs) behind the same gateway are hubs of their own,
+    created with ``primary`` set. They hold their registers, data and entity
+    listeners, while the primary hub polls all ``units`` in one cycle.
+    """
 
     def __init__(
         self,
@@ -93,745 +315,909 @@ class HaHeliothermModbusHub:
         host,
         port,
         scan_interval,
+        entry_id,
+        timeout=DEFAULT_TIMEOUT,
+        device_id=DEFAULT_DEVICE_ID,
+        primary: HaHeliothermModbusHub | None = None,
+        transport=TRANSPORT_TCP,
+        baudrate=DEFAULT_BAUDRATE,
+        codec=CODEC_PYMODBUS,
+        pipelined=False,
+        traffic_log: str | None = None,
+        loop_threshold=DEFAULT_LOOP_THRESHOLD,
     ):
         """Initialize the Modbus hub."""
         self._hass = hass
-        self._client = ModbusTcpClient(host=host, port=port, timeout=3, retries=3)
-        self._lock = threading.Lock()
+        self._connection = async_get_connection(
+            hass, name, transport, host, port, baudrate, timeout, codec
+        )
+        self.transport = transport
+        self.host = host
+        self.port = port
+        self.baudrate = baudrate
+        self.codec = codec
+        # Units share the connection of the primary hub and its settings
+        if primary is None:
+            self._connection.set_timeout(name, timeout)
+            self._connection.set_pipelined(name, pipelined)
+            self._connection.set_traffic_log(name, traffic_log)
+        self.read_blocks = plan_poll(self._connection.timing)
+        # Blocks of the registers in the register arrays, set by complete polls
+        self.polled_blocks: tuple[tuple[str, int, int], ...] = ()
+        self.device_id = device_id
+        self.units = [self]
         self._name = name
         self._scan_interval = timedelta(seconds=scan_interval)
-        self._unsub_interval_method = None
+        self._scheduled = False
+        self._proxy = None
         self._sensors = []
+        self._store = Store(
+            hass,
+            SNAPSHOT_STORAGE_VERSION,
+            _snapshot_key(entry_id, device_id),
+        )
+        self._setup_started = time.monotonic()
+        self.time_to_first_data = None
+        self.last_confirm_time = None
+        self._input_registers = array("H", [0]) * 66  # IR 10-75
+        self._holding_registers = array("H", [0]) * 51  # HR 100-150
+        # Reads land here first, the registers are only replaced by complete polls
+        self._staged_input_registers = array("H", [0]) * 66
+        self._staged_holding_registers = array("H", [0]) * 51
+        self.last_update = None
+        self.stale = False
         self.data = {}
+        self.metrics = HubMetrics(name)
+        self.metrics.set_loop_threshold(loop_threshold / 1000)
+        self._metrics_listeners = []
+        self._profiler: RefreshProfiler | None = None
+
+    async def async_start(self) -> None:
+        """Connect, fetch the first data and hand the hub to the poll scheduler."""
+        if not await self._hass.async_add_executor_job(self.connect):
+            _LOGGER.warning(
+                "Could not connect to %s, retrying with the next poll", self._name
+            )
+
+        scheduler = async_get_scheduler(self._hass)
+        try:
+            async with asyncio.timeout(FIRST_POLL_TIMEOUT):
+                await scheduler.async_run(self)
+        except TimeoutError:
+            _LOGGER.warning(
+                "No data from %s within %s seconds, continuing in the background",
+                self._name,
+                FIRST_POLL_TIMEOUT,
+            )
+
+        scheduler.async_add(self, self._scan_interval)
+        self._scheduled = True
+
+    async def async_stop(self) -> None:
+        """Stop polling and the proxy, then release the connection."""
+        if self._scheduled:
+            async_get_scheduler(self._hass).async_remove(self)
+            self._scheduled = False
+        await self.async_set_proxy_port(0)
+        for unit in self.units:
+            await async_release_connection(self._hass, unit.name, unit._connection)
 
     @callback
-    def async_add_haheliotherm_modbus_sensor(self, update_callback):
-        """Listen for data updates."""
-        # This is the first sensor, set up interval.
-        if not self._sensors:
-            self.connect()
-            self._unsub_interval_method = async_track_time_interval(
-                self._hass, self.async_refresh_modbus_data, self._scan_interval
+    def async_apply_options(
+        self, scan_interval, timeout, pipelined, loop_threshold, traffic_log
+    ) -> None:
+        """Apply new poll options without reconnecting or recreating entities."""
+        self._connection.set_timeout(self._name, timeout)
+        self._connection.set_pipelined(self._name, pipelined)
+        self._connection.set_traffic_log(self._name, traffic_log)
+        for unit in self.units:
+            unit.metrics.set_loop_threshold(loop_threshold / 1000)
+
+        scan_interval = timedelta(seconds=scan_interval)
+        if scan_interval == self._scan_interval:
+            return
+        self._scan_interval = scan_interval
+
+        # Not started yet: async_start picks up the new interval
+        if self._scheduled:
+            async_get_scheduler(self._hass).async_add(self, self._scan_interval)
+        _LOGGER.debug("Poll interval of %s set to %s", self._name, scan_interval)
+
+    async def async_set_proxy_port(
+        self, port: int, host: str = DEFAULT_PROXY_HOST
+    ) -> None:
+        """Start, move or stop (port 0) the local Modbus TCP proxy.
+
+        ``host`` is the address the proxy listens on, 0.0.0.0 for all
+        interfaces.
+        """
+        if self._proxy is not None:
+            if (self._proxy.port, self._proxy.host) == (port, host):
+                return
+            await self._proxy.async_stop()
+            self._proxy = None
+        # Trimmed polls leave registers out that proxy clients may read
+        read_blocks = plan_poll(self._connection.timing, full=bool(port))
+        for unit in self.units:
+            unit.read_blocks = read_blocks
+        if not port:
+            return
+
+        # Imported on first use, most installations never start a proxy
+        from .proxy import ModbusProxy
+
+        proxy = ModbusProxy(self, port, host)
+        try:
+            await proxy.async_start()
+        except OSError as err:
+            _LOGGER.error(
+                "Could not start the Modbus proxy on %s:%s: %s", host, port, err
             )
+            return
+        self._proxy = proxy
+
+    @property
+    def poll_stats(self):
+        """Return the poll counters and start jitter of this hub."""
+        return async_get_scheduler(self._hass).stats(self)
+
+    @property
+    def device_ids(self) -> list[int]:
+        """Return the device IDs of all units polled by this hub."""
+        return [unit.device_id for unit in self.units]
+
+    def unit(self, device_id: int) -> HaHeliothermModbusHub | None:
+        """Return the unit with the given device ID."""
+        for unit in self.units:
+            if unit.device_id == device_id:
+                return unit
+        return None
+
+    def cached_registers(self, input_registers: bool, address: int, count: int):
+        """Return registers of the last poll, None if not all of them are polled."""
+        method = "read_input_registers" if input_registers else "read_holding_registers"
+        last = address + count - 1
+        if not any(
+            block_method == method
+            and block_address <= address
+            and last < block_address + block_count
+            for block_method, block_address, block_count in self.polled_blocks
+        ):
+            return None
+        registers, base = self._register_array(method)
+        return registers[address - base : last - base + 1].tolist()
+
+    def _register_array(self, method: str, staged: bool = False):
+        """Return the register array a read method fills and its first address."""
+        if method == "read_input_registers":
+            if staged:
+                return self._staged_input_registers, 10
+            return self._input_registers, 10
+        if staged:
+            return self._staged_holding_registers, HOLDING_REGISTER_BASE
+        return self._holding_registers, HOLDING_REGISTER_BASE
 
+    @callback
+    def async_add_haheliotherm_modbus_sensor(self, update_callback):
+        """Listen for data updates."""
         self._sensors.append(update_callback)
 
+        # Show restored values right away instead of waiting for the first poll
+        if self.data:
+            update_callback()
+
     @callback
     def async_remove_haheliotherm_modbus_sensor(self, update_callback):
         """Remove data update."""
         self._sensors.remove(update_callback)
 
-        if not self._sensors:
-            # """stop the interval timer upon removal of last sensor"""
-            self._unsub_interval_method()
-            self._unsub_interval_method = None
-            self.close()
+    @callback
+    def async_add_metrics_listener(self, update_callback):
+        """Listen for the metrics update after every poll, failed or not."""
+        self._metrics_listeners.append(update_callback)
+
+    @callback
+    def async_remove_metrics_listener(self, update_callback):
+        """Remove a metrics listener."""
+        self._metrics_listeners.remove(update_callback)
 
     async def async_refresh_modbus_data(self, _now: Optional[int] = None) -> None:
         """Time to update."""
-        if not self._sensors:
+        await self._async_refresh_units(self.units)
+
+    async def _async_refresh_units(self, units) -> None:
+        """Read the units that have listeners in one executor job and decode them."""
+        units = [unit for unit in units if unit._sensors]
+        if not units:
             return
 
-        update_result = self.read_modbus_registers()
+        profiler = self._profiler
+        started = time.monotonic()
+        if profiler is None:
+            results = await self._hass.async_add_executor_job(self.read_units, units)
+        else:
+            profiler.cycle_started()
+            results = await self._hass.async_add_executor_job(
+                profiler.run, self.read_units, units
+            )
+        duration = time.monotonic() - started
+        with nullcontext() if profiler is None else profiler.capture():
+            for unit, update_result in zip(units, results):
+                if update_result:
+                    unit._async_registers_updated()
+                unit.metrics.record_poll(duration, unit.connection_stats)
+                with unit.metrics.section("dispatch"):
+                    for update_callback in unit._metrics_listeners:
+                        update_callback()
+        if profiler is not None:
+            profiler.cycle_done()
+
+    async def async_profile(self, cycles: int, path: str) -> dict:
+        """Profile the next refresh cycles and write the results.
+
+        Returns the number of cycles profiled and the written files, which
+        start with ``path``. Gives up waiting for the cycles after their scan
+        intervals plus FIRST_POLL_TIMEOUT and writes what it has.
+        """
+        if self._profiler is not None:
+            raise HomeAssistantError(f"{self._name} is already being profiled")
+
+        # Imported on first use, cProfile and pstats are only needed here
+        from .profiler import RefreshProfiler, profiler_active
+
+        if profiler_active():
+            raise HomeAssistantError(
+                f"Cannot profile {self._name} while another profiler is active"
+            )
+        profiler = self._profiler = RefreshProfiler(cycles)
+        profiler.start()
+        try:
+            try:
+                async with asyncio.timeout(
+                    cycles * self._scan_interval.total_seconds() + FIRST_POLL_TIMEOUT
+                ):
+                    await profiler.done.wait()
+            except TimeoutError:
+                _LOGGER.warning(
+                    "Profiled only %s of %s refresh cycles of %s",
+                    profiler.completed,
+                    cycles,
+                    self._name,
+                )
+            finally:
+                self._profiler = None
+            files = await self._hass.async_add_executor_job(
+                profiler.write, path, self._name
+            )
+        finally:
+            profiler.stop()
+        return {"cycles": profiler.completed, **files}
 
-        if update_result:
+    @callback
+    def _async_registers_updated(self) -> None:
+        """Decode freshly read registers, persist them and notify the entities."""
+        with self.metrics.section("decode"):
+            self.decode_registers()
+        if self.time_to_first_data is None:
+            self.time_to_first_data = time.monotonic() - self._setup_started
+            _LOGGER.info(
+                "First data from %s after %.2f seconds",
+                self._name,
+                self.time_to_first_data,
+            )
+        self._store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+        with self.metrics.section("dispatch"):
             for update_callback in self._sensors:
                 update_callback()
 
+    async def async_remove_snapshot(self) -> None:
+        """Remove the persisted register snapshot, including a pending save."""
+        await self._store.async_remove()
+
+    async def async_restore_snapshot(self) -> None:
+        """Load the last persisted register snapshot and decode it as stale data."""
+        snapshot = await self._store.async_load()
+        if not snapshot:
+            return
+
+        input_registers = snapshot.get("input_registers", [])
+        holding_registers = snapshot.get("holding_registers", [])
+        if len(input_registers) != len(self._input_registers) or len(
+            holding_registers
+        ) != len(self._holding_registers):
+            _LOGGER.debug("Ignoring incompatible register snapshot of %s", self._name)
+            return
+
+        self._input_registers[:] = array("H", input_registers)
+        self._holding_registers[:] = array("H", holding_registers)
+        self.last_update = dt_util.parse_datetime(snapshot["timestamp"])
+        self.stale = True
+        # The snapshot holds at least the registers of a trimmed poll
+        self.polled_blocks = plan_poll(self._connection.timing)
+        with self.metrics.section("decode"):
+            self.decode_registers()
+        _LOGGER.debug(
+            "Restored register snapshot of %s from %s", self._name, self.last_update
+        )
+
+    @callback
+    def _snapshot_data(self) -> dict:
+        """Return the raw register snapshot to persist."""
+        return {
+            "timestamp": self.last_update.isoformat(),
+            "input_registers": self._input_registers.tolist(),
+            "holding_registers": self._holding_registers.tolist(),
+        }
+
+    @property
+    def stale_attributes(self) -> dict | None:
+        """Return state attributes flagging restored, not yet refreshed values."""
+        if not self.stale:
+            return None
+        return {"stale": True, "last_update": self.last_update.isoformat()}
+
     @property
     def name(self):
         """Return the name of this hub."""
         return self._name
 
-    def close(self):
-        """Disconnect client."""
-        with self._lock:
-            self._client.close()
+    @property
+    def connection_stats(self):
+        """Return the transaction counters of this hub on its connection."""
+        return self._connection.stats.get(self._name)
+
+    @property
+    def raw_registers(self) -> dict[str, int]:
+        """Return the registers of the last poll by name, e.g. IR 10.
+
+        Registers left out by the poll are left out here too.
+        """
+        registers = {}
+        for method, address, count in self.polled_blocks:
+            values, base = self._register_array(method)
+            for index in range(address - base, address - base + count):
+                registers[block_name(method, base + index)] = values[index]
+        return registers
+
+    @property
+    def connection_state(self) -> dict:
+        """Return the state of the connection of this hub."""
+        return self._connection.state
+
+    @property
+    def connects(self) -> int:
+        """Return how often the connection of this hub was (re)opened."""
+        return self._connection.connects
+
+    @property
+    def data_age(self) -> float | None:
+        """Return the seconds since the last successful poll."""
+        if self.last_update is None:
+            return None
+        return (dt_util.utcnow() - self.last_update).total_seconds()
 
     def connect(self):
         """Connect client."""
-        with self._lock:
-            self._client.connect()
+        with self.metrics.section("connect"):
+            return self._connection.connect(self._name)
 
     def read_input_registers(self, slave, address, count):
-        """Read holding registers."""
-        with self._lock:
-            return self._client.read_input_registers(address, count=count, device_id=slave)
-
-    def getsignednumber(self, number, bitlength=16):
-        mask = (2**bitlength) - 1
-        if number & (1 << (bitlength - 1)):
-            return number | ~mask
-        else:
-            return number & mask
+        """Read input registers."""
+        with self.metrics.section(f"read IR {address}"):
+            return self._connection.execute(
+                self._name,
+                "read_input_registers",
+                address,
+                count=count,
+                device_id=slave,
+            )
+
+    def read_holding_registers(self, address, count):
+        """Read holding registers, raise ModbusException on an error response."""
+        with self.metrics.section(f"read HR {address}"):
+            result = self._connection.execute(
+                self._name,
+                "read_holding_registers",
+                address,
+                count=count,
+                device_id=self.device_id,
+            )
+        if result.isError():
+            raise ModbusException(f"Reading HR {address} failed: {result}")
+        return result.registers
 
     def checkval(self, value, scale, bitlength=16):
         """Check value for missing item"""
         if value is None:
             return None
-        value = self.getsignednumber(value, bitlength)
+        value = to_signed(value, bitlength)
         value = round(value * scale, 1)
-        if value == -50.0:
+        if value == MISSING_VALUE:
             value = None
         return value
 
-    def getbetriebsart(self, bietriebsart_nr: int):
-        return (
-            "Aus"
-            if bietriebsart_nr == 0
-            else "Auto"
-            if bietriebsart_nr == 1
-            else "Kühlen"
-            if bietriebsart_nr == 2
-            else "Sommer"
-            if bietriebsart_nr == 3
-            else "Dauerbetrieb"
-            if bietriebsart_nr == 4
-            else "Absenken"
-            if bietriebsart_nr == 5
-            else "Urlaub"
-            if bietriebsart_nr == 6
-            else "Party"
-            if bietriebsart_nr == 7
-            else None
-        )
-
-    def getbetriebsartnr(self, bietriebsart_str: str):
-        return (
-            0
-            if bietriebsart_str == "Aus"
-            else 1
-            if bietriebsart_str == "Auto"
-            else 2
-            if bietriebsart_str == "Kühlen"
-            else 3
-            if bietriebsart_str == "Sommer"
-            else 4
-            if bietriebsart_str == "Dauerbetrieb"
-            else 5
-            if bietriebsart_str == "Absenken"
-            else 6
-            if bietriebsart_str == "Urlaub"
-            else 7
-            if bietriebsart_str == "Party"
-            else None
-        )
-
     async def setter_function_callback(self, entity: Entity, option):
-        # Handle Select entities
-        if entity.entity_description.key == "select_betriebsart":
-            await self.set_betriebsart(option)
-            return
-        if entity.entity_description.key == "select_mkr1_betriebsart":
-            await self.set_mkr1_betriebsart(option)
-            return
-        if entity.entity_description.key == "select_mkr2_betriebsart":
-            await self.set_mkr2_betriebsart(option)
-            return
-
-        # Handle Climate entities
-        if entity.entity_description.key == "climate_hkr_raum_soll":
-            temp = float(option["temperature"])
-            await self.set_raumtemperatur(temp)
-            return
-
-        if entity.entity_description.key == "climate_rlt_kuehlen":
-            temp = float(option["temperature"])
-            await self.set_rltkuehlen(temp)
-            return
-
-        if entity.entity_description.key == "climate_ww_bereitung":
-            tmin = float(option["target_temp_low"])
-            tmax = float(option["target_temp_high"])
-            await self.set_ww_bereitung(tmin, tmax)
-            return
-
-        if entity.entity_description.key == "climate_rl_soll":
-            temp = float(option["temperature"])
-            await self.set_rl_soll(temp)
-            return
-
-        # Handle Switch entities
-        if entity.entity_description.key == "climate_rl_soll_ovr":
-            await self.set_rl_soll_ovr(option)
-            return
-
-        # Handle Number entities (Heizkurven)
-        if entity.entity_description.key == "hkr_heizgrenze":
-            await self.set_hkr_heizgrenze(option)
-            return
-        if entity.entity_description.key == "hkr_rlt_soll_ohg":
-            await self.set_hkr_rlt_soll_ohg(option)
-            return
-        if entity.entity_description.key == "hkr_rlt_soll_0":
-            await self.set_hkr_rlt_soll_0(option)
-            return
-        if entity.entity_description.key == "hkr_rlt_soll_uhg":
-            await self.set_hkr_rlt_soll_uhg(option)
-            return
-
-        # Phase 2: WW Minimaltemp
-        if entity.entity_description.key == "ww_minimaltemp":
-            await self.set_ww_minimaltemp(option)
-            return
-
-        # Phase 2: Override Values
-        if entity.entity_description.key == "aussentemp_override_wert":
-            await self.set_aussentemp_override_wert(option)
-            return
-        if entity.entity_description.key == "puffer_override_wert":
-            await self.set_puffer_override_wert(option)
-            return
-        if entity.entity_description.key == "brauchwasser_override_wert":
-            await self.set_brauchwasser_override_wert(option)
-            return
-
-        # Phase 2: Override Switches
-        if entity.entity_description.key == "aussentemp_override":
-            await self.set_aussentemp_override(option)
-            return
-        if entity.entity_description.key == "puffer_override":
-            await self.set_puffer_override(option)
-            return
-        if entity.entity_description.key == "brauchwasser_override":
-            await self.set_brauchwasser_override(option)
-            return
-
-        # Phase 2: MKR Climate Entities
-        if entity.entity_description.key == "climate_mkr1_raum_soll":
-            temp = float(option["temperature"])
-            await self.set_mkr1_raumtemperatur(temp)
-            return
-        if entity.entity_description.key == "climate_mkr1_rlt_kuehlen":
-            temp = float(option["temperature"])
-            await self.set_mkr1_rlt_kuehlen(temp)
-            return
-        if entity.entity_description.key == "climate_mkr2_raum_soll":
-            temp = float(option["temperature"])
-            await self.set_mkr2_raumtemperatur(temp)
-            return
-        if entity.entity_description.key == "climate_mkr2_rlt_kuehlen":
-            temp = float(option["temperature"])
-            await self.set_mkr2_rlt_kuehlen(temp)
-            return
-
-        # Phase 3: MKR1 Heizkurven
-        if entity.entity_description.key == "mkr1_heizgrenze":
-            await self.set_mkr1_heizgrenze(option)
-            return
-        if entity.entity_description.key == "mkr1_rlt_soll_ohg":
-            await self.set_mkr1_rlt_soll_ohg(option)
-            return
-        if entity.entity_description.key == "mkr1_rlt_soll_0":
-            await self.set_mkr1_rlt_soll_0(option)
-            return
-        if entity.entity_description.key == "mkr1_rlt_soll_uhg":
-            await self.set_mkr1_rlt_soll_uhg(option)
-            return
-
-        # Phase 3: MKR2 Heizkurven
-        if entity.entity_description.key == "mkr2_heizgrenze":
-            await self.set_mkr2_heizgrenze(option)
-            return
-        if entity.entity_description.key == "mkr2_rlt_soll_ohg":
-            await self.set_mkr2_rlt_soll_ohg(option)
-            return
-        if entity.entity_description.key == "mkr2_rlt_soll_0":
-            await self.set_mkr2_rlt_soll_0(option)
-            return
-        if entity.entity_description.key == "mkr2_rlt_soll_uhg":
-            await self.set_mkr2_rlt_soll_uhg(option)
-            return
-
-        # Phase 3: PV/SG Parameter
-        if entity.entity_description.key == "pv_energie":
-            await self.set_pv_energie(option)
-            return
-        if entity.entity_description.key == "ueberheizen_pv_sg":
-            await self.set_ueberheizen_pv_sg(option)
-            return
-        if entity.entity_description.key == "unterkuehlen_pv_sg":
-            await self.set_unterkuehlen_pv_sg(option)
-            return
+        """Write the value of a select, climate, switch or number entity."""
+        key = entity.entity_description.key
 
-    async def set_betriebsart(self, betriebsart: str):
-        betriebsart_nr = self.getbetriebsartnr(betriebsart)
-        if betriebsart_nr is None:
-            return
-        self._client.write_register(address=100, value=betriebsart_nr, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_mkr1_betriebsart(self, betriebsart: str):
-        betriebsart_nr = self.getbetriebsartnr(betriebsart)
-        if betriebsart_nr is None:
-            return
-        self._client.write_register(address=107, value=betriebsart_nr, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_mkr2_betriebsart(self, betriebsart: str):
-        betriebsart_nr = self.getbetriebsartnr(betriebsart)
-        if betriebsart_nr is None:
-            return
-        self._client.write_register(address=112, value=betriebsart_nr, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_raumtemperatur(self, temperature: float):
-        if temperature is None:
-            return
-        temp_int = int(temperature * 10)
-        self._client.write_register(address=101, value=temp_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_rltkuehlen(self, temperature: float):
-        if temperature is None:
-            return
-        temp_int = int(temperature * 10)
-        self._client.write_register(address=104, value=temp_int, device_id=1)
-        await self.async_refresh_modbus_data()
+        await self.async_write_value(key, option)
 
-    async def set_ww_bereitung(self, temp_min: float, temp_max: float):
-        if temp_min is None or temp_max is None:
-            return
-        temp_max_int = int(temp_max * 10)
-        temp_min_int = int(temp_min * 10)
-        self._client.write_register(address=105, value=temp_max_int, device_id=1)
-        self._client.write_register(address=106, value=temp_min_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-#---------------------eingefügt-------------------------------------------------
-    async def set_rl_soll(self, temperature: float):
-        """Set return temperature setpoint - only works if override is active."""
-        if temperature is None:
-            return
-
-        # Check if override is active
-        if not self.data.get("climate_rl_soll_ovr", False):
-            error_msg = (
-                "⚠️ Rücklauf-Sollwert kann nicht geändert werden!\n\n"
-                "Der 'Rücklauf-Sollwert Override' Switch ist nicht aktiv. "
-                "Bitte aktivieren Sie zuerst den Switch, um die manuelle Steuerung zu ermöglichen.\n\n"
-                "**ACHTUNG:** Die manuelle Steuerung deaktiviert die automatische Regelung der Wärmepumpe!"
-            )
-
-            _LOGGER.warning(
-                "Versuch die Rücklauf-Solltemperatur auf %.1f°C zu ändern, aber Override ist nicht aktiv.",
-                temperature
-            )
-
-            # Create persistent notification
+        # Clear warning notification when override is activated
+        if key == "climate_rl_soll_ovr" and option:
             await self._hass.services.async_call(
                 "persistent_notification",
-                "create",
-                {
-                    "title": "⚠️ Rücklauf-Sollwert Override erforderlich",
-                    "message": error_msg,
-                    "notification_id": f"{DOMAIN}_rl_soll_override_warning",
-                },
+                "dismiss",
+                {"notification_id": f"{DOMAIN}_rl_soll_override_warning"},
             )
 
-            # Still raise error to prevent the write
-            from homeassistant.exceptions import HomeAssistantError
-            raise HomeAssistantError(
-                "Rücklauf-Sollwert Override ist nicht aktiv. Bitte zuerst den Override-Switch aktivieren."
-            )
-
-        temp_int = int(temperature * 10)
-        with self._lock:
-            self._client.write_register(address=102, value=temp_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_rl_soll_ovr(self, active: bool):
-        """Enable or disable manual override of return temperature setpoint."""
-        value = 1 if active else 0
-        with self._lock:
-            self._client.write_register(address=103, value=value, device_id=1)
-
-        # Clear warning notification when override is activated
-        if active:
-            try:
-                await self._hass.services.async_call(
-                    "persistent_notification",
-                    "dismiss",
-                    {"notification_id": f"{DOMAIN}_rl_soll_override_warning"},
-                )
-            except Exception:
-                # Notification might not exist, ignore
-                pass
-
-        await self.async_refresh_modbus_data()
-
-#---------------------eingefügt-------------------------------------------------
-
-    # Phase 1: Button callbacks
     async def button_press_callback(self, entity: Entity):
         """Handle button press events."""
         if entity.entity_description.key == "button_entstoerung":
-            await self.press_entstoerung()
-            return
-
-    async def press_entstoerung(self):
-        """Press Entstörung button (fault reset)."""
-        _LOGGER.info("Entstörung button pressed - resetting fault")
-        with self._lock:
-            # Write 1 to HR 128 to reset fault
-            self._client.write_register(address=128, value=1, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    # Phase 1: Setter für Heizkurven-Parameter
-    async def set_hkr_heizgrenze(self, value: float):
-        """Set HKR Heizgrenze (heating limit)."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=135, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
+            _LOGGER.info("Entstörung button pressed - resetting fault")
+        await self.async_write_value(entity.entity_description.key, 1)
+
+    async def async_write_value(self, key: str, value) -> None:
+        """Validate, encode and write a value by its register key, then refresh."""
+        await self.async_write_parameters({key: value})
+
+    async def async_write_parameters(
+        self, parameters: dict, confirm_timeout: float | None = None
+    ) -> list:
+        """Write several values with the fewest transactions and refresh once.
+
+        Every value is validated before the first register is written. With a
+        ``confirm_timeout`` this only returns once the device reports the written
+        values, see ``_async_confirm_write_plan``. Returns the executed write
+        plan as (address, values) tuples.
+        """
+        try:
+            plan = plan_writes(encode_parameters(parameters))
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        await self._async_check_rl_soll_override(parameters)
+
+        await self._async_execute_write_plan(plan, confirm_timeout)
+        return plan
+
+    async def async_write_registers(self, address: int, values: list[int]) -> None:
+        """Write raw holding register values as given, then refresh."""
+        await self.async_check_raw_write(address, values)
+        await self._async_execute_write_plan([(address, list(values))])
+
+    async def async_check_raw_write(self, address: int, values: list[int]) -> None:
+        """Run the checks of the entities on a raw write, raise HomeAssistantError.
+
+        A raw write of the return temperature setpoint needs the override, as
+        for writes through the entity and the services.
+        """
+        written = dict(enumerate(values, address))
+        setpoint = HOLDING_REGISTERS["climate_rl_soll"]
+        override = HOLDING_REGISTERS["climate_rl_soll_ovr"]
+        if setpoint.address not in written:
+            return
+        await self._async_check_rl_soll_override(
+            {
+                "climate_rl_soll": setpoint.decode([written[setpoint.address]], 0),
+                "climate_rl_soll_ovr": bool(written.get(override.address)),
+            }
+        )
 
-    async def set_hkr_rlt_soll_ohg(self, value: float):
-        """Set HKR RLT Soll oberhalb Heizgrenze."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=136, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
+    async def async_apply_profile(
+        self, parameters: dict, confirm_timeout: float | None = None
+    ) -> tuple[list[str], list]:
+        """Write only the profile values that differ from the device.
+
+        Returns the keys that changed and the executed write plan.
+        """
+        try:
+            values = encode_parameters(parameters)
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        await self._async_check_rl_soll_override(parameters)
+
+        # Diff against fresh registers only
+        if self.stale or self.last_update is None:
+            await self._async_refresh_units([self])
+            if self.stale or self.last_update is None:
+                raise HomeAssistantError(
+                    f"Could not read the current settings of {self._name}, "
+                    "profile not applied"
+                )
 
-    async def set_hkr_rlt_soll_0(self, value: float):
-        """Set HKR RLT Soll bei 0°C."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=137, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
+        changed = {
+            address: value
+            for address, value in values.items()
+            if self._holding_registers[address - HOLDING_REGISTER_BASE] != value
+        }
+        changed_keys = [
+            key
+            for key in parameters
+            if any(
+                address in changed
+                for address in range(
+                    HOLDING_REGISTERS[key].address,
+                    HOLDING_REGISTERS[key].address + HOLDING_REGISTERS[key].width,
+                )
+            )
+        ]
+        self.metrics.skipped_writes += len(values) - len(changed)
+        if not changed:
+            return changed_keys, []
+
+        plan = plan_writes(changed)
+        await self._async_execute_write_plan(plan, confirm_timeout)
+        return changed_keys, plan
+
+    async def _async_execute_write_plan(self, plan, confirm_timeout=None) -> None:
+        """Execute a write plan in the executor and refresh afterwards."""
+        started = time.monotonic()
+        error = None
+        try:
+            await self._hass.async_add_executor_job(self.execute_write_plan, plan)
+            if confirm_timeout is not None:
+                await self._async_confirm_write_plan(plan, confirm_timeout)
+        except ModbusException as err:
+            self.metrics.write_errors += 1
+            error = str(err)
+            raise HomeAssistantError(f"Error writing to {self._name}: {err}") from err
+        except HomeAssistantError as err:
+            error = str(err)
+            raise
+        finally:
+            self.metrics.record_write(
+                dt_util.utcnow(), plan, time.monotonic() - started, error
+            )
+            await self._async_refresh_units([self])
+
+    async def _async_confirm_write_plan(self, plan, timeout: float) -> None:
+        """Read back the written registers until the device reflects them.
+
+        The controller silently ignores some writes (e.g. HR 102 without the
+        override flag HR 103), so a write is only confirmed once a targeted read
+        returns the written values. Raises HomeAssistantError after ``timeout``.
+        """
+        started = time.monotonic()
+        pending = confirm_reads(plan)
+        try:
+            async with asyncio.timeout(timeout):
+                while True:
+                    pending = [
+                        (address, values)
+                        for address, values in pending
+                        if not await self._async_registers_match(address, values)
+                    ]
+                    if not pending:
+                        break
+                    await asyncio.sleep(CONFIRM_RETRY_INTERVAL)
+        except TimeoutError:
+            addresses = ", ".join(
+                f"HR {address}"
+                if len(values) == 1
+                else f"HR {address}-{address + len(values) - 1}"
+                for address, values in pending
+            )
+            raise HomeAssistantError(
+                f"{self._name} did not confirm the write of {addresses} "
+                f"within {timeout} seconds"
+            ) from None
 
-    async def set_hkr_rlt_soll_uhg(self, value: float):
-        """Set HKR RLT Soll unterhalb Heizgrenze."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=138, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    # Phase 2: WW Minimaltemp
-    async def set_ww_minimaltemp(self, value: float):
-        """Set WW Minimaltemperatur."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=106, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    # Phase 2: MKR Climate Setters
-    async def set_mkr1_raumtemperatur(self, temperature: float):
-        """Set MKR1 Raum Solltemperatur."""
-        if temperature is None:
-            return
-        temp_int = int(temperature * 10)
-        with self._lock:
-            self._client.write_register(address=108, value=temp_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_mkr1_rlt_kuehlen(self, temperature: float):
-        """Set MKR1 Kühlen RLT min."""
-        if temperature is None:
-            return
-        temp_int = int(temperature * 10)
-        with self._lock:
-            self._client.write_register(address=111, value=temp_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_mkr2_raumtemperatur(self, temperature: float):
-        """Set MKR2 Raum Solltemperatur."""
-        if temperature is None:
-            return
-        temp_int = int(temperature * 10)
-        with self._lock:
-            self._client.write_register(address=113, value=temp_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_mkr2_rlt_kuehlen(self, temperature: float):
-        """Set MKR2 Kühlen RLT min."""
-        if temperature is None:
-            return
-        temp_int = int(temperature * 10)
-        with self._lock:
-            self._client.write_register(address=116, value=temp_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    # Phase 2: Override Setters
-    async def set_aussentemp_override_wert(self, value: float):
-        """Set Außentemperatur Override Value."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=129, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_aussentemp_override(self, active: bool):
-        """Enable or disable Außentemperatur Override."""
-        value = 1 if active else 0
-        with self._lock:
-            self._client.write_register(address=130, value=value, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_puffer_override_wert(self, value: float):
-        """Set Pufferspeicher Override Value."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=131, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_puffer_override(self, active: bool):
-        """Enable or disable Pufferspeicher Override."""
-        value = 1 if active else 0
-        with self._lock:
-            self._client.write_register(address=132, value=value, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_brauchwasser_override_wert(self, value: float):
-        """Set Brauchwasser Override Value."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=133, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_brauchwasser_override(self, active: bool):
-        """Enable or disable Brauchwasser Override."""
-        value = 1 if active else 0
-        with self._lock:
-            self._client.write_register(address=134, value=value, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    # Phase 3: MKR1 Heizkurven Setter
-    async def set_mkr1_heizgrenze(self, value: float):
-        """Set MKR1 Heizgrenze."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=139, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
+        self.last_confirm_time = time.monotonic() - started
+        _LOGGER.debug(
+            "Write to %s confirmed after %.3f seconds", self._name, self.last_confirm_time
+        )
 
-    async def set_mkr1_rlt_soll_ohg(self, value: float):
-        """Set MKR1 RLT Soll oberhalb Heizgrenze."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=140, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
+    async def _async_registers_match(self, address, values) -> bool:
+        """Return True if the holding registers at address hold the values."""
+        try:
+            registers = await self._hass.async_add_executor_job(
+                self.read_holding_registers, address, len(values)
+            )
+        except ModbusException as err:
+            _LOGGER.debug("Confirmation read of HR %s failed: %s", address, err)
+            return False
+        return list(registers) == list(values)
+
+    def execute_write_plan(self, plan):
+        """Execute a list of (address, values) writes back to back."""
+        for address, values in plan:
+            self.write_registers(address, values)
+
+    def write_registers(self, address, values):
+        """Write one (FC06) or several consecutive (FC16) holding registers."""
+        with self.metrics.section(f"write HR {address}"):
+            if len(values) == 1:
+                result = self._connection.execute(
+                    self._name,
+                    "write_register",
+                    address,
+                    values[0],
+                    device_id=self.device_id,
+                )
+            else:
+                result = self._connection.execute(
+                    self._name,
+                    "write_registers",
+                    address,
+                    values,
+                    device_id=self.device_id,
+                )
+        if result.isError():
+            raise ModbusException(f"HR {address} rejected the write: {result}")
 
-    async def set_mkr1_rlt_soll_0(self, value: float):
-        """Set MKR1 RLT Soll bei 0°C."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=141, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
+    async def _async_check_rl_soll_override(self, parameters: dict):
+        """Refuse to set the return temperature setpoint unless override is active.
 
-    async def set_mkr1_rlt_soll_uhg(self, value: float):
-        """Set MKR1 RLT Soll unterhalb Heizgrenze."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=142, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    # Phase 3: MKR2 Heizkurven Setter
-    async def set_mkr2_heizgrenze(self, value: float):
-        """Set MKR2 Heizgrenze."""
-        if value is None:
+        Applies to every write of climate_rl_soll, from the entity, the
+        services or the Modbus proxy. Writes that turn the override on along
+        with it pass.
+        """
+        # manual overwrite of flow return temp. is only possible if overwrite flag is set
+        if "climate_rl_soll" not in parameters:
             return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=143, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_mkr2_rlt_soll_ohg(self, value: float):
-        """Set MKR2 RLT Soll oberhalb Heizgrenze."""
-        if value is None:
+        if self.data.get("climate_rl_soll_ovr", False) or parameters.get(
+            "climate_rl_soll_ovr"
+        ):
             return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=144, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
+        temperature = parameters["climate_rl_soll"]
+        if isinstance(temperature, dict):
+            temperature = temperature.get("temperature")
 
-    async def set_mkr2_rlt_soll_0(self, value: float):
-        """Set MKR2 RLT Soll bei 0°C."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=145, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
+        error_msg = (
+            "⚠️ Rücklauf-Sollwert kann nicht geändert werden!\n\n"
+            "Der 'Rücklauf-Sollwert Override' Switch ist nicht aktiv. "
+            "Bitte aktivieren Sie zuerst den Switch, um die manuelle Steuerung zu ermöglichen.\n\n"
+            "**ACHTUNG:** Die manuelle Steuerung deaktiviert die automatische Regelung der Wärmepumpe!"
+        )
 
-    async def set_mkr2_rlt_soll_uhg(self, value: float):
-        """Set MKR2 RLT Soll unterhalb Heizgrenze."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=146, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    # Phase 3: PV/SG Parameter Setter
-    async def set_pv_energie(self, value: float):
-        """Set PV Energie (32-bit value)."""
-        if value is None:
-            return
-        value_int = int(value)
-        # Split into upper and lower 16-bit values
-        value_upper = (value_int >> 16) & 0xFFFF
-        value_lower = value_int & 0xFFFF
-        with self._lock:
-            self._client.write_register(address=117, value=value_upper, device_id=1)
-            self._client.write_register(address=118, value=value_lower, device_id=1)
-        await self.async_refresh_modbus_data()
-
-    async def set_ueberheizen_pv_sg(self, value: float):
-        """Set Überhitzen bei PV/SG."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=122, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
+        _LOGGER.warning(
+            "Versuch die Rücklauf-Solltemperatur auf %s°C zu ändern, aber Override ist nicht aktiv.",
+            temperature,
+        )
 
-    async def set_unterkuehlen_pv_sg(self, value: float):
-        """Set Unterkühlen bei PV/SG."""
-        if value is None:
-            return
-        value_int = int(value * 10)
-        with self._lock:
-            self._client.write_register(address=123, value=value_int, device_id=1)
-        await self.async_refresh_modbus_data()
+        # Create persistent notification
+        await self._hass.services.async_call(
+            "persistent_notification",
+            "create",
+            {
+                "title": "⚠️ Rücklauf-Sollwert Override erforderlich",
+                "message": error_msg,
+                "notification_id": f"{DOMAIN}_rl_soll_override_warning",
+            },
+        )
 
-#---------------------eingefügt-------------------------------------------------
+        # Still raise error to prevent the write
+        raise HomeAssistantError(
+            "Rücklauf-Sollwert Override ist nicht aktiv. Bitte zuerst den Override-Switch aktivieren."
+        )
 
     def read_modbus_registers(self):
         """Read from modbus registers"""
-        modbusdata = self.read_input_registers(slave=1, address=10, count=43)  # IR 10-52
-        modbusdata2 = self.read_input_registers(slave=1, address=60, count=16)
-        modbusdata3 = self._client.read_holding_registers(
-            address=100, count=51, device_id=1  # HR 100-150
-        )
-
-        # if modbusdata.isError():
-        #    return False
-
-        temp_aussen = modbusdata.registers[0]
+        return self.read_units([self])[0]
+
+    def read_units(self, units) -> list[bool]:
+        """Read the register blocks of several units, interleaved.
+
+        Every unit's first block is read before any unit's second one, so the
+        data of all units is taken at nearly the same time. A unit that fails
+        is skipped for the rest of the cycle: an unreachable unit costs a
+        single timeout instead of one per block. The registers of a unit are
+        only replaced if all of its blocks were read. Returns one success
+        flag per unit.
+
+        With pipelining enabled all reads are sent at once. If that fails but
+        sequential reads of all units succeed, the gateway may not support
+        pipelining. It is turned off after a few such polls in a row.
+        """
+        # Starting the proxy may change the blocks in the middle of a poll
+        blocks = self.read_blocks
+        # (block, seconds, success) per unit, for the diagnostics
+        timings = {unit: [] for unit in units}
+        if self._connection.pipelined:
+            read = self._read_pipelined(units, blocks, timings)
+            if read is None:
+                # Only if every unit answers one by one is the gateway to blame,
+                # not an unreachable device or unit
+                read = self._read_sequential(units, blocks, timings)
+                if len(read) == len(units):
+                    self._connection.pipeline_failed()
+        else:
+            read = self._read_sequential(units, blocks, timings)
+
+        now = dt_util.utcnow()
+        for unit, unit_timings in timings.items():
+            unit.metrics.record_trace(now, unit_timings)
+        for unit in read:
+            for method, address, count in blocks:
+                target, base = unit._register_array(method)
+                staged, _ = unit._register_array(method, staged=True)
+                start = address - base
+                target[start : start + count] = staged[start : start + count]
+            unit.polled_blocks = blocks
+            unit.last_update = now
+            unit.stale = False
+        return [unit in read for unit in units]
+
+    def _read_sequential(self, units, blocks, timings) -> set:
+        """Read the blocks one transaction at a time, return the units read."""
+        read = set(units)
+        for method, address, count in blocks:
+            for unit in units:
+                if unit not in read:
+                    continue
+                staged, base = unit._register_array(method, staged=True)
+                started = time.perf_counter()
+                try:
+                    with unit.metrics.section(f"read {block_name(method, address)}"):
+                        update_result = unit._connection.read_into(
+                            unit.name,
+                            method,
+                            address,
+                            count,
+                            unit.device_id,
+                            memoryview(staged)[
+                                address - base : address - base + count
+                            ],
+                        )
+                except ModbusException as err:
+                    _LOGGER.warning("Error reading from %s: %s", unit.name, err)
+                    update_result = False
+                timings[unit].append(
+                    (
+                        block_name(method, address),
+                        time.perf_counter() - started,
+                        bool(update_result),
+                    )
+                )
+                if not update_result:
+                    unit.metrics.record_read_error(method, address)
+                    read.discard(unit)
+        return read
+
+    def _read_pipelined(self, units, blocks, timings) -> set | None:
+        """Send the reads of all blocks at once, return the units read.
+
+        None means the pipelined transaction failed as a whole. All blocks are
+        timed with the duration of the whole transaction.
+        """
+        requests = []
+        for method, address, count in blocks:
+            for unit in units:
+                staged, base = unit._register_array(method, staged=True)
+                requests.append(
+                    (
+                        method,
+                        address,
+                        count,
+                        unit.device_id,
+                        memoryview(staged)[address - base : address - base + count],
+                    )
+                )
+        started = time.perf_counter()
+        with self.metrics.section("pipelined read"):
+            results = self._connection.read_pipelined(self.name, requests)
+        duration = time.perf_counter() - started
+        if results is None:
+            for unit in units:
+                timings[unit].append(("pipelined", duration, False))
+            return None
+        read = set(units)
+        for index, result in enumerate(results):
+            unit = units[index % len(units)]
+            method, address, _ = blocks[index // len(units)]
+            timings[unit].append((block_name(method, address), duration, result))
+            if not result:
+                unit.metrics.record_read_error(method, address)
+                read.discard(unit)
+        return read
+
+    def decode_registers(self):
+        """Decode the raw register arrays into entity values."""
+        ir = self._input_registers  # IR 10-75, index = IR - 10
+        hr = self._holding_registers  # HR 100-150, index = HR - 100
+
+        temp_aussen = ir[0]
         self.data["temp_aussen"] = self.checkval(temp_aussen, 0.1)
 
-        temp_brauchwasser = modbusdata.registers[1]
+        temp_brauchwasser = ir[1]
         self.data["temp_brauchwasser"] = self.checkval(temp_brauchwasser, 0.1)
 
-        temp_vorlauf = modbusdata.registers[2]
+        temp_vorlauf = ir[2]
         self.data["temp_vorlauf"] = self.checkval(temp_vorlauf, 0.1)
 
-        temp_ruecklauf = modbusdata.registers[3]
+        temp_ruecklauf = ir[3]
         self.data["temp_ruecklauf"] = self.checkval(temp_ruecklauf, 0.1)
 
-        temp_pufferspeicher = modbusdata.registers[4]
+        temp_pufferspeicher = ir[4]
         self.data["temp_pufferspeicher"] = self.checkval(temp_pufferspeicher, 0.1)
 
-        temp_eq_eintritt = modbusdata.registers[5]
+        temp_eq_eintritt = ir[5]
         self.data["temp_eq_eintritt"] = self.checkval(temp_eq_eintritt, 0.1)
 
-        temp_eq_austritt = modbusdata.registers[6]
+        temp_eq_austritt = ir[6]
         self.data["temp_eq_austritt"] = self.checkval(temp_eq_austritt, 0.1)
 
-        temp_sauggas = modbusdata.registers[7]
+        temp_sauggas = ir[7]
         self.data["temp_sauggas"] = self.checkval(temp_sauggas, 0.1)
 
-        temp_verdampfung = modbusdata.registers[8]
+        temp_verdampfung = ir[8]
         self.data["temp_verdampfung"] = self.checkval(temp_verdampfung, 0.1)
 
-        temp_kodensation = modbusdata.registers[9]
+        temp_kodensation = ir[9]
         self.data["temp_kodensation"] = self.checkval(temp_kodensation, 0.1)
 
-        temp_heissgas = modbusdata.registers[10]
+        temp_heissgas = ir[10]
         self.data["temp_heissgas"] = self.checkval(temp_heissgas, 0.1)
 
-        bar_niederdruck = modbusdata.registers[11]
+        bar_niederdruck = ir[11]
         self.data["bar_niederdruck"] = self.checkval(bar_niederdruck, 0.1)
 
-        bar_hochdruck = modbusdata.registers[12]
+        bar_hochdruck = ir[12]
         self.data["bar_hochdruck"] = self.checkval(bar_hochdruck, 0.1)
 
-        on_off_heizkreispumpe = modbusdata.registers[13]
+        on_off_heizkreispumpe = ir[13]
         self.data["on_off_heizkreispumpe"] = (
             "off" if (on_off_heizkreispumpe == 0) else "on"
         )
 
-        on_off_pufferladepumpe = modbusdata.registers[14]
+        on_off_pufferladepumpe = ir[14]
         self.data["on_off_pufferladepumpe"] = (
             "off" if (on_off_pufferladepumpe == 0) else "on"
         )
 
-        on_off_verdichter = modbusdata.registers[15]
+        on_off_verdichter = ir[15]
         self.data["on_off_verdichter"] = "off" if (on_off_verdichter == 0) else "on"
 
-        on_off_stoerung = modbusdata.registers[16]
+        on_off_stoerung = ir[16]
         self.data["on_off_stoerung"] = "off" if (on_off_stoerung == 0) else "on"
 
-        vierwegeventil_luft = modbusdata.registers[17]
+        vierwegeventil_luft = ir[17]
         self.data["vierwegeventil_luft"] = (
             "Abtaubetrieb" if (vierwegeventil_luft != 0) else "Aus"
         )
 
-        wmz_durchfluss = modbusdata.registers[18]
+        wmz_durchfluss = ir[18]
         self.data["wmz_durchfluss"] = self.checkval(wmz_durchfluss, 0.1)
 
-        n_soll_verdichter = modbusdata.registers[19]
+        n_soll_verdichter = ir[19]
         self.data["n_soll_verdichter"] = self.checkval(n_soll_verdichter, 1)
 
-        cop = modbusdata.registers[20]
+        cop = ir[20]
         self.data["cop"] = self.checkval(cop, 0.1)
 
-        temp_frischwasser = modbusdata.registers[21]
+        temp_frischwasser = ir[21]
         self.data["temp_frischwasser"] = self.checkval(temp_frischwasser, 0.1)
 
-        on_off_evu_sperre = modbusdata.registers[22]
+        on_off_evu_sperre = ir[22]
         self.data["on_off_evu_sperre"] = "on" if (on_off_evu_sperre == 0) else "off"
 
-        temp_aussen_verzoegert = modbusdata.registers[23]
+        temp_aussen_verzoegert = ir[23]
         self.data["temp_aussen_verzoegert"] = self.checkval(temp_aussen_verzoegert, 0.1)
 
-        hkr_solltemperatur = modbusdata.registers[24]
+        hkr_solltemperatur = ir[24]
         self.data["hkr_solltemperatur"] = self.checkval(hkr_solltemperatur, 0.1)
 
-        mkr1_solltemperatur = modbusdata.registers[25]
+        mkr1_solltemperatur = ir[25]
         self.data["mkr1_solltemperatur"] = self.checkval(mkr1_solltemperatur, 0.1)
 
-        mkr2_solltemperatur = modbusdata.registers[26]
+        mkr2_solltemperatur = ir[26]
         self.data["mkr2_solltemperatur"] = self.checkval(mkr2_solltemperatur, 0.1)
 
-        on_off_eq_ventilator = modbusdata.registers[27]
+        on_off_eq_ventilator = ir[27]
         self.data["on_off_eq_ventilator"] = (
             "off" if (on_off_eq_ventilator == 0) else "on"
         )
 
-        ww_vorrang = modbusdata.registers[28]
+        ww_vorrang = ir[28]
         self.data["ww_vorrang"] = "off" if (ww_vorrang == 0) else "on"
 
-        kuehlen_umv_passiv = modbusdata.registers[29]
+        kuehlen_umv_passiv = ir[29]
         self.data["kuehlen_umv_passiv"] = "off" if (kuehlen_umv_passiv == 0) else "on"
 
-        expansionsventil = modbusdata.registers[30]
+        expansionsventil = ir[30]
         self.data["expansionsventil"] = self.checkval(expansionsventil, 0.1)
 
 #---------------------geändert-------------------------------------------------
-        verdichteranforderung = modbusdata.registers[31]
+        verdichteranforderung = ir[31]
         self.data["verdichteranforderung"] = (
             "Kühlen"
             if (verdichteranforderung == 10)
@@ -847,47 +1233,42 @@ class HaHeliothermModbusHub:
 
         # Phase 1: Neue Input Register (IR 32-42)
         # IR 37: Energiequellen Pumpe
-        on_off_eq_pumpe = modbusdata.registers[27]  # IR 37 = Index 27
+        on_off_eq_pumpe = ir[27]  # IR 37 = Index 27
         self.data["on_off_eq_pumpe"] = "off" if (on_off_eq_pumpe == 0) else "on"
 
         # IR 42-45: Betriebsstundenzähler (32-bit values)
         # IR 42-43: BSZ Verdichter WW
-        bsz_ww_upper = modbusdata.registers[32]  # IR 42 = Index 32
-        bsz_ww_lower = modbusdata.registers[33]  # IR 43 = Index 33
+        bsz_ww_upper = ir[32]  # IR 42 = Index 32
+        bsz_ww_lower = ir[33]  # IR 43 = Index 33
         bsz_verdichter_ww = (bsz_ww_upper << 16) | bsz_ww_lower
         self.data["bsz_verdichter_ww"] = bsz_verdichter_ww
 
         # IR 44-45: BSZ Verdichter HKR
-        bsz_hkr_upper = modbusdata.registers[34]  # IR 44 = Index 34
-        bsz_hkr_lower = modbusdata.registers[35]  # IR 45 = Index 35
+        bsz_hkr_upper = ir[34]  # IR 44 = Index 34
+        bsz_hkr_lower = ir[35]  # IR 45 = Index 35
         bsz_verdichter_hkr = (bsz_hkr_upper << 16) | bsz_hkr_lower
         self.data["bsz_verdichter_hkr"] = bsz_verdichter_hkr
 
         # IR 46-49: MKR1/MKR2 Vor-/Rücklauftemperaturen
-        mkr1_temp_vorlauf = modbusdata.registers[36]  # IR 46 = Index 36
+        mkr1_temp_vorlauf = ir[36]  # IR 46 = Index 36
         self.data["mkr1_temp_vorlauf"] = self.checkval(mkr1_temp_vorlauf, 0.1)
 
-        mkr1_temp_ruecklauf = modbusdata.registers[37]  # IR 47 = Index 37
+        mkr1_temp_ruecklauf = ir[37]  # IR 47 = Index 37
         self.data["mkr1_temp_ruecklauf"] = self.checkval(mkr1_temp_ruecklauf, 0.1)
 
-        mkr2_temp_vorlauf = modbusdata.registers[38]  # IR 48 = Index 38
+        mkr2_temp_vorlauf = ir[38]  # IR 48 = Index 38
         self.data["mkr2_temp_vorlauf"] = self.checkval(mkr2_temp_vorlauf, 0.1)
 
-        mkr2_temp_ruecklauf = modbusdata.registers[39]  # IR 49 = Index 39
+        mkr2_temp_ruecklauf = ir[39]  # IR 49 = Index 39
         self.data["mkr2_temp_ruecklauf"] = self.checkval(mkr2_temp_ruecklauf, 0.1)
 
         # IR 50: Raum 1 Temperatur
-        temp_raum1 = modbusdata.registers[40]  # IR 50 = Index 40
+        temp_raum1 = ir[40]  # IR 50 = Index 40
         self.data["temp_raum1"] = self.checkval(temp_raum1, 0.1)
 
         # -----------------------------------------------------------------------------------
-        # decoder = BinaryPayloadDecoder.fromRegisters(
-        #    modbusdata2.registers, byteorder=ENDIAN.BIG
-        # )
-        decoder = self._client.convert_from_registers(
-            modbusdata2.registers,
-            data_type=self._client.DATATYPE.UINT32,
-        )
+        # IR 60-75: Zähler (32-bit values, high word first)
+        decoder = [(ir[i] << 16) | ir[i + 1] for i in range(50, 66, 2)]
 
         wmz_heizung = decoder[0]
         self.data["wmz_heizung"] = wmz_heizung
@@ -915,162 +1296,22 @@ class HaHeliothermModbusHub:
 
         # -----------------------------------------------------------------------------------
 
-        select_betriebsart = modbusdata3.registers[0]
-        self.data["select_betriebsart"] = self.getbetriebsart(select_betriebsart)
-
-        select_mkr1_betriebsart = modbusdata3.registers[7]
-        self.data["select_mkr1_betriebsart"] = self.getbetriebsart(
-            select_mkr1_betriebsart
-        )
-
-        select_mkr2_betriebsart = modbusdata3.registers[12]
-        self.data["select_mkr2_betriebsart"] = self.getbetriebsart(
-            select_mkr2_betriebsart
-        )
-
-        climate_hkr_raum_soll = modbusdata3.registers[1]
-        self.data["climate_hkr_raum_soll"] = {
-            "temperature": self.checkval(climate_hkr_raum_soll, 0.1)
-        }
-
-        climate_rlt_kuehlen = modbusdata3.registers[4]
-        self.data["climate_rlt_kuehlen"] = {
-            "temperature": self.checkval(climate_rlt_kuehlen, 0.1)
-        }
-
-        climate_ww_bereitung_max = modbusdata3.registers[5]
-        climate_ww_bereitung_min = modbusdata3.registers[6]
-        self.data["climate_ww_bereitung"] = {
-            "target_temp_low": self.checkval(climate_ww_bereitung_min, 0.1),
-            "target_temp_high": self.checkval(climate_ww_bereitung_max, 0.1),
-            "temperature": self.checkval(temp_brauchwasser, 0.1),
-        }
-
-        # manual overwrite of flow return temp. is only possible if overwrite flag is set
-        # caution: overwritting the flow return temperure disables the automatic controle loop
-
-        climate_rl_soll = modbusdata3.registers[2]
-        self.data["climate_rl_soll"] = {
-            "temperature": self.checkval(climate_rl_soll, 0.1)
-        }
-
-        climate_rl_soll_ovr = modbusdata3.registers[3]
-        self.data["climate_rl_soll_ovr"] = bool(climate_rl_soll_ovr)
-
-        # Phase 1: Neue Holding Register
-        # HR 135-138: HKR Heizkurven (HR 100 + offset)
-        hkr_heizgrenze = modbusdata3.registers[35]  # HR 135 = Index 35
-        self.data["hkr_heizgrenze"] = self.checkval(hkr_heizgrenze, 0.1)
-
-        hkr_rlt_soll_ohg = modbusdata3.registers[36]  # HR 136 = Index 36
-        self.data["hkr_rlt_soll_ohg"] = self.checkval(hkr_rlt_soll_ohg, 0.1)
-
-        hkr_rlt_soll_0 = modbusdata3.registers[37]  # HR 137 = Index 37
-        self.data["hkr_rlt_soll_0"] = self.checkval(hkr_rlt_soll_0, 0.1)
-
-        hkr_rlt_soll_uhg = modbusdata3.registers[38]  # HR 138 = Index 38
-        self.data["hkr_rlt_soll_uhg"] = self.checkval(hkr_rlt_soll_uhg, 0.1)
-
-        # Phase 2: WW Minimaltemp, MKR Climate, Override
-        # Note: HR 106 is already read above as climate_ww_bereitung_min
-        # We use it for ww_minimaltemp
-        self.data["ww_minimaltemp"] = self.checkval(climate_ww_bereitung_min, 0.1)
-
-        # HR 108: MKR1 Raum Soll
-        climate_mkr1_raum_soll = modbusdata3.registers[8]  # HR 108 = Index 8
-        self.data["climate_mkr1_raum_soll"] = {
-            "temperature": self.checkval(climate_mkr1_raum_soll, 0.1)
-        }
-
-        # HR 111: MKR1 Kühlen RLT min
-        climate_mkr1_rlt_kuehlen = modbusdata3.registers[11]  # HR 111 = Index 11
-        self.data["climate_mkr1_rlt_kuehlen"] = {
-            "temperature": self.checkval(climate_mkr1_rlt_kuehlen, 0.1)
-        }
-
-        # HR 113: MKR2 Raum Soll
-        climate_mkr2_raum_soll = modbusdata3.registers[13]  # HR 113 = Index 13
-        self.data["climate_mkr2_raum_soll"] = {
-            "temperature": self.checkval(climate_mkr2_raum_soll, 0.1)
-        }
-
-        # HR 116: MKR2 Kühlen RLT min
-        climate_mkr2_rlt_kuehlen = modbusdata3.registers[16]  # HR 116 = Index 16
-        self.data["climate_mkr2_rlt_kuehlen"] = {
-            "temperature": self.checkval(climate_mkr2_rlt_kuehlen, 0.1)
-        }
-
-        # HR 129-134: Override Values and Flags
-        # HR 129-130: Außentemperatur Override
-        aussentemp_override_wert = modbusdata3.registers[29]  # HR 129 = Index 29
-        self.data["aussentemp_override_wert"] = self.checkval(aussentemp_override_wert, 0.1)
-
-        aussentemp_override = modbusdata3.registers[30]  # HR 130 = Index 30
-        self.data["aussentemp_override"] = bool(aussentemp_override)
-
-        # HR 131-132: Pufferspeicher Override
-        puffer_override_wert = modbusdata3.registers[31]  # HR 131 = Index 31
-        self.data["puffer_override_wert"] = self.checkval(puffer_override_wert, 0.1)
-
-        puffer_override = modbusdata3.registers[32]  # HR 132 = Index 32
-        self.data["puffer_override"] = bool(puffer_override)
-
-        # HR 133-134: Brauchwasser Override
-        brauchwasser_override_wert = modbusdata3.registers[33]  # HR 133 = Index 33
-        self.data["brauchwasser_override_wert"] = self.checkval(brauchwasser_override_wert, 0.1)
-
-        brauchwasser_override = modbusdata3.registers[34]  # HR 134 = Index 34
-        self.data["brauchwasser_override"] = bool(brauchwasser_override)
-
         # Phase 3: Solar & Durchfluss (IR 51-52)
         # IR 51: Solar KT1
-        solar_kt1 = modbusdata.registers[41]  # IR 51 = Index 41
+        solar_kt1 = ir[41]  # IR 51 = Index 41
         self.data["solar_kt1"] = self.checkval(solar_kt1, 0.1)
 
         # IR 52: Durchfluss primär
-        durchfluss_primaer = modbusdata.registers[42]  # IR 52 = Index 42
+        durchfluss_primaer = ir[42]  # IR 52 = Index 42
         self.data["durchfluss_primaer"] = self.checkval(durchfluss_primaer, 0.1)
 
-        # Phase 3: PV/SG Parameter (HR 117-123)
-        # HR 117-118: PV Energie (32-bit)
-        pv_energie_upper = modbusdata3.registers[17]  # HR 117 = Index 17
-        pv_energie_lower = modbusdata3.registers[18]  # HR 118 = Index 18
-        pv_energie = (pv_energie_upper << 16) | pv_energie_lower
-        self.data["pv_energie"] = pv_energie
-
-        # HR 122: Überhitzen bei PV/SG
-        ueberheizen_pv_sg = modbusdata3.registers[22]  # HR 122 = Index 22
-        self.data["ueberheizen_pv_sg"] = self.checkval(ueberheizen_pv_sg, 0.1)
-
-        # HR 123: Unterkühlen bei PV/SG
-        unterkuehlen_pv_sg = modbusdata3.registers[23]  # HR 123 = Index 23
-        self.data["unterkuehlen_pv_sg"] = self.checkval(unterkuehlen_pv_sg, 0.1)
-
-        # Phase 3: MKR1/MKR2 Heizkurven (HR 139-146)
-        # MKR1: HR 139-142
-        mkr1_heizgrenze = modbusdata3.registers[39]  # HR 139 = Index 39
-        self.data["mkr1_heizgrenze"] = self.checkval(mkr1_heizgrenze, 0.1)
-
-        mkr1_rlt_soll_ohg = modbusdata3.registers[40]  # HR 140 = Index 40
-        self.data["mkr1_rlt_soll_ohg"] = self.checkval(mkr1_rlt_soll_ohg, 0.1)
-
-        mkr1_rlt_soll_0 = modbusdata3.registers[41]  # HR 141 = Index 41
-        self.data["mkr1_rlt_soll_0"] = self.checkval(mkr1_rlt_soll_0, 0.1)
-
-        mkr1_rlt_soll_uhg = modbusdata3.registers[42]  # HR 142 = Index 42
-        self.data["mkr1_rlt_soll_uhg"] = self.checkval(mkr1_rlt_soll_uhg, 0.1)
-
-        # MKR2: HR 143-146
-        mkr2_heizgrenze = modbusdata3.registers[43]  # HR 143 = Index 43
-        self.data["mkr2_heizgrenze"] = self.checkval(mkr2_heizgrenze, 0.1)
-
-        mkr2_rlt_soll_ohg = modbusdata3.registers[44]  # HR 144 = Index 44
-        self.data["mkr2_rlt_soll_ohg"] = self.checkval(mkr2_rlt_soll_ohg, 0.1)
-
-        mkr2_rlt_soll_0 = modbusdata3.registers[45]  # HR 145 = Index 45
-        self.data["mkr2_rlt_soll_0"] = self.checkval(mkr2_rlt_soll_0, 0.1)
-
-        mkr2_rlt_soll_uhg = modbusdata3.registers[46]  # HR 146 = Index 46
-        self.data["mkr2_rlt_soll_uhg"] = self.checkval(mkr2_rlt_soll_uhg, 0.1)
+        # HR 100-146: Betriebsarten, Sollwerte, Overrides und Heizkurven
+        for register in HOLDING_REGISTERS.values():
+            if register.readable:
+                self.data[register.key] = register.decode(
+                    hr, register.address - HOLDING_REGISTER_BASE
+                )
 
-        return True
+        self.data["climate_ww_bereitung"]["temperature"] = self.checkval(
+            temp_brauchwasser, 0.1
+        )
@@ -1,24 +1,16 @@
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
-from homeassistant.components.binary_sensor import (
-    BinarySensorDeviceClass,
-    BinarySensorEntity,
-    BinarySensorEntityDescription,
-)
+from homeassistant.components.binary_sensor import BinarySensorEntity
 import logging
-from typing import Optional, Dict, Any
-
 
-import homeassistant.util.dt as dt_util
 
-from .const import (
-    ATTR_MANUFACTURER,
-    DOMAIN,
-    SENSOR_TYPES,
+from .const import DOMAIN
+from .descriptions.binary_sensor import (
     BINARYSENSOR_TYPES,
     HaHeliothermBinarySensorEntityDescription,
 )
 from .device_config import get_device_info
+from .entity import HaHeliothermModbusEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,73 +20,31 @@ async def async_setup_entry(hass, entry, async_add_entities):
     hub = hass.data[DOMAIN][hub_name]["hub"]
 
     entities = []
-    for sensor_description in BINARYSENSOR_TYPES.values():
-        device_info = get_device_info(
-            hub_name,
-            getattr(sensor_description, 'device', 'main')
-        )
+    for unit in hub.units:
+        for sensor_description in BINARYSENSOR_TYPES.values():
+            device_info = get_device_info(
+                unit.name,
+                getattr(sensor_description, 'device', 'main')
+            )
 
-        sensor = HaHeliothermModbusBinarySensor(
-            hub_name,
-            hub,
-            device_info,
-            sensor_description,
-        )
-        entities.append(sensor)
+            sensor = HaHeliothermModbusBinarySensor(
+                unit.name,
+                unit,
+                device_info,
+                sensor_description,
+            )
+            entities.append(sensor)
 
     async_add_entities(entities)
     return True
 
 
-class HaHeliothermModbusBinarySensor(BinarySensorEntity):
-    """Representation of an IamMeter Modbus sensor."""
-
-    def __init__(
-        self,
-        platform_name,
-        hub,
-        device_info,
-        description: HaHeliothermBinarySensorEntityDescription,
-    ):
-        """Initialize the sensor."""
-        self._platform_name = platform_name
-        self._attr_device_info = device_info
-        self._hub = hub
-        self.entity_description: HaHeliothermBinarySensorEntityDescription = description
-
-    async def async_added_to_hass(self):
-        """Register callbacks."""
-        self._hub.async_add_haheliotherm_modbus_sensor(self._modbus_data_updated)
+class HaHeliothermModbusBinarySensor(HaHeliothermModbusEntity, BinarySensorEntity):
+    """Representation of an Heliotherm Modbus binary sensor."""
 
-    async def async_will_remove_from_hass(self) -> None:
-        self._hub.async_remove_haheliotherm_modbus_sensor(self._modbus_data_updated)
+    entity_description: HaHeliothermBinarySensorEntityDescription
 
     @callback
-    def _modbus_data_updated(self):
-        self._update_state()
-        self.async_write_ha_state()
-
-    @callback
-    def _update_state(self):
-        if self.entity_description.key in self._hub.data:
-            self._attr_is_on = (
-                True if self._hub.data[self.entity_description.key] == "on" else False
-            )
-
-    @property
-    def name(self):
-        """Return the name."""
-        return f"{self._platform_name} {self.entity_description.name}"
-
-    @property
-    def unique_id(self) -> Optional[str]:
-        return f"{self._platform_name}_{self.entity_description.key}"
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return (
-            self._hub.data[self.entity_description.key]
-            if self.entity_description.key in self._hub.data
-            else None
-        )
+    def _update_from_hub(self, value) -> None:
+        if value is not None:
+            self._attr_is_on = value == "on"
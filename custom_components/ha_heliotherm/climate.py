@@ -7,21 +7,15 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 
-from custom_components.ha_heliotherm import HaHeliothermModbusHub
+from . import HaHeliothermModbusHub
 
 import logging
-from typing import Optional, Dict, Any
 
 
-import homeassistant.util.dt as dt_util
-
-from .const import (
-    ATTR_MANUFACTURER,
-    DOMAIN,
-    CLIMATE_TYPES,
-    HaHeliothermClimateEntityDescription,
-)
+from .const import DOMAIN
+from .descriptions.climate import CLIMATE_TYPES, HaHeliothermClimateEntityDescription
 from .device_config import get_device_info
+from .entity import HaHeliothermModbusEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,26 +25,29 @@ async def async_setup_entry(hass, entry, async_add_entities):
     hub = hass.data[DOMAIN][hub_name]["hub"]
 
     entities = []
-    for sensor_description in CLIMATE_TYPES.values():
-        device_info = get_device_info(
-            hub_name,
-            getattr(sensor_description, 'device', 'main')
-        )
-
-        sensor = HaHeliothermModbusClimate(
-            hub_name,
-            hub,
-            device_info,
-            sensor_description,
-        )
-        entities.append(sensor)
+    for unit in hub.units:
+        for sensor_description in CLIMATE_TYPES.values():
+            device_info = get_device_info(
+                unit.name,
+                getattr(sensor_description, 'device', 'main')
+            )
+
+            sensor = HaHeliothermModbusClimate(
+                unit.name,
+                unit,
+                device_info,
+                sensor_description,
+            )
+            entities.append(sensor)
 
     async_add_entities(entities)
     return True
 
 
-class HaHeliothermModbusClimate(ClimateEntity):
-    """Representation of an Heliotherm Modbus sensor."""
+class HaHeliothermModbusClimate(HaHeliothermModbusEntity, ClimateEntity):
+    """Representation of an Heliotherm Modbus climate entity."""
+
+    entity_description: HaHeliothermClimateEntityDescription
 
     def __init__(
         self,
@@ -59,73 +56,47 @@ class HaHeliothermModbusClimate(ClimateEntity):
         device_info,
         description: HaHeliothermClimateEntityDescription,
     ):
-        """Initialize the sensor."""
-        self._platform_name = platform_name
-        self._attr_device_info = device_info
-        self._hub = hub
-        self.entity_description: HaHeliothermClimateEntityDescription = description
+        """Initialize the climate entity."""
+        super().__init__(platform_name, hub, device_info, description)
         self._attr_hvac_modes = [HVACMode.AUTO]
         self._attr_hvac_mode = HVACMode.AUTO
         self._attr_temperature_unit = description.temperature_unit
         self._attr_min_temp = description.min_value
-        self._attr_max_temp = description.max_value        
+        self._attr_max_temp = description.max_value
         self._attr_target_temperature_low = description.min_value
         self._attr_target_temperature_high = description.max_value
         self._attr_target_temperature_step = description.step
         self._attr_supported_features = description.supported_features
 
-    async def async_added_to_hass(self):
-        """Register callbacks."""
-        self._hub.async_add_haheliotherm_modbus_sensor(self._modbus_data_updated)
-
-    async def async_will_remove_from_hass(self) -> None:
-        self._hub.async_remove_haheliotherm_modbus_sensor(self._modbus_data_updated)
+    def _hub_value(self):
+        """Return the hub value, for climate_rl_soll together with its override flag."""
+        # climate_rl_soll can only be edited when override switch is active
+        if self._key == "climate_rl_soll":
+            return (
+                self._hub.data.get(self._key),
+                self._hub.data.get("climate_rl_soll_ovr", False),
+            )
+        return (self._hub.data.get(self._key), True)
 
     @callback
-    def _modbus_data_updated(self):
-        if self.entity_description.key in self._hub.data:
-            args = self._hub.data[self.entity_description.key]
-            if "temperature" in args:
+    def _update_from_hub(self, value) -> None:
+        args, editable = value
+        if args:
+            if args.get("temperature") is not None:
                 self._attr_current_temperature = float(args["temperature"])
                 self._attr_target_temperature = float(args["temperature"])
-            if "target_temp_low" in args:
+            if args.get("target_temp_low") is not None:
                 self._attr_target_temperature_low = float(args["target_temp_low"])
-            if "target_temp_high" in args:
+            if args.get("target_temp_high") is not None:
                 self._attr_target_temperature_high = float(args["target_temp_high"])
 
-        self.async_write_ha_state()
-
-    @property
-    def name(self):
-        """Return the name."""
-        return f"{self._platform_name} {self.entity_description.name}"
-
-    @property
-    def unique_id(self) -> Optional[str]:
-        return f"{self._platform_name}_{self.entity_description.key}"
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return (
-            self._hub.data[self.entity_description.key]
-            if self.entity_description.key in self._hub.data
-            else None
+        # Remove TARGET_TEMPERATURE feature to make it read-only
+        self._attr_supported_features = (
+            self.entity_description.supported_features
+            if editable
+            else ClimateEntityFeature(0)
         )
 
-    @property
-    def supported_features(self) -> ClimateEntityFeature:
-        """Return the list of supported features."""
-        # climate_rl_soll can only be edited when override switch is active
-        if self.entity_description.key == "climate_rl_soll":
-            if self._hub.data.get("climate_rl_soll_ovr", False):
-                return self._attr_supported_features
-            else:
-                # Remove TARGET_TEMPERATURE feature to make it read-only
-                return ClimateEntityFeature(0)
-        # All other climate entities keep their default features
-        return self._attr_supported_features
-
     def set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
         if "temperature" in kwargs:
@@ -136,4 +107,5 @@ class HaHeliothermModbusClimate(ClimateEntity):
         if "target_temp_high" in kwargs:
             self._attr_target_temperature_high = float(kwargs["target_temp_high"])
 
+        self._invalidate_value()
         self.hass.add_job(self._hub.setter_function_callback(self, kwargs))
@@ -0,0 +1,318 @@
+"""Minimal Modbus TCP client for the function codes the hub uses.
+
+The hub only needs FC03/FC04 reads and FC06/FC16 writes. This client builds
+requests with struct into preallocated buffers, matches responses by
+transaction ID and receives register data directly into an array, from which
+``read_into`` copies it into the caller's register array. Per poll it
+allocates no PDU, framer or result objects. The pymodbus client remains the
+default; this one is selected with the ``native`` codec option.
+
+``read_pipelined`` sends several reads at once for gateways that accept more
+than one outstanding transaction, so a poll waits for one round trip instead
+of one per block.
+"""
+from __future__ import annotations
+
+from array import array
+import socket
+import struct
+import sys
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+# MBAP header and function code: transaction id, protocol id, length, unit, function
+_HEADER = struct.Struct(">HHHBB")
+# Read or single write request: MBAP header, function, address, count or value
+_READ_REQUEST = struct.Struct(">HHHBBHH")
+# Multiple write request without values: ..., address, count, byte count
+_WRITE_MULTIPLE_REQUEST = struct.Struct(">HHHBBHHB")
+
+READ_HOLDING_REGISTERS = 0x03
+READ_INPUT_REGISTERS = 0x04
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+
+_READ_FUNCTIONS = {
+    "read_holding_registers": READ_HOLDING_REGISTERS,
+    "read_input_registers": READ_INPUT_REGISTERS,
+}
+
+MAX_REGISTERS = 125
+# Modbus TCP ADUs are at most 260 bytes
+_MAX_FRAME = 260
+
+
+class CommParams:
+    """Timeout holder mirroring the attribute of the pymodbus clients."""
+
+    def __init__(self, timeout) -> None:
+        self.timeout_connect = timeout
+
+
+class ModbusResult:
+    """Result of a read or write, compatible with the pymodbus responses used."""
+
+    def __init__(self, registers=None, exception_code: int = 0) -> None:
+        self.registers = registers if registers is not None else []
+        self.exception_code = exception_code
+
+    def isError(self) -> bool:  # noqa: N802
+        """Return True for a Modbus exception response."""
+        return bool(self.exception_code)
+
+    def __repr__(self) -> str:
+        if self.exception_code:
+            return f"ExceptionResponse(exception_code={self.exception_code})"
+        return f"ModbusResult({self.registers})"
+
+
+class ModbusTcpCodecClient:
+    """Blocking Modbus TCP client with preallocated buffers."""
+
+    def __init__(self, host: str, port, timeout) -> None:
+        """Initialize the client."""
+        self.host = host
+        self.port = int(port)
+        self.comm_params = CommParams(timeout)
+        self._socket: socket.socket | None = None
+        self._transaction_id = 0
+        self._request = bytearray(_MAX_FRAME)
+        self._pipeline = bytearray()
+        self._header = bytearray(_HEADER.size + 1)
+        self._header_view = memoryview(self._header)
+        # Register data of a response, aligned for in-place byte swapping
+        self._registers = array("H", bytes(2 * MAX_REGISTERS))
+        self._registers_view = memoryview(self._registers)
+        self._registers_bytes = self._registers_view.cast("B")
+        self._swap = sys.byteorder == "little"
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the socket is open."""
+        return self._socket is not None
+
+    def connect(self) -> bool:
+        """Open the connection unless it is open already."""
+        if self._socket is not None:
+            return True
+        try:
+            self._socket = socket.create_connection(
+                (self.host, self.port), timeout=self.comm_params.timeout_connect
+            )
+        except OSError:
+            return False
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return True
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def read_into(
+        self, method: str, address: int, count: int, device_id: int, out
+    ) -> bool:
+        """Read count registers into the memoryview ``out`` (format H).
+
+        Returns False for a Modbus exception response, raises ModbusIOException
+        or ConnectionException if the device does not answer properly.
+        """
+        function = _READ_FUNCTIONS[method]
+        transaction_id = self._next_transaction_id()
+        _READ_REQUEST.pack_into(
+            self._request, 0, transaction_id, 0, 6, device_id, function, address, count
+        )
+        length = self._transact(transaction_id, _READ_REQUEST.size, function)
+        if not length:
+            return False
+        self._receive_registers(length, count, out)
+        return True
+
+    def read_pipelined(self, requests) -> list[bool]:
+        """Send several reads at once and receive their responses in any order.
+
+        ``requests`` holds (method, address, count, device_id, out) tuples.
+        Returns one flag per request, False for a Modbus exception response.
+        Raises ModbusIOException if a response matches no outstanding request
+        and ConnectionException if the device stops answering.
+        """
+        size = _READ_REQUEST.size * len(requests)
+        if len(self._pipeline) < size:
+            self._pipeline = bytearray(size)
+        first = (self._transaction_id + 1) & 0xFFFF
+        for index, (method, address, count, device_id, _) in enumerate(requests):
+            _READ_REQUEST.pack_into(
+                self._pipeline,
+                index * _READ_REQUEST.size,
+                self._next_transaction_id(),
+                0,
+                6,
+                device_id,
+                _READ_FUNCTIONS[method],
+                address,
+                count,
+            )
+        self._send(memoryview(self._pipeline)[:size])
+
+        results: list[bool | None] = [None] * len(requests)
+        for _ in requests:
+            response_id, length, response_function = self._receive_header()
+            index = (response_id - first) & 0xFFFF
+            if index >= len(requests) or results[index] is not None:
+                self.close()
+                raise ModbusIOException(f"Unexpected transaction ID {response_id}")
+            method, _, count, _, out = requests[index]
+            function = _READ_FUNCTIONS[method]
+            if response_function == function | 0x80:
+                results[index] = False
+                continue
+            if response_function != function:
+                self.close()
+                raise ModbusIOException(f"Unexpected function code {response_function}")
+            self._receive_registers(length, count, out)
+            results[index] = True
+        return results
+
+    def read_input_registers(self, address: int, count: int = 1, device_id: int = 1):
+        """Read input registers (FC04)."""
+        return self._read("read_input_registers", address, count, device_id)
+
+    def read_holding_registers(self, address: int, count: int = 1, device_id: int = 1):
+        """Read holding registers (FC03)."""
+        return self._read("read_holding_registers", address, count, device_id)
+
+    def write_register(self, address: int, value: int, device_id: int = 1):
+        """Write a single holding register (FC06)."""
+        transaction_id = self._next_transaction_id()
+        _READ_REQUEST.pack_into(
+            self._request,
+            0,
+            transaction_id,
+            0,
+            6,
+            device_id,
+            WRITE_SINGLE_REGISTER,
+            address,
+            value,
+        )
+        return self._write(transaction_id, _READ_REQUEST.size, WRITE_SINGLE_REGISTER)
+
+    def write_registers(self, address: int, values, device_id: int = 1):
+        """Write consecutive holding registers (FC16)."""
+        count = len(values)
+        transaction_id = self._next_transaction_id()
+        _WRITE_MULTIPLE_REQUEST.pack_into(
+            self._request,
+            0,
+            transaction_id,
+            0,
+            7 + 2 * count,
+            device_id,
+            WRITE_MULTIPLE_REGISTERS,
+            address,
+            count,
+            2 * count,
+        )
+        struct.pack_into(
+            f">{count}H", self._request, _WRITE_MULTIPLE_REQUEST.size, *values
+        )
+        return self._write(
+            transaction_id,
+            _WRITE_MULTIPLE_REQUEST.size + 2 * count,
+            WRITE_MULTIPLE_REGISTERS,
+        )
+
+    def _read(self, method: str, address: int, count: int, device_id: int):
+        registers = array("H", bytes(2 * count))
+        if not self.read_into(method, address, count, device_id, memoryview(registers)):
+            return ModbusResult(exception_code=self._header[_HEADER.size])
+        return ModbusResult(registers.tolist())
+
+    def _write(self, transaction_id: int, size: int, function: int):
+        if not self._transact(transaction_id, size, function):
+            return ModbusResult(exception_code=self._header[_HEADER.size])
+        # Echo of address and value or count
+        self._receive(self._registers_bytes[1:4])
+        return ModbusResult()
+
+    def _next_transaction_id(self) -> int:
+        self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+        return self._transaction_id
+
+    def _transact(self, transaction_id: int, size: int, function: int) -> int:
+        """Send the request and receive the response header.
+
+        Returns the MBAP length of the response, 0 for an exception response
+        (whose code is left in the header buffer). Responses to other
+        transactions, e.g. late answers to a request that timed out, are
+        skipped.
+        """
+        self._send(memoryview(self._request)[:size])
+        while True:
+            response_id, length, response_function = self._receive_header()
+            if response_id == transaction_id:
+                break
+            self._skip(length - 3)
+
+        if response_function == function | 0x80:
+            return 0
+        if response_function != function:
+            self.close()
+            raise ModbusIOException(f"Unexpected function code {response_function}")
+        return length
+
+    def _send(self, view: memoryview) -> None:
+        """Send requests, connecting first if necessary."""
+        if self._socket is None and not self.connect():
+            raise ConnectionException(f"Failed to connect to {self.host}:{self.port}")
+        try:
+            self._socket.settimeout(self.comm_params.timeout_connect)
+            self._socket.sendall(view)
+        except OSError as err:
+            self.close()
+            raise ConnectionException(f"{self.host}:{self.port}: {err}") from err
+
+    def _receive_header(self) -> tuple[int, int, int]:
+        """Receive the MBAP header, function code and the byte after it.
+
+        Returns transaction ID, MBAP length and function code. The byte after
+        the function code (byte count or exception code) stays in the header
+        buffer.
+        """
+        self._receive(self._header_view)
+        response_id, protocol_id, length, _, response_function = _HEADER.unpack_from(
+            self._header
+        )
+        if protocol_id != 0 or not 3 <= length <= _MAX_FRAME - 6:
+            self.close()
+            raise ModbusIOException("Invalid MBAP header")
+        return response_id, length, response_function
+
+    def _receive_registers(self, length: int, count: int, out) -> None:
+        """Receive the register data of a read response into ``out``."""
+        byte_count = self._header[_HEADER.size]
+        if byte_count != 2 * count or length != 3 + byte_count:
+            self.close()
+            raise ModbusIOException(f"Unexpected response length {byte_count}")
+        self._receive(self._registers_bytes[:byte_count])
+        if self._swap:
+            self._registers.byteswap()
+        out[:] = self._registers_view[:count]
+
+    def _receive(self, view: memoryview) -> None:
+        """Fill the view from the socket."""
+        received = 0
+        try:
+            while received < len(view):
+                size = self._socket.recv_into(view[received:])
+                if not size:
+                    raise ConnectionResetError("connection closed by peer")
+                received += size
+        except OSError as err:
+            self.close()
+            raise ConnectionException(f"{self.host}:{self.port}: {err}") from err
+
+    def _skip(self, size: int) -> None:
+        """Discard the rest of an unexpected response."""
+        self._receive(memoryview(self._request)[_MAX_FRAME - size :])
@@ -11,20 +11,58 @@ import homeassistant.helpers.config_validation as cv
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_NAME,
+    CONF_PORT,
+    CONF_SCAN_INTERVAL,
+    CONF_TIMEOUT,
+)
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN, DEFAULT_NAME, DEFAULT_PORT
+from .const import (
+    CONF_BAUDRATE,
+    CONF_CODEC,
+    CONF_DEVICE_IDS,
+    CONF_LOOP_THRESHOLD,
+    CONF_PIPELINE,
+    CONF_PROXY_HOST,
+    CONF_PROXY_PORT,
+    CONF_TRAFFIC_LOG,
+    CONF_TRANSPORT,
+    DOMAIN,
+    DEFAULT_BAUDRATE,
+    DEFAULT_DEVICE_ID,
+    DEFAULT_LOOP_THRESHOLD,
+    DEFAULT_NAME,
+    DEFAULT_PORT,
+    DEFAULT_PROXY_HOST,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT,
+)
+from .transport import (
+    BAUDRATES,
+    CODEC_PYMODBUS,
+    CODECS,
+    TRANSPORT_SERIAL,
+    TRANSPORT_TCP,
+    TRANSPORTS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_NAME, default=DEFAULT_NAME): cv.string,
+        vol.Required(CONF_TRANSPORT, default=TRANSPORT_TCP): vol.In(TRANSPORTS),
+        # Serial port (e.g. /dev/ttyUSB0) for the serial transport
         vol.Required(CONF_HOST): cv.string,
         vol.Required(CONF_PORT, default=DEFAULT_PORT): cv.string,
+        vol.Required(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(BAUDRATES),
+        vol.Required(CONF_DEVICE_IDS, default=str(DEFAULT_DEVICE_ID)): cv.string,
     }
 )
 
@@ -39,11 +77,26 @@ def host_valid(host):
         return all(x and not disallowed.search(x) for x in host.split("."))
 
 
+def parse_device_ids(value) -> list[int]:
+    """Parse comma separated Modbus device IDs, raise ValueError if invalid."""
+    device_ids = [int(item) for item in str(value).split(",") if item.strip()]
+    if (
+        not device_ids
+        or len(set(device_ids)) != len(device_ids)
+        or not all(1 <= device_id <= 247 for device_id in device_ids)
+    ):
+        raise ValueError(f"Invalid device IDs {value}")
+    return device_ids
+
+
 @callback
-def ha_heliotherm_modbus_entries(hass: HomeAssistant):
-    """Return the hosts already configured."""
+def ha_heliotherm_modbus_entries(hass: HomeAssistant, exclude_entry_id=None):
+    """Return the (host, port, device ID) units already configured."""
     return set(
-        entry.data[CONF_HOST] for entry in hass.config_entries.async_entries(DOMAIN)
+        (entry.data[CONF_HOST], str(entry.data[CONF_PORT]), device_id)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id != exclude_entry_id
+        for device_id in entry.data.get(CONF_DEVICE_IDS, [DEFAULT_DEVICE_ID])
     )
 
 
@@ -54,11 +107,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
-    def _host_in_configuration_exists(self, host) -> bool:
-        """Return True if host exists in configuration."""
-        if host in ha_heliotherm_modbus_entries(self.hass):
-            return True
-        return False
+    def _host_in_configuration_exists(self, host, port, device_ids) -> bool:
+        """Return True if one of the units of host:port exists in configuration."""
+        configured = ha_heliotherm_modbus_entries(self.hass)
+        return any(
+            (host, str(port), device_id) in configured for device_id in device_ids
+        )
 
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
@@ -67,16 +121,30 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             host = user_input[CONF_HOST]
 
-            if self._host_in_configuration_exists(host):
-                errors[CONF_HOST] = "already_configured"
-            elif not host_valid(user_input[CONF_HOST]):
-                errors[CONF_HOST] = "invalid host IP"
+            try:
+                device_ids = parse_device_ids(user_input[CONF_DEVICE_IDS])
+            except ValueError:
+                errors[CONF_DEVICE_IDS] = "invalid_device_ids"
             else:
-                await self.async_set_unique_id(user_input[CONF_HOST])
-                self._abort_if_unique_id_configured()
-                return self.async_create_entry(
-                    title=user_input[CONF_NAME], data=user_input
-                )
+                if self._host_in_configuration_exists(
+                    host, user_input[CONF_PORT], device_ids
+                ):
+                    errors[CONF_HOST] = "already_configured"
+                elif not (
+                    user_input[CONF_TRANSPORT] == TRANSPORT_SERIAL or host_valid(host)
+                ):
+                    errors[CONF_HOST] = "invalid host IP"
+                else:
+                    # Entries of the default device ID keep the host as unique ID
+                    unique_id = host
+                    if device_ids[0] != DEFAULT_DEVICE_ID:
+                        unique_id = f"{host}_{device_ids[0]}"
+                    await self.async_set_unique_id(unique_id)
+                    self._abort_if_unique_id_configured()
+                    return self.async_create_entry(
+                        title=user_input[CONF_NAME],
+                        data={**user_input, CONF_DEVICE_IDS: device_ids},
+                    )
 
         return self.async_show_form(
             step_id="user", data_schema=DATA_SCHEMA, errors=errors
@@ -100,25 +168,104 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors = {}
 
         if user_input is not None:
-            user_input[CONF_NAME] = self.config_entry.data[CONF_NAME]
-            self.hass.config_entries.async_update_entry(
-                self.config_entry, data=user_input, options=self.config_entry.options
-            )
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-            return self.async_create_entry(title="", data={})
+            try:
+                device_ids = parse_device_ids(user_input[CONF_DEVICE_IDS])
+            except ValueError:
+                errors[CONF_DEVICE_IDS] = "invalid_device_ids"
+            else:
+                configured = ha_heliotherm_modbus_entries(
+                    self.hass, self.config_entry.entry_id
+                )
+                if any(
+                    (user_input[CONF_HOST], str(user_input[CONF_PORT]), device_id)
+                    in configured
+                    for device_id in device_ids
+                ):
+                    errors[CONF_HOST] = "already_configured"
+
+            if not errors:
+                data = {
+                    **self.config_entry.data,
+                    CONF_TRANSPORT: user_input.pop(CONF_TRANSPORT),
+                    CONF_HOST: user_input.pop(CONF_HOST),
+                    CONF_PORT: user_input.pop(CONF_PORT),
+                    CONF_BAUDRATE: user_input.pop(CONF_BAUDRATE),
+                    CONF_CODEC: user_input.pop(CONF_CODEC),
+                    CONF_DEVICE_IDS: device_ids,
+                }
+                del user_input[CONF_DEVICE_IDS]
+                options = {**self.config_entry.options, **user_input}
+                # A single update lets the update listener decide between applying
+                # the options live and reloading for a new host, port or units
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry, data=data, options=options
+                )
+                return self.async_create_entry(title="", data=options)
+
+        options = self.config_entry.options
+        data = self.config_entry.data
 
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
                     vol.Required(
-                        CONF_HOST, default=self.config_entry.data[CONF_HOST]
+                        CONF_TRANSPORT,
+                        default=data.get(CONF_TRANSPORT, TRANSPORT_TCP),
+                    ): vol.In(TRANSPORTS),
+                    vol.Required(CONF_HOST, default=data[CONF_HOST]): cv.string,
+                    vol.Required(CONF_PORT, default=data[CONF_PORT]): cv.string,
+                    vol.Required(
+                        CONF_BAUDRATE,
+                        default=data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE),
+                    ): vol.In(BAUDRATES),
+                    vol.Required(
+                        CONF_CODEC,
+                        default=data.get(CONF_CODEC, CODEC_PYMODBUS),
+                    ): vol.In(CODECS),
+                    vol.Required(
+                        CONF_DEVICE_IDS,
+                        default=",".join(
+                            str(device_id)
+                            for device_id in data.get(
+                                CONF_DEVICE_IDS, [DEFAULT_DEVICE_ID]
+                            )
+                        ),
                     ): cv.string,
                     vol.Required(
-                        CONF_PORT, default=self.config_entry.data[CONF_PORT]
+                        CONF_SCAN_INTERVAL,
+                        default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Required(
+                        CONF_TIMEOUT,
+                        default=options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=30)),
+                    vol.Required(
+                        CONF_PIPELINE,
+                        default=options.get(CONF_PIPELINE, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_LOOP_THRESHOLD,
+                        default=options.get(
+                            CONF_LOOP_THRESHOLD, DEFAULT_LOOP_THRESHOLD
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                    vol.Required(
+                        CONF_TRAFFIC_LOG,
+                        default=options.get(CONF_TRAFFIC_LOG, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_PROXY_PORT,
+                        default=options.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
+                    vol.Optional(
+                        CONF_PROXY_HOST,
+                        default=options.get(CONF_PROXY_HOST, DEFAULT_PROXY_HOST),
                     ): cv.string,
                 }
             ),
+            errors=errors,
         )
@@ -0,0 +1,401 @@
+"""Modbus connections shared by all hubs that talk to the same gateway.
+
+RS232/RS485 gateways often accept a single TCP client only, and a serial
+port can only be opened once. Every (transport, host, port) therefore gets one
+ModbusConnection, reference counted by the hubs using it. Transactions of all
+hubs are serialized through one queue that serves the waiting hubs
+round-robin, so a hub with a long write plan cannot starve the polls of the
+others.
+"""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from itertools import repeat
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from pymodbus.exceptions import ModbusException
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .transport import TRANSPORT_SERIAL, TRANSPORT_TCP, FrameTiming, create_client
+
+if TYPE_CHECKING:
+    from .traffic_log import TrafficLog
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CONNECTIONS = f"{DOMAIN}_connections"
+
+# Failed pipelined polls in a row, with sequential reads working, before
+# pipelining is turned off; single failures may just be lost frames
+PIPELINE_FAILURES = 3
+
+# Bytes of a frame besides the PDU: MBAP header, or unit and CRC on RTU
+_TCP_FRAME_BYTES = 7
+_RTU_FRAME_BYTES = 3
+
+_READ_METHODS = ("read_input_registers", "read_holding_registers")
+
+# Function codes of the client methods, for the traffic log
+_FUNCTIONS = {
+    "read_holding_registers": 3,
+    "read_input_registers": 4,
+    "write_register": 6,
+    "write_registers": 16,
+}
+
+
+def _traffic(method: str, args, kwargs) -> tuple[int, int]:
+    """Return transactions and PDU bytes (request and response) of a call."""
+    if method == "read_into":
+        return 1, 7 + 2 * args[2]
+    if method in _READ_METHODS:
+        return 1, 7 + 2 * kwargs.get("count", 1)
+    if method == "write_register":
+        return 1, 10
+    if method == "write_registers":
+        return 1, 11 + 2 * len(args[1])
+    if method == "read_pipelined":
+        return len(args[0]), sum(7 + 2 * request[2] for request in args[0])
+    return 0, 0
+
+
+def _failed(result) -> bool:
+    """Return True for a pymodbus call that raised or got an error response."""
+    return result is None or result.isError()
+
+
+def _log_traffic(log: TrafficLog, method: str, args, kwargs, result) -> None:
+    """Append the transactions of a client call to the traffic log.
+
+    ``result`` is None if the call raised.
+    """
+    if method == "read_into":
+        read_method, address, count, device_id, out = args
+        log.record(
+            device_id,
+            _FUNCTIONS[read_method],
+            address,
+            count,
+            out if result else (),
+            not result,
+        )
+    elif method in _READ_METHODS:
+        error = _failed(result)
+        log.record(
+            kwargs["device_id"],
+            _FUNCTIONS[method],
+            args[0],
+            kwargs["count"],
+            () if error else result.registers,
+            error,
+        )
+    elif method in ("write_register", "write_registers"):
+        values = (args[1],) if method == "write_register" else args[1]
+        log.record(
+            kwargs["device_id"],
+            _FUNCTIONS[method],
+            args[0],
+            len(values),
+            values,
+            _failed(result),
+        )
+    elif method == "read_pipelined":
+        for (read_method, address, count, device_id, out), success in zip(
+            args[0], result or repeat(False)
+        ):
+            log.record(
+                device_id,
+                _FUNCTIONS[read_method],
+                address,
+                count,
+                out if success else (),
+                not success,
+            )
+
+
+@dataclass
+class TransactionStats:
+    """Transaction counters of one hub on a shared connection."""
+
+    transactions: int = 0
+    # Estimated from the request sizes, exception responses are shorter
+    bytes: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    busy_time: float = 0.0
+
+
+class ModbusConnection:
+    """A Modbus client with a fair transaction queue, used from executor threads."""
+
+    def __init__(self, transport, host, port, baudrate, timeout, codec) -> None:
+        """Initialize the connection."""
+        self.transport = transport
+        self.host = host
+        self.port = port
+        self.baudrate = baudrate
+        self.timing = FrameTiming.for_transport(transport, baudrate)
+        self._client = create_client(transport, host, port, baudrate, timeout, codec)
+        # Gateways keep the silent interval on their serial side themselves
+        self._frame_gap = (
+            self.timing.silent_interval if transport == TRANSPORT_SERIAL else 0.0
+        )
+        self._frame_bytes = (
+            _TCP_FRAME_BYTES if transport == TRANSPORT_TCP else _RTU_FRAME_BYTES
+        )
+        # Connections opened, by the first request or after a failure
+        self.connects = 0
+        self._last_frame = 0.0
+        self.pipelined = False
+        self._pipeline_failures = 0
+        self.traffic_log: TrafficLog | None = None
+        self._condition = threading.Condition()
+        self._busy = False
+        # Waiting transactions per hub, in round-robin order
+        self._waiting: dict[str, deque] = {}
+        self.users: set[str] = set()
+        self.stats: dict[str, TransactionStats] = {}
+        # Settings requested by the hubs using the connection, combined by
+        # _apply_settings so no hub overrides the others
+        self._timeouts: dict[str, float] = {}
+        self._pipelined: dict[str, bool] = {}
+        self._traffic_logs: dict[str, str | None] = {}
+
+    @property
+    def state(self) -> dict:
+        """Return the connection state, without the host."""
+        return {
+            "transport": self.transport,
+            "connected": self._client.connected,
+            "connects": self.connects,
+            "pipelined": self.pipelined,
+            "pipeline_failures": self._pipeline_failures,
+            "users": sorted(self.users),
+        }
+
+    def set_timeout(self, user: str, timeout) -> None:
+        """Set the response timeout of ``user``, the longest one is used."""
+        self._timeouts[user] = timeout
+        self._apply_settings()
+
+    def set_pipelined(self, user: str, pipelined: bool) -> None:
+        """Request pipelined reads for ``user``, used if any user requests them.
+
+        Only supported by the native codec.
+        """
+        self._pipelined[user] = pipelined
+        self._apply_settings()
+
+    def set_traffic_log(self, user: str, path: str | None) -> None:
+        """Request logging to the file at path for ``user``, None for no log.
+
+        The connection logs while any user requests it, all transactions go
+        to the file of the user that requested it first.
+        """
+        self._traffic_logs[user] = path
+        self._apply_settings()
+
+    def remove_settings(self, user: str) -> None:
+        """Drop the settings requested by ``user``."""
+        self._timeouts.pop(user, None)
+        self._pipelined.pop(user, None)
+        self._traffic_logs.pop(user, None)
+        self._apply_settings()
+
+    def _apply_settings(self) -> None:
+        """Combine the settings requested by the users."""
+        if self._timeouts:
+            self._client.comm_params.timeout_connect = max(self._timeouts.values())
+        self.pipelined = any(self._pipelined.values()) and hasattr(
+            self._client, "read_pipelined"
+        )
+        path = next((path for path in self._traffic_logs.values() if path), None)
+        self._open_traffic_log(path)
+
+    def _open_traffic_log(self, path: str | None) -> None:
+        """Log all transactions to the file at path, None stops logging."""
+        log = self.traffic_log
+        if log is not None and log.path == path:
+            return
+        if path:
+            # Imported on first use, gzip is only needed for logging
+            from .traffic_log import TrafficLog
+
+            self.traffic_log = TrafficLog(path)
+        else:
+            self.traffic_log = None
+        if log is not None:
+            log.close()
+
+    def connect(self, user: str) -> bool:
+        """Connect the client unless it is connected already."""
+        return self.execute(user, "connect")
+
+    def close(self) -> None:
+        """Disconnect the client and close the traffic log."""
+        with self._condition:
+            self._client.close()
+        self._open_traffic_log(None)
+
+    def execute(self, user: str, method: str, *args, **kwargs):
+        """Run one client call once it is the turn of ``user``."""
+        ticket = object()
+        queued = time.monotonic()
+        with self._condition:
+            self._waiting.setdefault(user, deque()).append(ticket)
+            while self._busy or self._next_ticket() is not ticket:
+                self._condition.wait()
+            self._busy = True
+            # Served hubs move to the end of the round-robin order
+            queue = self._waiting.pop(user)
+            queue.popleft()
+            if queue:
+                self._waiting[user] = queue
+
+        if self._frame_gap:
+            delay = self._last_frame + self._frame_gap - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        connected = self._client.connected
+        started = time.monotonic()
+        result = None
+        try:
+            result = getattr(self._client, method)(*args, **kwargs)
+            return result
+        finally:
+            finished = self._last_frame = time.monotonic()
+            if not connected and self._client.connected:
+                self.connects += 1
+            log = self.traffic_log
+            if log is not None:
+                self._log_traffic(log, method, args, kwargs, result)
+            transactions, pdu_bytes = _traffic(method, args, kwargs)
+            with self._condition:
+                self._busy = False
+                stats = self.stats.setdefault(user, TransactionStats())
+                stats.transactions += transactions
+                stats.bytes += pdu_bytes + 2 * self._frame_bytes * transactions
+                stats.wait_time += started - queued
+                stats.max_wait_time = max(stats.max_wait_time, started - queued)
+                stats.busy_time += finished - started
+                self._condition.notify_all()
+
+    def read_into(
+        self, user: str, method: str, address: int, count: int, device_id: int, out
+    ) -> bool:
+        """Read registers into the memoryview ``out``, False on an error response.
+
+        Clients with their own ``read_into`` (the native codec) decode directly
+        into ``out``, the registers of pymodbus responses are copied.
+        """
+        if hasattr(self._client, "read_into"):
+            return self.execute(
+                user, "read_into", method, address, count, device_id, out
+            )
+
+        result = self.execute(user, method, address, count=count, device_id=device_id)
+        if result.isError():
+            return False
+        if len(result.registers) != count:
+            raise ModbusException(
+                f"Expected {count} registers, got {len(result.registers)}"
+            )
+        out[:] = array("H", result.registers)
+        return True
+
+    def read_pipelined(self, user: str, requests) -> list[bool] | None:
+        """Read several blocks with all requests outstanding at once.
+
+        ``requests`` holds (method, address, count, device_id, out) tuples.
+        Returns one flag per request, or None if the transaction failed, be it
+        because the device is unreachable or the gateway cannot handle
+        several outstanding requests.
+        """
+        try:
+            results = self.execute(user, "read_pipelined", requests)
+        except ModbusException as err:
+            _LOGGER.debug("Pipelined reads from %s failed: %s", self.host, err)
+            return None
+        self._pipeline_failures = 0
+        return results
+
+    def pipeline_failed(self) -> None:
+        """Count a failed pipelined poll whose sequential retry worked."""
+        self._pipeline_failures += 1
+        if self._pipeline_failures >= PIPELINE_FAILURES:
+            self.pipelined = False
+            _LOGGER.warning(
+                "%s does not handle pipelined reads, reading sequentially",
+                self.host,
+            )
+
+    def _log_traffic(self, log: TrafficLog, method: str, args, kwargs, result):
+        """Log a client call, stop logging if the file cannot be written."""
+        try:
+            _log_traffic(log, method, args, kwargs, result)
+        except OSError as err:
+            _LOGGER.error("Could not write the traffic log %s: %s", log.path, err)
+            if self.traffic_log is log:
+                self.traffic_log = None
+            log.close()
+
+    def _next_ticket(self):
+        """Return the ticket to serve next."""
+        for queue in self._waiting.values():
+            return queue[0]
+        return None
+
+
+@callback
+def async_get_connection(
+    hass: HomeAssistant, user: str, transport, host, port, baudrate, timeout, codec
+) -> ModbusConnection:
+    """Return the connection to host:port, creating it for the first user."""
+    connections = hass.data.setdefault(DATA_CONNECTIONS, {})
+    key = (transport, host, port)
+    connection = connections.get(key)
+    if connection is None:
+        connection = connections[key] = ModbusConnection(
+            transport, host, port, baudrate, timeout, codec
+        )
+    elif connection.baudrate != baudrate and connection.timing.char_time:
+        _LOGGER.warning(
+            "%s uses %s baud for %s, already opened with %s baud",
+            user,
+            baudrate,
+            host,
+            connection.baudrate,
+        )
+    if connection.users:
+        _LOGGER.debug(
+            "%s shares the connection to %s:%s with %s",
+            user,
+            host,
+            port,
+            ", ".join(sorted(connection.users)),
+        )
+    connection.users.add(user)
+    return connection
+
+
+async def async_release_connection(
+    hass: HomeAssistant, user: str, connection: ModbusConnection
+) -> None:
+    """Release a connection, closing it once its last user is gone."""
+    connection.users.discard(user)
+    connection.stats.pop(user, None)
+    connection.remove_settings(user)
+    if connection.users:
+        return
+    hass.data[DATA_CONNECTIONS].pop(
+        (connection.transport, connection.host, connection.port), None
+    )
+    await hass.async_add_executor_job(connection.close)
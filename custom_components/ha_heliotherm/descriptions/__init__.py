@@ -0,0 +1 @@
+"""Entity descriptions of the HaHeliotherm platforms, one module per platform."""
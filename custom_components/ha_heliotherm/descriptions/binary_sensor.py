@@ -0,0 +1,62 @@
+"""Binary sensor entity descriptions for the HaHeliotherm integration."""
+
+from dataclasses import dataclass
+
+from homeassistant.components.binary_sensor import BinarySensorEntityDescription
+
+
+@dataclass
+class HaHeliothermBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """A class that describes HaHeliotherm Modbus binarysensor entities."""
+
+    device: str = "main"
+
+
+BINARYSENSOR_TYPES: dict[str, list[HaHeliothermBinarySensorEntityDescription]] = {
+    "on_off_heizkreispumpe": HaHeliothermBinarySensorEntityDescription(
+        name="Heizkreispumpe",
+        key="on_off_heizkreispumpe",
+        device="pumps",
+    ),
+    "on_off_pufferladepumpe": HaHeliothermBinarySensorEntityDescription(
+        name="Pufferladepumpe",
+        key="on_off_pufferladepumpe",
+        device="buffer",
+    ),
+    "on_off_verdichter": HaHeliothermBinarySensorEntityDescription(
+        name="Verdichter",
+        key="on_off_verdichter",
+        device="main",
+    ),
+    "on_off_stoerung": HaHeliothermBinarySensorEntityDescription(
+        name="Stoerung",
+        key="on_off_stoerung",
+        device="main",
+    ),
+    "on_off_evu_sperre": HaHeliothermBinarySensorEntityDescription(
+        name="EVU Sperre",
+        key="on_off_evu_sperre",
+        device="main",
+    ),
+    "on_off_eq_ventilator": HaHeliothermBinarySensorEntityDescription(
+        name="Energiequellen Ventilator",
+        key="on_off_eq_ventilator",
+        device="pumps",
+    ),
+    "ww_vorrang": HaHeliothermBinarySensorEntityDescription(
+        name="Warmwasser Vorrang",
+        key="ww_vorrang",
+        device="ww",
+    ),
+    "kuehlen_umv_passiv": HaHeliothermBinarySensorEntityDescription(
+        name="Kühlen UMV passiv",
+        key="kuehlen_umv_passiv",
+        device="main",
+    ),
+    # Phase 1: Neue Binary Sensoren
+    "on_off_eq_pumpe": HaHeliothermBinarySensorEntityDescription(
+        name="Energiequellen Pumpe",
+        key="on_off_eq_pumpe",
+        device="pumps",
+    ),
+}
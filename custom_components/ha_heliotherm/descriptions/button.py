@@ -0,0 +1,23 @@
+"""Button entity descriptions for the HaHeliotherm integration."""
+
+from dataclasses import dataclass
+
+from homeassistant.components.button import ButtonEntityDescription
+
+
+@dataclass
+class HaHeliothermButtonEntityDescription(ButtonEntityDescription):
+    """A class that describes HaHeliotherm Modbus button entities."""
+
+    device: str = "main"
+
+
+BUTTON_TYPES: dict[str, list[HaHeliothermButtonEntityDescription]] = {
+    # Phase 1: Entstörung Button
+    "button_entstoerung": HaHeliothermButtonEntityDescription(
+        name="Entstörung",
+        key="button_entstoerung",
+        icon="mdi:restart-alert",
+        device="main",
+    ),
+}
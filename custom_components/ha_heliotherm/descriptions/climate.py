@@ -0,0 +1,101 @@
+"""Climate entity descriptions for the HaHeliotherm integration."""
+
+from dataclasses import dataclass
+
+from homeassistant.components.climate import (
+    ClimateEntityDescription,
+    ClimateEntityFeature,
+)
+
+
+@dataclass
+class HaHeliothermClimateEntityDescription(ClimateEntityDescription):
+    """A class that describes HaHeliotherm Modbus climate entities."""
+
+    min_value: float = None
+    max_value: float = None
+    step: float = None
+    hvac_modes: list[str] = None
+    temperature_unit: str = "°C"
+    supported_features: ClimateEntityFeature = ClimateEntityFeature.TARGET_TEMPERATURE
+    device: str = "main"
+
+
+CLIMATE_TYPES: dict[str, list[HaHeliothermClimateEntityDescription]] = {
+    "climate_hkr_raum_soll": HaHeliothermClimateEntityDescription(
+        name="Raum Solltemperatur",
+        key="climate_hkr_raum_soll",
+        min_value=10,
+        max_value=25,
+        step=0.5,
+        temperature_unit="°C",
+    ),
+    "climate_rlt_kuehlen": HaHeliothermClimateEntityDescription(
+        name="Kühlen RLT Soll",
+        key="climate_rlt_kuehlen",
+        min_value=15,
+        max_value=25,
+        step=1,
+        temperature_unit="°C",
+    ),
+    "climate_ww_bereitung": HaHeliothermClimateEntityDescription(
+        name="Warmwasserbereitung",
+        key="climate_ww_bereitung",
+        min_value=5,
+        max_value=65,
+        step=0.5,
+        temperature_unit="°C",
+        supported_features=ClimateEntityFeature.TARGET_TEMPERATURE_RANGE,
+    ),
+
+#---------------------eingefügt-------------------------------------------------
+    "climate_rl_soll": HaHeliothermClimateEntityDescription(
+        name="Rücklaufsolltemperatur",
+        key="climate_rl_soll",
+        min_value=5,
+        max_value=65,
+        step=0.5,
+        temperature_unit="°C",
+        supported_features=ClimateEntityFeature.TARGET_TEMPERATURE
+        #----hier keine Range, sondern fester Wert-------
+    ),
+#---------------------eingefügt-------------------------------------------------
+    # Phase 2: MKR Climate Entities
+    "climate_mkr1_raum_soll": HaHeliothermClimateEntityDescription(
+        name="MKR1 Raum Solltemperatur",
+        key="climate_mkr1_raum_soll",
+        min_value=10,
+        max_value=25,
+        step=0.5,
+        temperature_unit="°C",
+        device="mkr1",
+    ),
+    "climate_mkr1_rlt_kuehlen": HaHeliothermClimateEntityDescription(
+        name="MKR1 Kühlen RLT",
+        key="climate_mkr1_rlt_kuehlen",
+        min_value=15,
+        max_value=25,
+        step=0.5,
+        temperature_unit="°C",
+        device="mkr1",
+    ),
+    "climate_mkr2_raum_soll": HaHeliothermClimateEntityDescription(
+        name="MKR2 Raum Solltemperatur",
+        key="climate_mkr2_raum_soll",
+        min_value=10,
+        max_value=25,
+        step=0.5,
+        temperature_unit="°C",
+        device="mkr2",
+    ),
+    "climate_mkr2_rlt_kuehlen": HaHeliothermClimateEntityDescription(
+        name="MKR2 Kühlen RLT",
+        key="climate_mkr2_rlt_kuehlen",
+        min_value=15,
+        max_value=25,
+        step=0.5,
+        temperature_unit="°C",
+        device="mkr2",
+    ),
+
+}
@@ -0,0 +1,244 @@
+"""Number entity descriptions for the HaHeliotherm integration."""
+
+from dataclasses import dataclass
+
+from homeassistant.components.number import (
+    NumberDeviceClass,
+    NumberEntityDescription,
+)
+from homeassistant.const import UnitOfTemperature
+
+
+@dataclass
+class HaHeliothermNumberEntityDescription(NumberEntityDescription):
+    """A class that describes HaHeliotherm Modbus number entities."""
+
+    mode: str = "slider"
+    initial: float = None
+    editable: bool = True
+    device: str = "main"
+
+
+NUMBER_TYPES: dict[str, list[HaHeliothermNumberEntityDescription]] = {
+    # Phase 1: HKR Heizkurven
+    "hkr_heizgrenze": HaHeliothermNumberEntityDescription(
+        name="HKR Heizgrenze",
+        key="hkr_heizgrenze",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=-10,
+        native_max_value=30,
+        native_step=0.5,
+        mode="slider",
+        device="hkr",
+    ),
+    "hkr_rlt_soll_ohg": HaHeliothermNumberEntityDescription(
+        name="HKR RLT Soll oHG",
+        key="hkr_rlt_soll_ohg",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=20,
+        native_max_value=65,
+        native_step=0.5,
+        mode="slider",
+        device="hkr",
+    ),
+    "hkr_rlt_soll_0": HaHeliothermNumberEntityDescription(
+        name="HKR RLT Soll 0°C",
+        key="hkr_rlt_soll_0",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=20,
+        native_max_value=65,
+        native_step=0.5,
+        mode="slider",
+        device="hkr",
+    ),
+    "hkr_rlt_soll_uhg": HaHeliothermNumberEntityDescription(
+        name="HKR RLT Soll uHG",
+        key="hkr_rlt_soll_uhg",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=20,
+        native_max_value=65,
+        native_step=0.5,
+        mode="slider",
+        device="hkr",
+    ),
+    # Phase 2: WW Minimaltemp
+    "ww_minimaltemp": HaHeliothermNumberEntityDescription(
+        name="WW Minimaltemp",
+        key="ww_minimaltemp",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=5,
+        native_max_value=65,
+        native_step=0.5,
+        mode="slider",
+        device="ww",
+    ),
+    # Phase 2: Override Values (entity_category=CONFIG)
+    "aussentemp_override_wert": HaHeliothermNumberEntityDescription(
+        name="Außentemp Override Wert",
+        key="aussentemp_override_wert",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=-30,
+        native_max_value=50,
+        native_step=0.5,
+        mode="box",
+        device="main",
+        #entity_category="config",
+    ),
+    "puffer_override_wert": HaHeliothermNumberEntityDescription(
+        name="Pufferspeicher Override Wert",
+        key="puffer_override_wert",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=5,
+        native_max_value=80,
+        native_step=0.5,
+        mode="box",
+        device="buffer",
+        #entity_category="config",
+    ),
+    "brauchwasser_override_wert": HaHeliothermNumberEntityDescription(
+        name="Brauchwasser Override Wert",
+        key="brauchwasser_override_wert",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=5,
+        native_max_value=80,
+        native_step=0.5,
+        mode="box",
+        device="ww",
+        #entity_category="config",
+    ),
+    # Phase 3: MKR1 Heizkurven
+    "mkr1_heizgrenze": HaHeliothermNumberEntityDescription(
+        name="MKR1 Heizgrenze",
+        key="mkr1_heizgrenze",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=-10,
+        native_max_value=30,
+        native_step=0.5,
+        mode="slider",
+        device="mkr1",
+    ),
+    "mkr1_rlt_soll_ohg": HaHeliothermNumberEntityDescription(
+        name="MKR1 RLT Soll oHG",
+        key="mkr1_rlt_soll_ohg",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=20,
+        native_max_value=65,
+        native_step=0.5,
+        mode="slider",
+        device="mkr1",
+    ),
+    "mkr1_rlt_soll_0": HaHeliothermNumberEntityDescription(
+        name="MKR1 RLT Soll 0°C",
+        key="mkr1_rlt_soll_0",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=20,
+        native_max_value=65,
+        native_step=0.5,
+        mode="slider",
+        device="mkr1",
+    ),
+    "mkr1_rlt_soll_uhg": HaHeliothermNumberEntityDescription(
+        name="MKR1 RLT Soll uHG",
+        key="mkr1_rlt_soll_uhg",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=20,
+        native_max_value=65,
+        native_step=0.5,
+        mode="slider",
+        device="mkr1",
+    ),
+    # Phase 3: MKR2 Heizkurven
+    "mkr2_heizgrenze": HaHeliothermNumberEntityDescription(
+        name="MKR2 Heizgrenze",
+        key="mkr2_heizgrenze",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=-10,
+        native_max_value=30,
+        native_step=0.5,
+        mode="slider",
+        device="mkr2",
+    ),
+    "mkr2_rlt_soll_ohg": HaHeliothermNumberEntityDescription(
+        name="MKR2 RLT Soll oHG",
+        key="mkr2_rlt_soll_ohg",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=20,
+        native_max_value=65,
+        native_step=0.5,
+        mode="slider",
+        device="mkr2",
+    ),
+    "mkr2_rlt_soll_0": HaHeliothermNumberEntityDescription(
+        name="MKR2 RLT Soll 0°C",
+        key="mkr2_rlt_soll_0",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=20,
+        native_max_value=65,
+        native_step=0.5,
+        mode="slider",
+        device="mkr2",
+    ),
+    "mkr2_rlt_soll_uhg": HaHeliothermNumberEntityDescription(
+        name="MKR2 RLT Soll uHG",
+        key="mkr2_rlt_soll_uhg",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=20,
+        native_max_value=65,
+        native_step=0.5,
+        mode="slider",
+        device="mkr2",
+    ),
+    # Phase 3: PV/SG Parameter (entity_category=CONFIG)
+    "pv_energie": HaHeliothermNumberEntityDescription(
+        name="PV Energie",
+        key="pv_energie",
+        native_unit_of_measurement="W",
+        device_class=NumberDeviceClass.POWER,
+        native_min_value=0,
+        native_max_value=10000,
+        native_step=100,
+        mode="box",
+        device="solar",
+        #entity_category="config",
+    ),
+    "ueberheizen_pv_sg": HaHeliothermNumberEntityDescription(
+        name="Überheizen bei PV/SG",
+        key="ueberheizen_pv_sg",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=0,
+        native_max_value=10,
+        native_step=0.5,
+        mode="slider",
+        device="solar",
+        #entity_category="config",
+    ),
+    "unterkuehlen_pv_sg": HaHeliothermNumberEntityDescription(
+        name="Unterkühlen bei PV/SG",
+        key="unterkuehlen_pv_sg",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_min_value=0,
+        native_max_value=10,
+        native_step=0.5,
+        mode="slider",
+        device="solar",
+        #entity_category="config",
+    ),
+}
@@ -0,0 +1,64 @@
+"""Select entity descriptions for the HaHeliotherm integration."""
+
+from dataclasses import dataclass
+
+from homeassistant.components.select import SelectEntityDescription
+
+
+@dataclass
+class HaHeliothermSelectEntityDescription(SelectEntityDescription):
+    """A class that describes HaHeliotherm Modbus select entities."""
+
+    select_options: list[str] = None
+    default_select_option: str = None
+    setter_function = None
+    device: str = "main"
+
+
+SELECT_TYPES: dict[str, list[HaHeliothermSelectEntityDescription]] = {
+    "select_betriebsart": HaHeliothermSelectEntityDescription(
+        name="Betriebsart",
+        key="select_betriebsart",
+        select_options=[
+            "Aus",
+            "Auto",
+            "Kühlen",
+            "Sommer",
+            "Dauerbetrieb",
+            "Absenken",
+            "Urlaub",
+            "Party",
+        ],
+        default_select_option="Auto",
+    ),
+    "select_mkr1_betriebsart": HaHeliothermSelectEntityDescription(
+        name="MKR 1 Betriebsart",
+        key="select_mkr1_betriebsart",
+        select_options=[
+            "Aus",
+            "Auto",
+            "Kühlen",
+            "Sommer",
+            "Dauerbetrieb",
+            "Absenken",
+            "Urlaub",
+            "Party",
+        ],
+        default_select_option="Auto",
+    ),
+    "select_mkr2_betriebsart": HaHeliothermSelectEntityDescription(
+        name="MKR 2 Betriebsart",
+        key="select_mkr2_betriebsart",
+        select_options=[
+            "Aus",
+            "Auto",
+            "Kühlen",
+            "Sommer",
+            "Dauerbetrieb",
+            "Absenken",
+            "Urlaub",
+            "Party",
+        ],
+        default_select_option="Auto",
+    ),
+}
@@ -0,0 +1,419 @@
+"""Sensor entity descriptions for the HaHeliotherm integration."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfPressure,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+
+
+@dataclass
+class HaHeliothermSensorEntityDescription(SensorEntityDescription):
+    """A class that describes HaHeliotherm Modbus sensor entities."""
+
+    device: str = "main"
+
+
+@dataclass
+class HaHeliothermDiagnosticSensorEntityDescription(
+    HaHeliothermSensorEntityDescription
+):
+    """Describes a diagnostic sensor computed from the metrics of a hub.
+
+    Diagnostic sensors are disabled until enabled in the entity settings.
+    ``update_interval`` also updates a value that changes without a poll.
+    """
+
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+    value_fn: Callable[[Any], Any] | None = None
+    attributes_fn: Callable[[Any], dict | None] | None = None
+    update_interval: timedelta | None = None
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def _rounded(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
+
+
+SENSOR_TYPES: dict[str, list[HaHeliothermSensorEntityDescription]] = {
+    "temp_aussen": HaHeliothermSensorEntityDescription(
+        name="Außentemperautr",
+        key="temp_aussen",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="main",
+    ),
+    "temp_brauchwasser": HaHeliothermSensorEntityDescription(
+        name="Brauchwasser Temperatur",
+        key="temp_brauchwasser",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="ww",
+    ),
+    "temp_vorlauf": HaHeliothermSensorEntityDescription(
+        name="Vorlauf Temperatur",
+        key="temp_vorlauf",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+    ),
+    "temp_ruecklauf": HaHeliothermSensorEntityDescription(
+        name="Rücklauf Temperatur",
+        key="temp_ruecklauf",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+    ),
+    "temp_pufferspeicher": HaHeliothermSensorEntityDescription(
+        name="Pufferspeicher Temperatur",
+        key="temp_pufferspeicher",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="buffer",
+    ),
+    "temp_eq_eintritt": HaHeliothermSensorEntityDescription(
+        name="Energiequellen Eintrittstemperatur",
+        key="temp_eq_eintritt",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+    ),
+    "temp_eq_austritt": HaHeliothermSensorEntityDescription(
+        name="Energiequellen Austrittstemperatur",
+        key="temp_eq_austritt",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+    ),
+    "temp_sauggas": HaHeliothermSensorEntityDescription(
+        name="Sauggas Temperatur",
+        key="temp_sauggas",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+    ),
+    "temp_verdampfung": HaHeliothermSensorEntityDescription(
+        name="Verdampfungs Temperatur",
+        key="temp_verdampfung",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+    ),
+    "temp_kodensation": HaHeliothermSensorEntityDescription(
+        name="Kondensations Temperatur",
+        key="temp_kodensation",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+    ),
+    "temp_heissgas": HaHeliothermSensorEntityDescription(
+        name="Heissgas Temperatur",
+        key="temp_heissgas",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+    ),
+    "bar_niederdruck": HaHeliothermSensorEntityDescription(
+        name="Niederdruck (bar)",
+        key="bar_niederdruck",
+        native_unit_of_measurement=UnitOfPressure.BAR,
+        device_class=SensorDeviceClass.PRESSURE,
+    ),
+    "bar_hochdruck": HaHeliothermSensorEntityDescription(
+        name="Hochdruck (bar)",
+        key="bar_hochdruck",
+        native_unit_of_measurement=UnitOfPressure.BAR,
+        device_class=SensorDeviceClass.PRESSURE,
+    ),
+    "vierwegeventil_luft": HaHeliothermSensorEntityDescription(
+        name="Vierwegeventil Luft",
+        key="vierwegeventil_luft",
+        device="main",
+    ),
+    "wmz_durchfluss": HaHeliothermSensorEntityDescription(
+        name="Wärmemengerzähler Durchfluss",
+        key="wmz_durchfluss",
+        native_unit_of_measurement="l/min",
+        device="counters",
+    ),
+    "n_soll_verdichter": HaHeliothermSensorEntityDescription(
+        name="Verdichter Drehzahl Soll",
+        key="n_soll_verdichter",
+        native_unit_of_measurement="‰",
+        device="main",
+    ),
+    "cop": HaHeliothermSensorEntityDescription(
+        name="COP",
+        key="cop",
+        native_unit_of_measurement="",
+        device="main",
+    ),
+    "temp_frischwasser": HaHeliothermSensorEntityDescription(
+        name="Frischwasser Temperatur",
+        key="temp_frischwasser",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="ww",
+    ),
+    "temp_aussen_verzoegert": HaHeliothermSensorEntityDescription(
+        name="Außentempeatur verzögert",
+        key="temp_aussen_verzoegert",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="main",
+    ),
+    "hkr_solltemperatur": HaHeliothermSensorEntityDescription(
+        name="Heizkreis Soll Temperatur",
+        key="hkr_solltemperatur",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="hkr",
+    ),
+    "mkr1_solltemperatur": HaHeliothermSensorEntityDescription(
+        name="Mischerkreis 1 Soll Temperatur",
+        key="mkr1_solltemperatur",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="mkr1",
+    ),
+    "mkr2_solltemperatur": HaHeliothermSensorEntityDescription(
+        name="Mischerkreis 2 Soll Temperatur",
+        key="mkr2_solltemperatur",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="mkr2",
+    ),
+    "expansionsventil": HaHeliothermSensorEntityDescription(
+        name="Expansionsventil",
+        key="expansionsventil",
+        native_unit_of_measurement="‰",
+        device="main",
+    ),
+    "verdichteranforderung": HaHeliothermSensorEntityDescription(
+        name="Anforderung",
+        key="verdichteranforderung",
+        device="main",
+    ),
+    "wmz_heizung": HaHeliothermSensorEntityDescription(
+        name="Wärmemengenzähler Heizung",
+        key="wmz_heizung",
+        native_unit_of_measurement="kWh",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    "stromz_heizung": HaHeliothermSensorEntityDescription(
+        name="Stromzähler Heizung",
+        key="stromz_heizung",
+        native_unit_of_measurement="kWh",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    "wmz_brauchwasser": HaHeliothermSensorEntityDescription(
+        name="Wärmemengenzähler Brauchwasser",
+        key="wmz_brauchwasser",
+        native_unit_of_measurement="kWh",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device="ww"
+    ),
+    "stromz_brauchwasser": HaHeliothermSensorEntityDescription(
+        name="Stromzähler Brauchwasser",
+        key="stromz_brauchwasser",
+        native_unit_of_measurement="kWh",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device="ww"
+    ),
+    "stromz_gesamt": HaHeliothermSensorEntityDescription(
+        name="Stromzähler Gesamt",
+        key="stromz_gesamt",
+        native_unit_of_measurement="kWh",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    "stromz_leistung": HaHeliothermSensorEntityDescription(
+        name="Stromzähler Leistung",
+        key="stromz_leistung",
+        native_unit_of_measurement="W",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "wmz_gesamt": HaHeliothermSensorEntityDescription(
+        name="Wärmemengenzähler Gesamt",
+        key="wmz_gesamt",
+        native_unit_of_measurement="kWh",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    "wmz_leistung": HaHeliothermSensorEntityDescription(
+        name="Wärmemengenzähler Leistung",
+        key="wmz_leistung",
+        native_unit_of_measurement="kW",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        device="counters",
+    ),
+    # Phase 1: Neue Sensoren
+    "bsz_verdichter_ww": HaHeliothermSensorEntityDescription(
+        name="Betriebsstundenzähler Verdichter Warmwasser",
+        key="bsz_verdichter_ww",
+        native_unit_of_measurement="h",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device="ww",
+    ),
+    "bsz_verdichter_hkr": HaHeliothermSensorEntityDescription(
+        name="Betriebsstundenzähler Verdichter",
+        key="bsz_verdichter_hkr",
+        native_unit_of_measurement="h",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device="counters",
+    ),
+    "temp_raum1": HaHeliothermSensorEntityDescription(
+        name="Raum 1 Temperatur",
+        key="temp_raum1",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="hkr",
+    ),
+    "mkr1_temp_vorlauf": HaHeliothermSensorEntityDescription(
+        name="Mischerkreis 1 Vorlauf",
+        key="mkr1_temp_vorlauf",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="mkr1",
+    ),
+    "mkr1_temp_ruecklauf": HaHeliothermSensorEntityDescription(
+        name="Mischerkreis 1 Rücklauf",
+        key="mkr1_temp_ruecklauf",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="mkr1",
+    ),
+    "mkr2_temp_vorlauf": HaHeliothermSensorEntityDescription(
+        name="Mischerkreis 2 Vorlauf",
+        key="mkr2_temp_vorlauf",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="mkr2",
+    ),
+    "mkr2_temp_ruecklauf": HaHeliothermSensorEntityDescription(
+        name="Mischerkreis 2 Rücklauf",
+        key="mkr2_temp_ruecklauf",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="mkr2",
+    ),
+    # Phase 3: Solar & Durchfluss
+    "solar_kt1": HaHeliothermSensorEntityDescription(
+        name="Solarkollektor Temperatur ",
+        key="solar_kt1",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        device="solar",
+    ),
+    "durchfluss_primaer": HaHeliothermSensorEntityDescription(
+        name="Durchfluss primär",
+        key="durchfluss_primaer",
+        native_unit_of_measurement="l/min",
+        device="counters",
+    ),
+}
+
+DIAGNOSTIC_SENSOR_TYPES: dict[str, HaHeliothermDiagnosticSensorEntityDescription] = {
+    "poll_duration": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Abfragedauer",
+        key="poll_duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda hub: _milliseconds(hub.metrics.last_poll_duration),
+    ),
+    "poll_duration_p50": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Abfragedauer p50",
+        key="poll_duration_p50",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        value_fn=lambda hub: _milliseconds(hub.metrics.poll_percentile(0.5)),
+    ),
+    "poll_duration_p95": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Abfragedauer p95",
+        key="poll_duration_p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        value_fn=lambda hub: _milliseconds(hub.metrics.poll_percentile(0.95)),
+    ),
+    "transactions_per_minute": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Modbus Transaktionen pro Minute",
+        key="transactions_per_minute",
+        native_unit_of_measurement="1/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda hub: _rounded(hub.metrics.transactions_per_minute()),
+    ),
+    "bytes_per_minute": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Modbus Bytes pro Minute",
+        key="bytes_per_minute",
+        native_unit_of_measurement="B/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda hub: _rounded(hub.metrics.bytes_per_minute()),
+    ),
+    "read_errors": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Lesefehler",
+        key="read_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda hub: sum(hub.metrics.read_errors.values()),
+        # Errors per block, e.g. {"IR 10": 2}
+        attributes_fn=lambda hub: dict(hub.metrics.read_errors),
+    ),
+    "write_errors": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Schreibfehler",
+        key="write_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda hub: hub.metrics.write_errors,
+    ),
+    "skipped_writes": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Übersprungene Schreibvorgänge",
+        key="skipped_writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda hub: hub.metrics.skipped_writes,
+    ),
+    "connects": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Verbindungsaufbauten",
+        key="connects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda hub: hub.connects,
+    ),
+    "loop_time": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Event-Loop Zeit pro Minute",
+        key="loop_time",
+        native_unit_of_measurement="ms/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda hub: _milliseconds(hub.metrics.loop_time_per_minute()),
+    ),
+    "slow_sections": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Event-Loop Blockaden",
+        key="slow_sections",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda hub: sum(hub.metrics.slow_sections.values()),
+        # Blockades per section, e.g. {"decode": 1}
+        attributes_fn=lambda hub: dict(hub.metrics.slow_sections),
+    ),
+    "data_age": HaHeliothermDiagnosticSensorEntityDescription(
+        name="Datenalter",
+        key="data_age",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda hub: _rounded(hub.data_age),
+        # Keeps rising while the heat pump does not answer
+        update_interval=timedelta(seconds=30),
+    ),
+}
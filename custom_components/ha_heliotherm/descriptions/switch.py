@@ -0,0 +1,44 @@
+"""Switch entity descriptions for the HaHeliotherm integration."""
+
+from dataclasses import dataclass
+
+from homeassistant.components.switch import SwitchEntityDescription
+
+
+@dataclass
+class HaHeliothermSwitchEntityDescription(SwitchEntityDescription):
+    """A class that describes HaHeliotherm Modbus switch entities."""
+
+    device: str = "main"
+
+
+SWITCH_TYPES: dict[str, list[HaHeliothermSwitchEntityDescription]] = {
+    "climate_rl_soll_ovr": HaHeliothermSwitchEntityDescription(
+        name="Rücklauf-Sollwert Override",
+        key="climate_rl_soll_ovr",
+        icon="mdi:toggle-switch",
+        device="hkr",
+    ),
+    # Phase 2: Override Flags (entity_category=CONFIG)
+    "aussentemp_override": HaHeliothermSwitchEntityDescription(
+        name="Außentemp Override",
+        key="aussentemp_override",
+        icon="mdi:thermometer-alert",
+        device="main",
+        #entity_category="config",
+    ),
+    "puffer_override": HaHeliothermSwitchEntityDescription(
+        name="Pufferspeicher Override",
+        key="puffer_override",
+        icon="mdi:water-thermometer",
+        device="buffer",
+        #entity_category="config",
+    ),
+    "brauchwasser_override": HaHeliothermSwitchEntityDescription(
+        name="Brauchwasser Override",
+        key="brauchwasser_override",
+        icon="mdi:water-boiler-alert",
+        device="ww",
+        #entity_category="config",
+    ),
+}
@@ -0,0 +1,83 @@
+"""Diagnostics support for the HaHeliotherm integration.
+
+Shows what the polls actually got from the heat pump: the raw registers of
+every unit next to the decoded values, the block timings of the last polls,
+the connection and poll scheduler state and the recent writes. All of it is
+read from the hub and its ring buffers when the diagnostics are downloaded.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PROXY_HOST, DOMAIN
+
+TO_REDACT = {CONF_HOST, CONF_PROXY_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    hub = hass.data[DOMAIN][entry.data[CONF_NAME]]["hub"]
+    poll_stats = hub.poll_stats
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "connection": {
+            **hub.connection_state,
+            "codec": hub.codec,
+            "read_blocks": [
+                {"method": method, "address": address, "count": count}
+                for method, address, count in hub.read_blocks
+            ],
+        },
+        "scheduler": asdict(poll_stats) if poll_stats else None,
+        "units": [_unit_diagnostics(unit) for unit in hub.units],
+    }
+
+
+def _unit_diagnostics(unit) -> dict[str, Any]:
+    """Return the registers, values, timings and writes of one unit."""
+    metrics = unit.metrics
+    stats = unit.connection_stats
+    return {
+        "device_id": unit.device_id,
+        "last_update": unit.last_update.isoformat() if unit.last_update else None,
+        "stale": unit.stale,
+        "registers": unit.raw_registers,
+        "data": dict(unit.data),
+        "transactions": asdict(stats) if stats else None,
+        "read_errors": dict(metrics.read_errors),
+        "write_errors": metrics.write_errors,
+        "skipped_writes": metrics.skipped_writes,
+        "polls": [
+            {
+                "time": timestamp.isoformat(),
+                "blocks": [
+                    {"block": block, "ms": round(duration * 1000, 2), "ok": ok}
+                    for block, duration, ok in blocks
+                ],
+            }
+            for timestamp, blocks in list(metrics.poll_traces)
+        ],
+        "writes": [
+            {
+                "time": timestamp.isoformat(),
+                "plan": [
+                    {"address": address, "values": list(values)}
+                    for address, values in plan
+                ],
+                "ms": round(duration * 1000, 2),
+                "error": error,
+            }
+            for timestamp, plan, duration, error in list(metrics.writes)
+        ],
+    }
@@ -0,0 +1,83 @@
+"""Base entities for the HaHeliotherm integration."""
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+
+# Marker for "no value seen yet", distinct from a missing (None) value
+_UNSET = object()
+
+
+class HaHeliothermEntity(Entity):
+    """Heliotherm entity with its identity computed once at construction."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        platform_name,
+        hub,
+        device_info,
+        description,
+    ):
+        """Initialize the entity."""
+        self._platform_name = platform_name
+        self._hub = hub
+        self.entity_description = description
+        self._attr_device_info = device_info
+        self._attr_name = f"{platform_name} {description.name}"
+        self._attr_unique_id = f"{platform_name}_{description.key}"
+
+
+class HaHeliothermModbusEntity(HaHeliothermEntity):
+    """Heliotherm entity that follows the data polled by the hub.
+
+    Subclasses set their ``_attr_*`` values in ``_update_from_hub``. The state
+    is only written when the hub value (or its stale flag) actually changed.
+    """
+
+    def __init__(
+        self,
+        platform_name,
+        hub,
+        device_info,
+        description,
+    ):
+        """Initialize the entity."""
+        super().__init__(platform_name, hub, device_info, description)
+        self._key = description.key
+        self._last_value = _UNSET
+
+    async def async_added_to_hass(self):
+        """Register callbacks."""
+        self._hub.async_add_haheliotherm_modbus_sensor(self._modbus_data_updated)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove callbacks."""
+        self._hub.async_remove_haheliotherm_modbus_sensor(self._modbus_data_updated)
+
+    @property
+    def extra_state_attributes(self):
+        """Flag values restored from the last snapshot as stale."""
+        return self._hub.stale_attributes
+
+    def _hub_value(self):
+        """Return the hub value this entity represents."""
+        return self._hub.data.get(self._key)
+
+    @callback
+    def _update_from_hub(self, value) -> None:
+        """Set the entity attributes from a changed hub value."""
+
+    @callback
+    def _invalidate_value(self) -> None:
+        """Force the next hub update to be written, e.g. after an optimistic change."""
+        self._last_value = _UNSET
+
+    @callback
+    def _modbus_data_updated(self):
+        value = (self._hub_value(), self._hub.stale)
+        if value == self._last_value:
+            return
+        self._last_value = value
+        self._update_from_hub(value[0])
+        self.async_write_ha_state()
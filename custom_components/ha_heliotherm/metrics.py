@@ -0,0 +1,170 @@
+"""Runtime metrics of a hub for its diagnostic sensors and diagnostics.
+
+Everything is taken from counters the poll and write paths update anyway and
+from a few small ring buffers, so recording costs a couple of appends per
+poll. Percentiles, rates and the diagnostics are only computed on demand.
+
+With a loop blocking threshold set, the synchronous sections of the hub
+(connect, reads, writes, decode, dispatch) are timed whenever they run on the
+event loop. Reads and writes belong in the executor, so they only show up if
+a change moved them onto the loop by mistake. Sections above the threshold
+are logged and counted, and the loop time of all sections is summed up.
+"""
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+import asyncio
+import logging
+import math
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Polls kept for the latency percentiles
+POLL_HISTORY = 100
+
+# Window of the transaction and byte rates in seconds
+RATE_WINDOW = 300
+
+# Polls with block timings and writes kept for the diagnostics
+POLL_TRACES = 20
+WRITE_HISTORY = 20
+
+_BLOCK_PREFIX = {"read_input_registers": "IR", "read_holding_registers": "HR"}
+
+
+def block_name(method: str, address: int) -> str:
+    """Return the name of a register or read block, e.g. IR 10."""
+    return f"{_BLOCK_PREFIX[method]} {address}"
+
+
+class HubMetrics:
+    """Poll, error and traffic counters of one hub."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize the metrics."""
+        self._name = name
+        self.last_poll_duration: float | None = None
+        self.poll_durations: deque[float] = deque(maxlen=POLL_HISTORY)
+        self.read_errors: dict[str, int] = {}
+        self.write_errors = 0
+        self.skipped_writes = 0
+        # (monotonic time, transactions, bytes) after each poll
+        self._traffic: deque[tuple[float, int, int]] = deque()
+        # (time, [(block, seconds, success)]) of the last polls
+        self.poll_traces: deque[tuple[datetime, list]] = deque(maxlen=POLL_TRACES)
+        # (time, plan, seconds, error) of the last writes
+        self.writes: deque[tuple[datetime, list, float, str | None]] = deque(
+            maxlen=WRITE_HISTORY
+        )
+        # Seconds, 0 turns the loop monitor off
+        self.loop_threshold = 0.0
+        self.slow_sections: dict[str, int] = {}
+        self._loop_started = 0.0
+        # (monotonic time, seconds) of the sections that ran on the loop
+        self._loop_time: deque[tuple[float, float]] = deque()
+
+    def record_poll(self, duration: float, stats) -> None:
+        """Record a poll and the transaction counters of the hub after it."""
+        self.last_poll_duration = duration
+        self.poll_durations.append(duration)
+        if stats is None:
+            return
+        now = time.monotonic()
+        self._traffic.append((now, stats.transactions, stats.bytes))
+        while len(self._traffic) > 2 and self._traffic[1][0] < now - RATE_WINDOW:
+            self._traffic.popleft()
+
+    def record_read_error(self, method: str, address: int) -> None:
+        """Count a failed read of a block."""
+        name = block_name(method, address)
+        self.read_errors[name] = self.read_errors.get(name, 0) + 1
+
+    def record_trace(self, timestamp: datetime, blocks: list) -> None:
+        """Record the block timings of a poll, called from the executor."""
+        self.poll_traces.append((timestamp, blocks))
+
+    def record_write(
+        self, timestamp: datetime, plan: list, duration: float, error: str | None
+    ) -> None:
+        """Record an executed write plan and its outcome."""
+        self.writes.append((timestamp, plan, duration, error))
+
+    def set_loop_threshold(self, threshold: float) -> None:
+        """Set the loop blocking threshold in seconds, 0 turns the monitor off."""
+        if threshold and not self.loop_threshold:
+            self._loop_started = time.monotonic()
+            self._loop_time.clear()
+        self.loop_threshold = threshold
+
+    @contextmanager
+    def section(self, name: str):
+        """Time a synchronous section if it runs on the event loop."""
+        if not self.loop_threshold or not _on_event_loop():
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            now = time.monotonic()
+            self._loop_time.append((now, duration))
+            self._trim_loop_time(now)
+            if duration > self.loop_threshold:
+                self.slow_sections[name] = self.slow_sections.get(name, 0) + 1
+                _LOGGER.warning(
+                    "%s blocked the event loop for %.1f ms in %s",
+                    self._name,
+                    duration * 1000,
+                    name,
+                )
+
+    def loop_time_per_minute(self) -> float | None:
+        """Return the seconds per minute the sections ran on the loop."""
+        if not self.loop_threshold:
+            return None
+        now = time.monotonic()
+        self._trim_loop_time(now)
+        elapsed = min(now - self._loop_started, RATE_WINDOW)
+        if elapsed <= 0:
+            return None
+        return sum(duration for _, duration in self._loop_time) * 60 / elapsed
+
+    def _trim_loop_time(self, now: float) -> None:
+        while self._loop_time and self._loop_time[0][0] < now - RATE_WINDOW:
+            self._loop_time.popleft()
+
+    def poll_percentile(self, fraction: float) -> float | None:
+        """Return a percentile of the recent poll durations (nearest rank)."""
+        if not self.poll_durations:
+            return None
+        durations = sorted(self.poll_durations)
+        return durations[max(0, math.ceil(fraction * len(durations)) - 1)]
+
+    def transactions_per_minute(self) -> float | None:
+        """Return the transactions per minute over the rate window."""
+        return self._rate(1)
+
+    def bytes_per_minute(self) -> float | None:
+        """Return the bytes per minute over the rate window."""
+        return self._rate(2)
+
+    def _rate(self, index: int) -> float | None:
+        if len(self._traffic) < 2:
+            return None
+        first, last = self._traffic[0], self._traffic[-1]
+        if last[0] <= first[0]:
+            return None
+        return (last[index] - first[index]) * 60 / (last[0] - first[0])
+
+
+def _on_event_loop() -> bool:
+    """Return True if called from the thread running the event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
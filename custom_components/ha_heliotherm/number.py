@@ -1,28 +1,13 @@
+from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
 from homeassistant.components.number import NumberEntity
-from homeassistant.components.input_number import (
-    InputNumber,
-    CONF_NAME,
-    CONF_MIN,
-    CONF_MAX,
-    CONF_INITIAL,
-    CONF_STEP,
-    CONF_UNIT_OF_MEASUREMENT,
-    CONF_MODE,
-)
 import logging
-from typing import Optional, Dict, Any
 
 
-import homeassistant.util.dt as dt_util
-
-from .const import (
-    ATTR_MANUFACTURER,
-    DOMAIN,
-    NUMBER_TYPES,
-    HaHeliothermNumberEntityDescription,
-)
+from .const import DOMAIN
+from .descriptions.number import NUMBER_TYPES, HaHeliothermNumberEntityDescription
 from .device_config import get_device_info
+from .entity import HaHeliothermModbusEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,27 +17,30 @@ async def async_setup_entry(hass, entry, async_add_entities):
     hub = hass.data[DOMAIN][hub_name]["hub"]
 
     entities = []
-    for sensor_description in NUMBER_TYPES.values():
-        device_info = get_device_info(
-            hub_name,
-            getattr(sensor_description, 'device', 'main')
-        )
-
-        sensor = HaHeliothermModbusNumber(
-            hub_name,
-            hub,
-            device_info,
-            sensor_description,
-        )
-        entities.append(sensor)
+    for unit in hub.units:
+        for sensor_description in NUMBER_TYPES.values():
+            device_info = get_device_info(
+                unit.name,
+                getattr(sensor_description, 'device', 'main')
+            )
+
+            sensor = HaHeliothermModbusNumber(
+                unit.name,
+                unit,
+                device_info,
+                sensor_description,
+            )
+            entities.append(sensor)
 
     async_add_entities(entities)
     return True
 
 
-class HaHeliothermModbusNumber(NumberEntity):
+class HaHeliothermModbusNumber(HaHeliothermModbusEntity, NumberEntity):
     """Representation of an Heliotherm Modbus number."""
 
+    entity_description: HaHeliothermNumberEntityDescription
+
     def __init__(
         self,
         platform_name,
@@ -60,53 +48,21 @@ class HaHeliothermModbusNumber(NumberEntity):
         device_info,
         description: HaHeliothermNumberEntityDescription,
     ):
-        """Initialize the sensor."""
-        self._platform_name = platform_name
-        self._attr_device_info = device_info
-        self._hub = hub
-        self.entity_description: HaHeliothermNumberEntityDescription = description
+        """Initialize the number."""
+        super().__init__(platform_name, hub, device_info, description)
         self._attr_mode = description.mode
 
-        # Set entity category if specified
-        if hasattr(description, 'entity_category') and description.entity_category:
-            self._attr_entity_category = description.entity_category
-
         # Set min/max/step if specified
-        if hasattr(description, 'native_min_value') and description.native_min_value is not None:
+        if description.native_min_value is not None:
             self._attr_native_min_value = description.native_min_value
-        if hasattr(description, 'native_max_value') and description.native_max_value is not None:
+        if description.native_max_value is not None:
             self._attr_native_max_value = description.native_max_value
-        if hasattr(description, 'native_step') and description.native_step is not None:
+        if description.native_step is not None:
             self._attr_native_step = description.native_step
 
-    async def async_added_to_hass(self):
-        """Register callbacks."""
-        self._hub.async_add_haheliotherm_modbus_sensor(self._modbus_data_updated)
-
-    async def async_will_remove_from_hass(self) -> None:
-        self._hub.async_remove_haheliotherm_modbus_sensor(self._modbus_data_updated)
-
     @callback
-    def _modbus_data_updated(self):
-        self.async_write_ha_state()
-
-    @property
-    def name(self):
-        """Return the name."""
-        return f"{self._platform_name} {self.entity_description.name}"
-
-    @property
-    def unique_id(self) -> Optional[str]:
-        return f"{self._platform_name}_{self.entity_description.key}"
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return (
-            self._hub.data[self.entity_description.key]
-            if self.entity_description.key in self._hub.data
-            else None
-        )
+    def _update_from_hub(self, value) -> None:
+        self._attr_native_value = value
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
@@ -0,0 +1,147 @@
+"""Profiling of the refresh cycles of a hub, started by the profile service.
+
+Every synchronous part of a refresh gets a profile of its own: the reads in
+the executor, the decoding and the entity updates on the event loop. The
+profiles are merged when the results are written. Up to Python 3.11 cProfile
+only sees the thread it is enabled in, so other tasks, which the loop runs
+while a refresh waits for the executor, stay out of the profile. Since Python
+3.12 cProfile uses sys.monitoring, which is interpreter-wide: a profile sees
+all threads while it is enabled, e.g. the event loop during a read, and only
+one profiler can be active at a time. Profiling therefore refuses to start
+while another profiler is active, and since 3.12 while another heat pump is
+profiled.
+
+tracemalloc traces the allocations of all threads while profiling. It reports
+the peak memory of every cycle and the allocations still alive at the end.
+"""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from contextlib import contextmanager
+import io
+import pstats
+import sys
+import tracemalloc
+
+# Functions and allocation sites listed in the report
+REPORT_TOP = 40
+
+# Frames stored per allocation by tracemalloc
+TRACEBACK_FRAMES = 1
+
+# Profilers between start and stop
+_RUNNING: set[RefreshProfiler] = set()
+
+
+def profiler_active() -> bool:
+    """Return whether another profiler would conflict with a new one.
+
+    Call from the event loop, before Python 3.12 only the profiler of the
+    calling thread can conflict.
+    """
+    if sys.version_info < (3, 12):
+        return sys.getprofile() is not None
+    return bool(_RUNNING) or sys.monitoring.get_tool(
+        sys.monitoring.PROFILER_ID
+    ) is not None
+
+
+class RefreshProfiler:
+    """Collects cProfile and tracemalloc data of the next refresh cycles."""
+
+    def __init__(self, cycles: int) -> None:
+        """Initialize the profiler."""
+        self.cycles = cycles
+        self.completed = 0
+        self.done = asyncio.Event()
+        self._profiles: list[cProfile.Profile] = []
+        # Peak memory allocated during every cycle in bytes
+        self._peaks: list[int] = []
+        self._cycle_memory = 0
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Start tracing allocations unless somebody else does already."""
+        _RUNNING.add(self)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEBACK_FRAMES)
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        """Stop tracing allocations if this profiler started it."""
+        _RUNNING.discard(self)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def capture(self):
+        """Profile a synchronous section with a profile of its own."""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Since Python 3.12 only one profiler can be active at a time, a
+            # section goes unprofiled if another profiler was started since
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._profiles.append(profile)
+
+    def run(self, function, *args):
+        """Run a function under a profile, for executor jobs."""
+        with self.capture():
+            return function(*args)
+
+    def cycle_started(self) -> None:
+        """Mark the start of a refresh cycle."""
+        if tracemalloc.is_tracing():
+            self._cycle_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+    def cycle_done(self) -> None:
+        """Mark the end of a refresh cycle."""
+        if tracemalloc.is_tracing():
+            self._peaks.append(tracemalloc.get_traced_memory()[1] - self._cycle_memory)
+        self.completed += 1
+        if self.completed >= self.cycles:
+            self.done.set()
+
+    def write(self, path: str, name: str) -> dict:
+        """Write the profile and a text report, return their paths.
+
+        Blocking, run in the executor. ``path`` is the common file name
+        without extension.
+        """
+        snapshot = None
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),)
+            )
+
+        report = io.StringIO()
+        report.write(f"Profile of {name}, {self.completed} refresh cycles\n\n")
+        if self._profiles:
+            stats = pstats.Stats(*self._profiles, stream=report)
+            stats.dump_stats(f"{path}.pstats")
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(REPORT_TOP)
+        if self._peaks:
+            report.write(
+                f"Peak memory per cycle: max {max(self._peaks)} B, "
+                f"mean {sum(self._peaks) // len(self._peaks)} B\n\n"
+            )
+        if snapshot is not None:
+            report.write("Allocations alive at the end, by line:\n")
+            for statistic in snapshot.statistics("lineno")[:REPORT_TOP]:
+                report.write(f"{statistic}\n")
+
+        with open(f"{path}.txt", "w", encoding="utf-8") as file:
+            file.write(report.getvalue())
+        files = {"report": f"{path}.txt"}
+        if self._profiles:
+            files["profile"] = f"{path}.pstats"
+        return files
@@ -0,0 +1,194 @@
+"""Local Modbus TCP server answering from the hub's register cache.
+
+Other Modbus clients (a second Home Assistant, Loxone, logging scripts) can
+poll this server instead of the gateway, so the heat pump only ever sees the
+hub as client. Reads (FC03/FC04) are answered from the registers of the last
+poll; writes (FC06/FC16) are forwarded through the hub's serialized write path
+and are limited to the holding registers of the register table and the ranges
+and options of their values. As for the entities, the return temperature
+setpoint (HR 102) is only written while its override (HR 103) is on or set
+along with it. The unit ID of a request selects the unit if the hub polls
+several device IDs.
+
+The server listens on 127.0.0.1 unless another address is configured. It has
+no authentication, anybody who can reach it can write the heat pump.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+
+from homeassistant.exceptions import HomeAssistantError
+
+from .registers import HOLDING_REGISTERS, check_raw_write
+
+_LOGGER = logging.getLogger(__name__)
+
+# MBAP header: transaction id, protocol id, length, unit id
+_MBAP = struct.Struct(">HHHB")
+
+READ_HOLDING_REGISTERS = 0x03
+READ_INPUT_REGISTERS = 0x04
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+
+ILLEGAL_FUNCTION = 0x01
+ILLEGAL_DATA_ADDRESS = 0x02
+ILLEGAL_DATA_VALUE = 0x03
+SERVER_DEVICE_FAILURE = 0x04
+GATEWAY_TARGET_FAILED = 0x0B
+
+MAX_READ_REGISTERS = 125
+MAX_WRITE_REGISTERS = 123
+
+WRITABLE_ADDRESSES = frozenset(
+    address
+    for register in HOLDING_REGISTERS.values()
+    for address in range(register.address, register.address + register.width)
+)
+
+
+class ModbusProxy:
+    """Modbus TCP server backed by a HaHeliothermModbusHub."""
+
+    def __init__(self, hub, port: int, host: str = "127.0.0.1") -> None:
+        """Initialize the proxy."""
+        self._hub = hub
+        self.port = port
+        self.host = host
+        self._server: asyncio.Server | None = None
+        self._clients: dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    async def async_start(self) -> None:
+        """Start listening, raise OSError if the port is not available."""
+        self._server = await asyncio.start_server(
+            self._handle_client, host=self.host, port=self.port
+        )
+        _LOGGER.info(
+            "Modbus proxy of %s listening on %s:%s",
+            self._hub.name,
+            self.host,
+            self.port,
+        )
+
+    async def async_stop(self) -> None:
+        """Stop listening and disconnect all clients."""
+        if self._server is None:
+            return
+        self._server.close()
+        # Closing the transports ends the client handlers with an EOF
+        for writer in self._clients:
+            writer.close()
+        await asyncio.gather(*self._clients.values())
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of one client until it disconnects."""
+        peer = writer.get_extra_info("peername")
+        _LOGGER.debug("Modbus proxy client %s connected", peer)
+        self._clients[writer] = asyncio.current_task()
+        try:
+            while True:
+                header = await reader.readexactly(_MBAP.size)
+                transaction_id, protocol_id, length, unit_id = _MBAP.unpack(header)
+                if protocol_id != 0 or not 2 <= length <= 254:
+                    _LOGGER.debug("Invalid MBAP header from %s", peer)
+                    break
+                pdu = await reader.readexactly(length - 1)
+                response = await self._async_handle_pdu(unit_id, pdu)
+                writer.write(
+                    _MBAP.pack(transaction_id, 0, len(response) + 1, unit_id)
+                    + response
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+            _LOGGER.debug("Modbus proxy client %s disconnected", peer)
+
+    async def _async_handle_pdu(self, unit_id: int, pdu: bytes) -> bytes:
+        """Return the response PDU to a request PDU."""
+        function = pdu[0]
+        try:
+            unit = self._unit(unit_id)
+            if function in (READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS):
+                return self._read(unit, function, pdu)
+            if function == WRITE_SINGLE_REGISTER:
+                address, value = struct.unpack_from(">HH", pdu, 1)
+                await self._async_write(unit, address, [value])
+                return pdu[:5]
+            if function == WRITE_MULTIPLE_REGISTERS:
+                address, count, byte_count = struct.unpack_from(">HHB", pdu, 1)
+                if (
+                    not 1 <= count <= MAX_WRITE_REGISTERS
+                    or byte_count != 2 * count
+                    or len(pdu) != 6 + byte_count
+                ):
+                    raise _ModbusError(ILLEGAL_DATA_VALUE)
+                values = list(struct.unpack_from(f">{count}H", pdu, 6))
+                await self._async_write(unit, address, values)
+                return pdu[:5]
+            raise _ModbusError(ILLEGAL_FUNCTION)
+        except struct.error:
+            return bytes((function | 0x80, ILLEGAL_DATA_VALUE))
+        except _ModbusError as err:
+            return bytes((function | 0x80, err.code))
+
+    def _unit(self, unit_id: int):
+        """Return the unit a request addresses."""
+        unit = self._hub.unit(unit_id)
+        if unit is None:
+            # With a single unit any unit ID is answered, clients often send 0 or 255
+            if len(self._hub.units) > 1:
+                raise _ModbusError(GATEWAY_TARGET_FAILED)
+            unit = self._hub
+        return unit
+
+    def _read(self, unit, function: int, pdu: bytes) -> bytes:
+        """Return the response to a read request served from the cache."""
+        address, count = struct.unpack_from(">HH", pdu, 1)
+        if not 1 <= count <= MAX_READ_REGISTERS:
+            raise _ModbusError(ILLEGAL_DATA_VALUE)
+        if unit.last_update is None:
+            raise _ModbusError(GATEWAY_TARGET_FAILED)
+
+        registers = unit.cached_registers(
+            function == READ_INPUT_REGISTERS, address, count
+        )
+        if registers is None:
+            raise _ModbusError(ILLEGAL_DATA_ADDRESS)
+        return struct.pack(f">BB{count}H", function, 2 * count, *registers)
+
+    async def _async_write(self, unit, address: int, values: list[int]) -> None:
+        """Forward a write of holding registers to the device."""
+        if not WRITABLE_ADDRESSES.issuperset(range(address, address + len(values))):
+            raise _ModbusError(ILLEGAL_DATA_ADDRESS)
+        try:
+            check_raw_write(address, values)
+        except ValueError as err:
+            _LOGGER.debug("Rejected proxied write of HR %s: %s", address, err)
+            raise _ModbusError(ILLEGAL_DATA_VALUE) from err
+        try:
+            await unit.async_check_raw_write(address, values)
+        except HomeAssistantError as err:
+            _LOGGER.debug("Rejected proxied write of HR %s: %s", address, err)
+            raise _ModbusError(ILLEGAL_DATA_VALUE) from err
+        try:
+            await unit.async_write_registers(address, values)
+        except HomeAssistantError as err:
+            _LOGGER.warning("Proxied write of HR %s failed: %s", address, err)
+            raise _ModbusError(SERVER_DEVICE_FAILURE) from err
+
+
+class _ModbusError(Exception):
+    """A request answered with a Modbus exception response."""
+
+    def __init__(self, code: int) -> None:
+        super().__init__(code)
+        self.code = code
@@ -0,0 +1,329 @@
+"""Holding register map of the Heliotherm heat pump.
+
+Each writable value is described once: address, scale, width and valid range.
+The hub uses this table to decode the holding registers, to encode writes and
+to validate values before anything is sent to the device.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+BETRIEBSART_OPTIONS = (
+    "Aus",
+    "Auto",
+    "Kühlen",
+    "Sommer",
+    "Dauerbetrieb",
+    "Absenken",
+    "Urlaub",
+    "Party",
+)
+
+# Decoded value of a register that reports a missing sensor or circuit
+MISSING_VALUE = -50.0
+
+# Address of the first holding register the hub reads
+HOLDING_REGISTER_BASE = 100
+
+# Maximum number of registers in one FC16 (write multiple registers) request
+MAX_WRITE_REGISTERS = 123
+
+
+def to_signed(number: int, bitlength: int = 16) -> int:
+    """Interpret a raw register value as two's complement."""
+    mask = (2**bitlength) - 1
+    if number & (1 << (bitlength - 1)):
+        return number | ~mask
+    return number & mask
+
+
+@dataclass(frozen=True)
+class HoldingRegister:
+    """A writable holding register, or a run of consecutive ones.
+
+    ``fields`` names the keys of a dict value (e.g. climate attributes) that
+    map to consecutive registers starting at ``address``. Without ``fields``
+    a ``width`` of 2 is a 32-bit value, high word first.
+    """
+
+    key: str
+    address: int
+    scale: float = 0.1
+    width: int = 1
+    min_value: float | None = None
+    max_value: float | None = None
+    options: tuple[str, ...] | None = None
+    fields: tuple[str, ...] | None = None
+    flag: bool = False
+    readable: bool = True
+
+    def encode(self, value) -> list[int]:
+        """Return the raw register values to write, raise ValueError if invalid."""
+        if self.fields:
+            if len(self.fields) == 1 and not isinstance(value, dict):
+                value = {self.fields[0]: value}
+            if not isinstance(value, dict):
+                raise ValueError(f"{self.key} expects {', '.join(self.fields)}")
+            values = [value.get(field) for field in self.fields]
+        else:
+            values = [value]
+
+        raw = []
+        for item in values:
+            if item is None:
+                raise ValueError(f"Missing value for {self.key}")
+            if self.options is not None:
+                if item not in self.options:
+                    raise ValueError(f"Invalid option {item!r} for {self.key}")
+                raw.append(self.options.index(item))
+                continue
+
+            # Service data is not type checked, e.g. a dict for a number
+            if not isinstance(item, (int, float, str)):
+                raise ValueError(f"Invalid value {item!r} for {self.key}")
+            try:
+                item = float(item)
+            except ValueError:
+                raise ValueError(f"Invalid value {item!r} for {self.key}") from None
+            if math.isnan(item):
+                raise ValueError(f"Invalid value {item!r} for {self.key}")
+            if (self.min_value is not None and item < self.min_value) or (
+                self.max_value is not None and item > self.max_value
+            ):
+                raise self._range_error(item)
+            number = round(item / self.scale)
+            if self.width == 2 and not self.fields:
+                raw += [(number >> 16) & 0xFFFF, number & 0xFFFF]
+            else:
+                raw.append(number & 0xFFFF)
+        return raw
+
+    def check_raw(self, raw: list[int | None]) -> None:
+        """Check raw values as a Modbus client writes them, raise ValueError.
+
+        ``raw`` holds one value per register of this one, None for registers
+        the write does not touch. A 32-bit value has to be written whole.
+        """
+        if self.width == 2 and not self.fields:
+            if None in raw:
+                raise ValueError(f"{self.key} has to be written as a whole")
+            numbers = [(raw[0] << 16) | raw[1]]
+        else:
+            numbers = [to_signed(item) for item in raw if item is not None]
+
+        for number in numbers:
+            if self.options is not None:
+                if number & 0xFFFF >= len(self.options):
+                    raise ValueError(
+                        f"Invalid option {number & 0xFFFF} for {self.key}"
+                    )
+                continue
+            # Compared unscaled, scaling the raw value is inexact
+            if (
+                self.min_value is not None
+                and number < round(self.min_value / self.scale)
+            ) or (
+                self.max_value is not None
+                and number > round(self.max_value / self.scale)
+            ):
+                raise self._range_error(number * self.scale)
+
+    def _range_error(self, value: float) -> ValueError:
+        return ValueError(
+            f"{value:g} is out of range for {self.key} "
+            f"({self.min_value} - {self.max_value})"
+        )
+
+    def decode(self, registers, offset: int):
+        """Decode the value from a raw register array starting at ``offset``."""
+        raw = registers[offset : offset + self.width]
+        if self.options is not None:
+            return self.options[raw[0]] if raw[0] < len(self.options) else None
+        if self.flag:
+            return bool(raw[0])
+        if self.fields:
+            return {
+                field: self._scaled(raw[index])
+                for index, field in enumerate(self.fields)
+            }
+        if self.width == 2:
+            return ((raw[0] << 16) | raw[1]) * self.scale
+        return self._scaled(raw[0])
+
+    def _scaled(self, raw: int):
+        value = round(to_signed(raw) * self.scale, 1)
+        return None if value == MISSING_VALUE else value
+
+
+def _temperature(key, address, min_value, max_value, **kwargs):
+    return HoldingRegister(
+        key, address, min_value=min_value, max_value=max_value, **kwargs
+    )
+
+
+def _climate(key, address, min_value, max_value):
+    return _temperature(key, address, min_value, max_value, fields=("temperature",))
+
+
+def _flag(key, address):
+    return HoldingRegister(key, address, scale=1, min_value=0, max_value=1, flag=True)
+
+
+HOLDING_REGISTERS: dict[str, HoldingRegister] = {
+    register.key: register
+    for register in (
+        HoldingRegister("select_betriebsart", 100, options=BETRIEBSART_OPTIONS),
+        _climate("climate_hkr_raum_soll", 101, 10, 25),
+        # Only accepted by the controller while HR 103 is set
+        _climate("climate_rl_soll", 102, 5, 65),
+        _flag("climate_rl_soll_ovr", 103),
+        _climate("climate_rlt_kuehlen", 104, 15, 25),
+        _temperature(
+            "climate_ww_bereitung",
+            105,
+            5,
+            65,
+            width=2,
+            fields=("target_temp_high", "target_temp_low"),
+        ),
+        _temperature("ww_minimaltemp", 106, 5, 65),
+        HoldingRegister("select_mkr1_betriebsart", 107, options=BETRIEBSART_OPTIONS),
+        _climate("climate_mkr1_raum_soll", 108, 10, 25),
+        _climate("climate_mkr1_rlt_kuehlen", 111, 15, 25),
+        HoldingRegister("select_mkr2_betriebsart", 112, options=BETRIEBSART_OPTIONS),
+        _climate("climate_mkr2_raum_soll", 113, 10, 25),
+        _climate("climate_mkr2_rlt_kuehlen", 116, 15, 25),
+        HoldingRegister(
+            "pv_energie", 117, scale=1, width=2, min_value=0, max_value=10000
+        ),
+        _temperature("ueberheizen_pv_sg", 122, 0, 10),
+        _temperature("unterkuehlen_pv_sg", 123, 0, 10),
+        HoldingRegister(
+            "button_entstoerung", 128, scale=1, min_value=1, max_value=1, readable=False
+        ),
+        _temperature("aussentemp_override_wert", 129, -30, 50),
+        _flag("aussentemp_override", 130),
+        _temperature("puffer_override_wert", 131, 5, 80),
+        _flag("puffer_override", 132),
+        _temperature("brauchwasser_override_wert", 133, 5, 80),
+        _flag("brauchwasser_override", 134),
+        _temperature("hkr_heizgrenze", 135, -10, 30),
+        _temperature("hkr_rlt_soll_ohg", 136, 20, 65),
+        _temperature("hkr_rlt_soll_0", 137, 20, 65),
+        _temperature("hkr_rlt_soll_uhg", 138, 20, 65),
+        _temperature("mkr1_heizgrenze", 139, -10, 30),
+        _temperature("mkr1_rlt_soll_ohg", 140, 20, 65),
+        _temperature("mkr1_rlt_soll_0", 141, 20, 65),
+        _temperature("mkr1_rlt_soll_uhg", 142, 20, 65),
+        _temperature("mkr2_heizgrenze", 143, -10, 30),
+        _temperature("mkr2_rlt_soll_ohg", 144, 20, 65),
+        _temperature("mkr2_rlt_soll_0", 145, 20, 65),
+        _temperature("mkr2_rlt_soll_uhg", 146, 20, 65),
+    )
+}
+
+
+def encode_parameters(parameters: dict) -> dict[int, int]:
+    """Encode a mapping of register keys to values into address -> raw value.
+
+    All parameters are validated before returning; the ValueError lists
+    every invalid one.
+    """
+    values: dict[int, int] = {}
+    errors = []
+    for key, value in parameters.items():
+        register = HOLDING_REGISTERS.get(key)
+        if register is None:
+            errors.append(f"{key} is not a writable register")
+            continue
+        try:
+            raw = register.encode(value)
+        except ValueError as err:
+            errors.append(str(err))
+            continue
+        for address, item in enumerate(raw, register.address):
+            if values.get(address, item) != item:
+                errors.append(f"Conflicting values for HR {address} ({key})")
+            values[address] = item
+
+    if errors:
+        raise ValueError("; ".join(errors))
+    return values
+
+
+def check_raw_write(address: int, values: list[int]) -> None:
+    """Check a raw write of consecutive holding registers, raise ValueError.
+
+    Every value is checked against the range or options of its register, as
+    for writes through ``encode_parameters``.
+    """
+    written = dict(enumerate(values, address))
+    for register in HOLDING_REGISTERS.values():
+        raw = [
+            written.get(register_address)
+            for register_address in range(
+                register.address, register.address + register.width
+            )
+        ]
+        if any(item is not None for item in raw):
+            register.check_raw(raw)
+
+
+def plan_writes(values: dict[int, int]) -> list[tuple[int, list[int]]]:
+    """Group address -> raw value into the fewest runs of consecutive registers."""
+    plan: list[tuple[int, list[int]]] = []
+    for address in sorted(values):
+        if (
+            plan
+            and plan[-1][0] + len(plan[-1][1]) == address
+            and len(plan[-1][1]) < MAX_WRITE_REGISTERS
+        ):
+            plan[-1][1].append(values[address])
+        else:
+            plan.append((address, [values[address]]))
+    return plan
+
+
+def confirm_reads(plan: list[tuple[int, list[int]]]) -> list[tuple[int, list[int]]]:
+    """Return the reads that confirm a write plan, skipping write-only registers."""
+    write_only = {
+        register.address
+        for register in HOLDING_REGISTERS.values()
+        if not register.readable
+    }
+    return plan_writes(
+        {
+            address: value
+            for start, values in plan
+            for address, value in enumerate(values, start)
+            if address not in write_only
+        }
+    )
+
+
+def plan_reads(
+    spans, needed: set[int], max_gap: int | None = None, max_count: int = 125
+) -> tuple[tuple[int, int], ...]:
+    """Plan the (address, count) reads of the needed registers.
+
+    Reads stay within ``spans`` (address, count), the blocks the controller
+    accepts. Within a span a gap of unused registers is read along if it is at
+    most ``max_gap`` long (None: always), otherwise a new read is started.
+    """
+    blocks: list[list[int]] = []
+    for span_address, span_count in spans:
+        span_blocks: list[list[int]] = []
+        for address in range(span_address, span_address + span_count):
+            if address not in needed:
+                continue
+            if (
+                span_blocks
+                and (max_gap is None or address - span_blocks[-1][1] - 1 <= max_gap)
+                and address - span_blocks[-1][0] < max_count
+            ):
+                span_blocks[-1][1] = address
+            else:
+                span_blocks.append([address, address])
+        blocks += span_blocks
+    return tuple((first, last - first + 1) for first, last in blocks)
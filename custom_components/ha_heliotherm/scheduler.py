@@ -0,0 +1,142 @@
+"""Integration wide scheduler for the polls of all hubs.
+
+Instead of one interval timer per hub, which fire in lockstep when the hubs
+are set up together, every hub gets a phase within its scan interval: with n
+hubs, hub i is polled at i/n of the interval. The number of polls in flight
+is capped by a semaphore and the delay between the planned and the actual
+start of every poll is recorded per hub.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+import math
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, MAX_CONCURRENT_POLLS
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+
+@dataclass
+class PollStats:
+    """Poll counters and start jitter (seconds) of one hub."""
+
+    polls: int = 0
+    skipped: int = 0
+    last_jitter: float = 0.0
+    max_jitter: float = 0.0
+    total_jitter: float = 0.0
+
+    @property
+    def mean_jitter(self) -> float:
+        """Return the mean start jitter."""
+        return self.total_jitter / self.polls if self.polls else 0.0
+
+
+class _PollJob:
+    """Scheduling state of one hub."""
+
+    def __init__(self, hub, interval: float) -> None:
+        self.hub = hub
+        self.interval = interval
+        self.phase = 0.0
+        self.handle: asyncio.TimerHandle | None = None
+        self.task: asyncio.Task | None = None
+        self.stats = PollStats()
+
+
+class PollScheduler:
+    """Polls the registered hubs phase-staggered with a cap on concurrent polls."""
+
+    def __init__(self, hass: HomeAssistant, max_concurrent: int) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._epoch = hass.loop.time()
+        self._jobs: dict[object, _PollJob] = {}
+
+    @callback
+    def async_add(self, hub, interval: timedelta) -> None:
+        """Poll a hub every interval, or change the interval of a scheduled hub."""
+        job = self._jobs.get(hub)
+        if job is None:
+            job = self._jobs[hub] = _PollJob(hub, interval.total_seconds())
+        else:
+            job.interval = interval.total_seconds()
+        self._async_rebalance()
+
+    @callback
+    def async_remove(self, hub) -> None:
+        """Stop polling a hub, cancelling a poll in flight."""
+        job = self._jobs.pop(hub, None)
+        if job is None:
+            return
+        if job.handle is not None:
+            job.handle.cancel()
+        if job.task is not None:
+            job.task.cancel()
+        self._async_rebalance()
+
+    def stats(self, hub) -> PollStats | None:
+        """Return the poll statistics of a hub."""
+        job = self._jobs.get(hub)
+        return job.stats if job else None
+
+    async def async_run(self, hub) -> None:
+        """Poll a hub now, once a poll slot is free."""
+        async with self._semaphore:
+            await hub.async_refresh_modbus_data()
+
+    @callback
+    def _async_rebalance(self) -> None:
+        """Spread the phases of all hubs evenly and reschedule them."""
+        for index, job in enumerate(self._jobs.values()):
+            job.phase = job.interval * index / len(self._jobs)
+            if job.handle is not None:
+                job.handle.cancel()
+            self._async_schedule(job)
+
+    @callback
+    def _async_schedule(self, job: _PollJob) -> None:
+        """Schedule the next poll of a job at its next phase-aligned time."""
+        now = self._hass.loop.time()
+        cycles = math.floor((now - self._epoch - job.phase) / job.interval) + 1
+        due = self._epoch + job.phase + cycles * job.interval
+        job.handle = self._hass.loop.call_at(due, self._async_fire, job, due)
+
+    @callback
+    def _async_fire(self, job: _PollJob, due: float) -> None:
+        """Start a due poll unless the previous one is still running."""
+        self._async_schedule(job)
+        if job.task is not None and not job.task.done():
+            job.stats.skipped += 1
+            _LOGGER.debug("Previous poll of %s still running, skipped", job.hub.name)
+            return
+        job.task = self._hass.async_create_background_task(
+            self._async_poll(job, due), f"{DOMAIN}_{job.hub.name}_poll"
+        )
+
+    async def _async_poll(self, job: _PollJob, due: float) -> None:
+        """Poll a hub once a slot is free and record the start jitter."""
+        async with self._semaphore:
+            jitter = self._hass.loop.time() - due
+            stats = job.stats
+            stats.polls += 1
+            stats.last_jitter = jitter
+            stats.max_jitter = max(stats.max_jitter, jitter)
+            stats.total_jitter += jitter
+            await job.hub.async_refresh_modbus_data()
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the scheduler of the integration, creating it on first use."""
+    if DATA_SCHEDULER not in hass.data:
+        hass.data[DATA_SCHEDULER] = PollScheduler(hass, MAX_CONCURRENT_POLLS)
+    return hass.data[DATA_SCHEDULER]
@@ -1,20 +1,19 @@
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.components.input_number import *
+from homeassistant.helpers.event import async_track_time_interval
 import logging
-from typing import Optional, Dict, Any
 
 
-import homeassistant.util.dt as dt_util
-
-from .const import (
-    ATTR_MANUFACTURER,
-    DOMAIN,
+from .const import DOMAIN
+from .descriptions.sensor import (
+    DIAGNOSTIC_SENSOR_TYPES,
     SENSOR_TYPES,
+    HaHeliothermDiagnosticSensorEntityDescription,
     HaHeliothermSensorEntityDescription,
 )
 from .device_config import get_device_info
+from .entity import HaHeliothermModbusEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,65 +23,77 @@ async def async_setup_entry(hass, entry, async_add_entities):
     hub = hass.data[DOMAIN][hub_name]["hub"]
 
     entities = []
-    for sensor_description in SENSOR_TYPES.values():
-        device_info = get_device_info(
-            hub_name,
-            getattr(sensor_description, 'device', 'main')
-        )
-
-        sensor = HaHeliothermModbusSensor(
-            hub_name,
-            hub,
-            device_info,
-            sensor_description,
-        )
-        entities.append(sensor)
+    for unit in hub.units:
+        for sensor_description in SENSOR_TYPES.values():
+            device_info = get_device_info(
+                unit.name,
+                getattr(sensor_description, 'device', 'main')
+            )
+
+            sensor = HaHeliothermModbusSensor(
+                unit.name,
+                unit,
+                device_info,
+                sensor_description,
+            )
+            entities.append(sensor)
+
+        for sensor_description in DIAGNOSTIC_SENSOR_TYPES.values():
+            entities.append(
+                HaHeliothermDiagnosticSensor(
+                    unit.name,
+                    unit,
+                    get_device_info(unit.name, sensor_description.device),
+                    sensor_description,
+                )
+            )
 
     async_add_entities(entities)
     return True
 
 
-class HaHeliothermModbusSensor(SensorEntity):
+class HaHeliothermModbusSensor(HaHeliothermModbusEntity, SensorEntity):
     """Representation of an Heliotherm Modbus sensor."""
 
-    def __init__(
-        self,
-        platform_name,
-        hub,
-        device_info,
-        description: HaHeliothermSensorEntityDescription,
-    ):
-        """Initialize the sensor."""
-        self._platform_name = platform_name
-        self._attr_device_info = device_info
-        self._hub = hub
-        self.entity_description: HaHeliothermSensorEntityDescription = description
+    entity_description: HaHeliothermSensorEntityDescription
+
+    @callback
+    def _update_from_hub(self, value) -> None:
+        self._attr_native_value = value
+
+
+class HaHeliothermDiagnosticSensor(HaHeliothermModbusSensor):
+    """Runtime metric of a hub, updated after every poll, failed or not."""
+
+    entity_description: HaHeliothermDiagnosticSensorEntityDescription
+    _attr_entity_registry_enabled_default = False
 
     async def async_added_to_hass(self):
         """Register callbacks."""
-        self._hub.async_add_haheliotherm_modbus_sensor(self._modbus_data_updated)
+        self._hub.async_add_metrics_listener(self._modbus_data_updated)
+        if self.entity_description.update_interval is not None:
+            self.async_on_remove(
+                async_track_time_interval(
+                    self.hass,
+                    self._async_interval_update,
+                    self.entity_description.update_interval,
+                )
+            )
 
     async def async_will_remove_from_hass(self) -> None:
-        self._hub.async_remove_haheliotherm_modbus_sensor(self._modbus_data_updated)
-
-    @callback
-    def _modbus_data_updated(self):
-        self.async_write_ha_state()
+        """Remove callbacks."""
+        self._hub.async_remove_metrics_listener(self._modbus_data_updated)
 
     @property
-    def name(self):
-        """Return the name."""
-        return f"{self._platform_name} {self.entity_description.name}"
+    def extra_state_attributes(self):
+        """Return the breakdown of the metric, if it has one."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self._hub)
 
-    @property
-    def unique_id(self) -> Optional[str]:
-        return f"{self._platform_name}_{self.entity_description.key}"
+    def _hub_value(self):
+        return self.entity_description.value_fn(self._hub)
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return (
-            self._hub.data[self.entity_description.key]
-            if self.entity_description.key in self._hub.data
-            else None
-        )
+    @callback
+    def _async_interval_update(self, _now) -> None:
+        self._modbus_data_updated()
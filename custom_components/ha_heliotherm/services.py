@@ -0,0 +1,226 @@
+"""Services of the HaHeliotherm integration."""
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import CONF_NAME, CONF_TIMEOUT
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import slugify
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_CONFIRM,
+    ATTR_CYCLES,
+    ATTR_DEVICE_ID,
+    ATTR_PARAMETERS,
+    ATTR_PROFILE,
+    CONF_PROFILES,
+    DEFAULT_CONFIRM_TIMEOUT,
+    DOMAIN,
+    SERVICE_APPLY_PROFILE,
+    SERVICE_DELETE_PROFILE,
+    SERVICE_PROFILE,
+    SERVICE_SAVE_PROFILE,
+    SERVICE_WRITE_PARAMETERS,
+)
+from .registers import encode_parameters
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIRM_SCHEMA = {
+    vol.Optional(ATTR_CONFIRM, default=False): cv.boolean,
+    vol.Optional(CONF_TIMEOUT, default=DEFAULT_CONFIRM_TIMEOUT): vol.All(
+        vol.Coerce(float), vol.Range(min=0.5, max=120)
+    ),
+}
+
+UNIT_SCHEMA = {
+    vol.Optional(ATTR_DEVICE_ID): vol.All(vol.Coerce(int), vol.Range(min=1, max=247)),
+}
+
+WRITE_PARAMETERS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_PARAMETERS): vol.All(dict, vol.Length(min=1)),
+        **UNIT_SCHEMA,
+        **CONFIRM_SCHEMA,
+    }
+)
+
+SAVE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_PARAMETERS): vol.All(dict, vol.Length(min=1)),
+        vol.Required(ATTR_PROFILE): cv.string,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_PROFILE): cv.string,
+    }
+)
+
+APPLY_PROFILE_SCHEMA = PROFILE_SCHEMA.extend({**UNIT_SCHEMA, **CONFIRM_SCHEMA})
+
+PROFILE_HUB_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=5): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
+
+def _get_entry(hass: HomeAssistant, call: ServiceCall) -> ConfigEntry:
+    """Return the loaded config entry a service call targets."""
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.data[CONF_NAME] not in hass.data[DOMAIN]
+    ):
+        raise HomeAssistantError(f"Heliotherm config entry {entry_id} is not loaded")
+    return entry
+
+
+def _get_hub(hass: HomeAssistant, call: ServiceCall, entry: ConfigEntry | None = None):
+    """Return the hub (or the unit with the given device ID) a service call targets."""
+    if entry is None:
+        entry = _get_entry(hass, call)
+    hub = hass.data[DOMAIN][entry.data[CONF_NAME]]["hub"]
+    if ATTR_DEVICE_ID not in call.data:
+        return hub
+
+    unit = hub.unit(call.data[ATTR_DEVICE_ID])
+    if unit is None:
+        raise HomeAssistantError(
+            f"{hub.name} does not poll device ID {call.data[ATTR_DEVICE_ID]}"
+        )
+    return unit
+
+
+def _confirm_timeout(call: ServiceCall) -> float | None:
+    """Return the read-back deadline of a service call, None if not confirming."""
+    return call.data[CONF_TIMEOUT] if call.data[ATTR_CONFIRM] else None
+
+
+def _write_response(hub, call: ServiceCall, plan) -> dict:
+    """Return the service response describing an executed write plan."""
+    response = {
+        "transactions": len(plan),
+        "registers": sum(len(values) for _, values in plan),
+    }
+    if call.data[ATTR_CONFIRM] and plan:
+        response["confirm_time"] = round(hub.last_confirm_time, 3)
+    return response
+
+
+@callback
+def _async_update_profiles(hass: HomeAssistant, entry: ConfigEntry, profiles) -> None:
+    """Store the profiles in the config entry options."""
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_PROFILES: profiles}
+    )
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_write_parameters(call: ServiceCall) -> ServiceResponse:
+        """Write several parameters in as few transactions as possible."""
+        hub = _get_hub(hass, call)
+        plan = await hub.async_write_parameters(
+            call.data[ATTR_PARAMETERS], _confirm_timeout(call)
+        )
+        return _write_response(hub, call, plan)
+
+    async def async_save_profile(call: ServiceCall) -> None:
+        """Validate and store a named parameter profile."""
+        entry = _get_entry(hass, call)
+        parameters = call.data[ATTR_PARAMETERS]
+        try:
+            encode_parameters(parameters)
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+
+        profiles = {
+            **entry.options.get(CONF_PROFILES, {}),
+            call.data[ATTR_PROFILE]: dict(parameters),
+        }
+        _async_update_profiles(hass, entry, profiles)
+
+    async def async_apply_profile(call: ServiceCall) -> ServiceResponse:
+        """Write the values of a stored profile that differ from the device."""
+        entry = _get_entry(hass, call)
+        name = call.data[ATTR_PROFILE]
+        profile = entry.options.get(CONF_PROFILES, {}).get(name)
+        if profile is None:
+            raise HomeAssistantError(f"Unknown profile {name}")
+
+        hub = _get_hub(hass, call, entry)
+        changed, plan = await hub.async_apply_profile(profile, _confirm_timeout(call))
+        _LOGGER.info("Applied profile %s to %s, changed: %s", name, hub.name, changed)
+        return {"changed": changed, **_write_response(hub, call, plan)}
+
+    async def async_delete_profile(call: ServiceCall) -> None:
+        """Remove a stored profile."""
+        entry = _get_entry(hass, call)
+        profiles = dict(entry.options.get(CONF_PROFILES, {}))
+        if profiles.pop(call.data[ATTR_PROFILE], None) is not None:
+            _async_update_profiles(hass, entry, profiles)
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the next refresh cycles of a hub into the config directory."""
+        hub = _get_hub(hass, call)
+        path = hass.config.path(
+            f"{DOMAIN}_profile_{slugify(hub.name)}_"
+            f"{dt_util.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+        result = await hub.async_profile(call.data[ATTR_CYCLES], path)
+        _LOGGER.info("Profile of %s written to %s", hub.name, result["report"])
+        return result
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WRITE_PARAMETERS,
+        async_write_parameters,
+        schema=WRITE_PARAMETERS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SAVE_PROFILE, async_save_profile, schema=SAVE_PROFILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PROFILE,
+        async_apply_profile,
+        schema=APPLY_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_DELETE_PROFILE, async_delete_profile, schema=PROFILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_HUB_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
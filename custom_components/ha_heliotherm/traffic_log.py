@@ -0,0 +1,182 @@
+"""Compact binary log of the Modbus traffic of a connection.
+
+Every request/response pair is appended as a length-prefixed frame:
+
+    <H  length of the rest of the frame
+    <d  time of the response (Unix time)
+    B   device ID
+    B   function code, with 0x80 set for a failed transaction
+    <H  address
+    <H  register count of the request
+    <H  registers, read from or written to the device (little endian)
+
+Files start with MAGIC. Once a file reaches ``max_bytes`` it is compressed
+to ``<path>.1.gz``, older files move up to ``<path>.<n>.gz`` and the oldest
+beyond ``backups`` is removed. The registers of a heat pump change little
+between polls, so the compressed files hold weeks of polls in a few MB.
+
+This module only uses the standard library, so logs can be read anywhere
+with ``iter_traffic``.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+import gzip
+import os
+import shutil
+import struct
+import sys
+import threading
+import time
+from typing import Iterator
+
+MAGIC = b"HTL1"
+
+# Size of a file before it is rotated and number of rotated files kept
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_BACKUPS = 20
+
+# Flag in the function code of a failed transaction
+ERROR_FLAG = 0x80
+
+_LENGTH = struct.Struct("<H")
+_HEADER = struct.Struct("<dBBHH")
+
+
+@dataclass(frozen=True)
+class TrafficRecord:
+    """One logged transaction."""
+
+    timestamp: float
+    device_id: int
+    function: int
+    address: int
+    count: int
+    registers: array
+    error: bool
+
+
+def _to_bytes(registers) -> bytes:
+    """Return registers as little endian bytes."""
+    values = array("H", registers)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+class TrafficLog:
+    """Appends transactions to a rotating binary log, thread safe."""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+    ) -> None:
+        """Initialize the log, the file is opened with the first record."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._file = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        device_id: int,
+        function: int,
+        address: int,
+        count: int,
+        registers=(),
+        error: bool = False,
+    ) -> None:
+        """Append a transaction. Blocking, call it from the executor."""
+        payload = _to_bytes(registers)
+        frame = _HEADER.pack(
+            time.time(),
+            device_id,
+            function | ERROR_FLAG if error else function,
+            address,
+            count,
+        )
+        with self._lock:
+            if self._closed:
+                return
+            if self._file is None:
+                self._file = open(self.path, "ab")
+                if self._file.tell() == 0:
+                    self._file.write(MAGIC)
+            self._file.write(_LENGTH.pack(len(frame) + len(payload)))
+            self._file.write(frame)
+            self._file.write(payload)
+            self._file.flush()
+            if self._file.tell() >= self.max_bytes:
+                self._rotate()
+
+    def close(self) -> None:
+        """Close the file, later records are dropped."""
+        with self._lock:
+            self._closed = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _rotate(self) -> None:
+        """Compress the full file into the first backup, shift the others."""
+        self._file.close()
+        self._file = None
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}.gz"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}.gz")
+        with open(self.path, "rb") as source, gzip.open(
+            f"{self.path}.1.gz", "wb"
+        ) as target:
+            shutil.copyfileobj(source, target)
+        os.remove(self.path)
+
+
+def iter_records(path: str) -> Iterator[TrafficRecord]:
+    """Yield the records of one log file, plain or gzip compressed.
+
+    A frame cut off at the end, e.g. by a crash while writing, is skipped.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a traffic log")
+        while len(prefix := file.read(_LENGTH.size)) == _LENGTH.size:
+            (length,) = _LENGTH.unpack(prefix)
+            frame = file.read(length)
+            if len(frame) < length:
+                return
+            timestamp, device_id, function, address, count = _HEADER.unpack_from(
+                frame
+            )
+            registers = array("H")
+            registers.frombytes(frame[_HEADER.size :])
+            if sys.byteorder == "big":
+                registers.byteswap()
+            yield TrafficRecord(
+                timestamp,
+                device_id,
+                function & ~ERROR_FLAG,
+                address,
+                count,
+                registers,
+                bool(function & ERROR_FLAG),
+            )
+
+
+def iter_traffic(path: str) -> Iterator[TrafficRecord]:
+    """Yield the records of a log and its rotated files, oldest first."""
+    backups = []
+    index = 1
+    while os.path.exists(f"{path}.{index}.gz"):
+        backups.append(f"{path}.{index}.gz")
+        index += 1
+    for backup in reversed(backups):
+        yield from iter_records(backup)
+    if os.path.exists(path):
+        yield from iter_records(path)
@@ -0,0 +1,97 @@
+"""Modbus transports and their timing on the wire.
+
+Besides Modbus TCP the heat pump can be reached through RS232/RS485 gateways
+that forward RTU frames over TCP, or directly over a serial port. On a serial
+line every byte costs real time (0.57 ms at 19200 baud), so the read plan and
+the gap between frames depend on the baud rate.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+from pymodbus import FramerType
+from pymodbus.client import ModbusSerialClient, ModbusTcpClient
+
+TRANSPORT_TCP = "tcp"
+TRANSPORT_RTU_OVER_TCP = "rtuovertcp"
+TRANSPORT_SERIAL = "serial"
+TRANSPORTS = (TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP, TRANSPORT_SERIAL)
+
+BAUDRATES = (9600, 19200, 38400, 57600, 115200)
+
+CODEC_PYMODBUS = "pymodbus"
+CODEC_NATIVE = "native"
+CODECS = (CODEC_PYMODBUS, CODEC_NATIVE)
+
+# Time per transaction besides the frames: controller turnaround, network
+TRANSACTION_LATENCY = 0.02
+
+# Bytes of a read request (unit, function, address, count, CRC) and of a
+# read response without its data (unit, function, byte count, CRC)
+_READ_REQUEST_BYTES = 8
+_READ_RESPONSE_BYTES = 5
+
+
+@dataclass(frozen=True)
+class FrameTiming:
+    """Timing of Modbus frames on the serial line behind a transport."""
+
+    char_time: float = 0.0
+    silent_interval: float = 0.0
+
+    @classmethod
+    def for_transport(cls, transport: str, baudrate: int) -> FrameTiming:
+        """Return the frame timing of a transport, zero for Modbus TCP."""
+        if transport == TRANSPORT_TCP:
+            return cls()
+        # Start bit, 8 data bits, parity or second stop bit, stop bit
+        char_time = 11 / baudrate
+        # 3.5 characters, fixed at 1.75 ms above 19200 baud (Modbus over serial line)
+        silent_interval = 3.5 * char_time if baudrate <= 19200 else 0.00175
+        return cls(char_time, silent_interval)
+
+    def read_time(self, count: int) -> float:
+        """Return the estimated duration of reading count registers."""
+        frame_bytes = _READ_REQUEST_BYTES + _READ_RESPONSE_BYTES + 2 * count
+        return (
+            TRANSACTION_LATENCY
+            + frame_bytes * self.char_time
+            + 2 * self.silent_interval
+        )
+
+    @property
+    def max_bridged_gap(self) -> int | None:
+        """Return the most unused registers cheaper to read than a new request.
+
+        None means any gap is cheaper, as with Modbus TCP.
+        """
+        if not self.char_time:
+            return None
+        return math.floor(self.read_time(0) / (2 * self.char_time))
+
+
+def create_client(
+    transport: str, host: str, port, baudrate: int, timeout, codec=CODEC_PYMODBUS
+):
+    """Return the Modbus client of a transport, host is the serial port for serial.
+
+    The native codec only implements Modbus TCP framing, other transports always
+    use pymodbus.
+    """
+    if transport == TRANSPORT_TCP and codec == CODEC_NATIVE:
+        # Imported on first use, only entries with the native codec need it
+        from .codec import ModbusTcpCodecClient
+
+        return ModbusTcpCodecClient(host, port, timeout)
+    if transport == TRANSPORT_SERIAL:
+        return ModbusSerialClient(host, baudrate=baudrate, timeout=timeout, retries=3)
+    return ModbusTcpClient(
+        host=host,
+        port=int(port),
+        framer=(
+            FramerType.RTU if transport == TRANSPORT_RTU_OVER_TCP else FramerType.SOCKET
+        ),
+        timeout=timeout,
+        retries=3,
+    )
@@ -0,0 +1,203 @@
+"""Benchmark the poll, decode and dispatch path against stored baselines.
+
+Sets up the integration in an in-process Home Assistant (see ha_harness.py)
+against the simulator (see simulator.py), so all entities of a heat pump are
+registered and write their states. Measured:
+
+- decode: ``decode_registers`` of one poll
+- dispatch_changed: the update callbacks of all entities, every value changed
+- dispatch_unchanged: the same with unchanged values (skipped writes)
+- cycle_memory: peak memory allocated by decoding and dispatching one poll
+- read: reading all register blocks in the executor
+- poll: a full refresh, read, decode and dispatch, as the scheduler runs it
+- reference: a fixed pure Python workload, to compare other machines
+
+Times are reported in microseconds as min, median, mean and standard
+deviation over the rounds. ``--save`` stores the results as baseline, later
+runs compare against it and exit with 1 if one is more than ``--tolerance``
+above its baseline. The minimum is compared, it is least disturbed by other
+load on the machine, and times relative to the reference, so a baseline
+taken on a faster or slower machine still compares.
+The baseline is checked in as tests/benchmark_baseline.json, the tests run
+the benchmarks against it.
+
+Usage: python scripts/benchmark.py [--rounds N] [--save] [--tolerance 0.25]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from ha_harness import REPOSITORY, async_add_hub, async_home_assistant
+from simulator import HeatPumpSimulator
+
+BASELINE = os.path.join(REPOSITORY, "tests", "benchmark_baseline.json")
+
+
+def summarize(samples: list[float], unit: str) -> dict:
+    """Return the statistics of a benchmark."""
+    return {
+        "unit": unit,
+        "rounds": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stddev": statistics.pstdev(samples),
+    }
+
+
+def time_callback(function, rounds: int, setup=None) -> dict:
+    """Time a synchronous function in microseconds."""
+    samples = []
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return summarize(samples, "us")
+
+
+async def time_coroutine(function, rounds: int) -> dict:
+    """Time a coroutine function in microseconds."""
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await function()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return summarize(samples, "us")
+
+
+def memory_callback(function, rounds: int, setup=None) -> dict:
+    """Measure the peak memory a synchronous function allocates, in bytes."""
+    samples = []
+    tracemalloc.start()
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        function()
+        samples.append(tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+    return summarize(samples, "B")
+
+
+def reference_workload() -> None:
+    """Run a fixed workload of integer arithmetic, loops and dict access."""
+    values = {}
+    for index in range(2000):
+        values[index & 0xFF] = (index * 31) >> 2
+
+
+def compare(results: dict, baseline: dict) -> dict:
+    """Return the relative change of every minimum against the baseline.
+
+    Times are divided by the reference of their run first, memory compares
+    as measured.
+    """
+    changes = {}
+    for name, result in results.items():
+        if name == "reference" or name not in baseline:
+            continue
+        measured = result["min"]
+        expected = baseline[name]["min"]
+        if result["unit"] == "us":
+            measured /= results["reference"]["min"]
+            expected /= baseline["reference"]["min"]
+        changes[name] = measured / expected - 1 if expected else 0.0
+    return changes
+
+
+async def async_run(rounds: int) -> dict:
+    """Run all benchmarks and return their statistics by name."""
+    simulator = HeatPumpSimulator(units=[1], speed=60, seed=1)
+    port = await simulator.async_start()
+    results = {}
+    async with async_home_assistant() as hass:
+        # Polls of the scheduler must not interfere with the measurements
+        hub = await async_add_hub(
+            hass, "bench", "127.0.0.1", port, options={"scan_interval": 3600}
+        )
+        while not hub.data:
+            await asyncio.sleep(0.05)
+        await hass.async_block_till_done()
+
+        def dispatch() -> None:
+            for update_callback in hub._sensors:
+                update_callback()
+
+        def invalidate() -> None:
+            for update_callback in hub._sensors:
+                update_callback.__self__._invalidate_value()
+
+        def cycle() -> None:
+            hub.decode_registers()
+            dispatch()
+
+        async def read() -> None:
+            await hass.async_add_executor_job(hub.read_modbus_registers)
+
+        results["decode"] = time_callback(hub.decode_registers, rounds)
+        results["dispatch_changed"] = time_callback(dispatch, rounds, invalidate)
+        results["dispatch_unchanged"] = time_callback(dispatch, rounds)
+        results["cycle_memory"] = memory_callback(cycle, rounds // 10 or 1, invalidate)
+        results["read"] = await time_coroutine(read, rounds // 5 or 1)
+        results["poll"] = await time_coroutine(
+            hub.async_refresh_modbus_data, rounds // 5 or 1
+        )
+        results["reference"] = time_callback(reference_workload, rounds)
+        print(f"{len(hub._sensors)} entities, {len(hub.read_blocks)} reads per poll")
+    await simulator.async_stop()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=1000)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="store as baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = asyncio.run(async_run(args.rounds))
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    changes = compare(results, baseline)
+    failed = False
+    print(
+        f"{'benchmark':<20} {'min':>10} {'median':>10} {'mean':>10} {'stddev':>10}"
+        f" {'baseline':>10}"
+    )
+    for name, result in results.items():
+        line = (
+            f"{name:<20} {result['min']:>10.1f} {result['median']:>10.1f}"
+            f" {result['mean']:>10.1f} {result['stddev']:>10.1f}"
+        )
+        if name in changes:
+            change = changes[name]
+            status = "REGRESSION" if change > args.tolerance else "ok"
+            failed |= change > args.tolerance
+            line += f" {baseline[name]['min']:>10.1f} {change:+7.1%} {status}"
+        print(f"{line}  {result['unit']}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+        print(f"Baseline saved to {args.baseline}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""Compare CPU time, allocations and latency per poll of the Modbus TCP codecs.
+
+Starts an in-process Modbus TCP server answering like a Heliotherm controller
+(see rtu_standin.py) and polls it through a ModbusConnection with the
+pymodbus client and with the native codec, reading the blocks of a Modbus TCP
+poll into register arrays like the hub does, and once more with the native
+codec's pipelined reads. Reported per poll: wall time, process CPU time and
+the peak of memory allocated during a poll as traced by tracemalloc. Client
+and server share the process, the server's part is the same for all rows.
+``--latency`` delays every response like a slow link, which shows what
+pipelining saves.
+
+Usage: python scripts/codec_benchmark.py [--polls N] [--units 1,2] [--latency S]
+"""
+import argparse
+from array import array
+import os
+import queue
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from rtu_standin import Controller  # noqa: E402
+
+from custom_components.ha_heliotherm import plan_poll  # noqa: E402
+from custom_components.ha_heliotherm.connection import ModbusConnection  # noqa: E402
+from custom_components.ha_heliotherm.transport import (  # noqa: E402
+    CODEC_NATIVE,
+    CODECS,
+    TRANSPORT_TCP,
+    FrameTiming,
+)
+
+
+class ModbusTcpHandler(socketserver.BaseRequestHandler):
+    """Answer Modbus TCP requests of one client."""
+
+    def handle(self) -> None:
+        controller = self.server.controller
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        stream = self.request.makefile("rb")
+        # Responses are sent by a second thread so that the link delay of
+        # requests received together overlaps, as on a real link
+        responses = queue.SimpleQueue()
+        sender = threading.Thread(target=self.send, args=(responses,), daemon=True)
+        sender.start()
+        while True:
+            header = stream.read(7)
+            if len(header) < 7:
+                responses.put(None)
+                return
+            due = time.monotonic() + self.server.latency
+            transaction_id, _, length, unit = struct.unpack(">HHHB", header)
+            pdu = stream.read(length - 1)
+            response = controller.handle(bytes((unit,)) + pdu)
+            if response is None:
+                continue
+            responses.put(
+                (due, struct.pack(">HHH", transaction_id, 0, len(response)) + response)
+            )
+
+    def send(self, responses: queue.SimpleQueue) -> None:
+        """Send the queued responses once they are due."""
+        while (item := responses.get()) is not None:
+            due, response = item
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                self.request.sendall(response)
+            except OSError:
+                return
+
+
+class ModbusTcpServer(socketserver.ThreadingTCPServer):
+    """Threaded Modbus TCP server on a free local port."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, controller: Controller, latency: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), ModbusTcpHandler)
+        self.controller = controller
+        self.latency = latency
+
+
+def poll(connection, blocks, units, registers) -> None:
+    """Read all blocks of all units into their register arrays."""
+    if connection.pipelined:
+        requests = []
+        for method, address, count in blocks:
+            for unit in units:
+                target, base = registers[unit][method]
+                view = memoryview(target)[address - base : address - base + count]
+                requests.append((method, address, count, unit, view))
+        results = connection.read_pipelined("benchmark", requests)
+        if results is None or not all(results):
+            raise RuntimeError(f"Pipelined reads failed: {results}")
+        return
+    for method, address, count in blocks:
+        for unit in units:
+            target, base = registers[unit][method]
+            if not connection.read_into(
+                "benchmark",
+                method,
+                address,
+                count,
+                unit,
+                memoryview(target)[address - base : address - base + count],
+            ):
+                raise RuntimeError(f"Unit {unit}: {method} {address} failed")
+
+
+def measure(
+    codec: str, pipelined: bool, port: int, polls: int, units: list[int]
+) -> tuple:
+    """Return wall and CPU seconds and peak allocated bytes per poll."""
+    connection = ModbusConnection(TRANSPORT_TCP, "127.0.0.1", port, 19200, 3, codec)
+    connection.set_pipelined("benchmark", pipelined)
+    blocks = plan_poll(FrameTiming.for_transport(TRANSPORT_TCP, 19200))
+    registers = {
+        unit: {
+            "read_input_registers": (array("H", [0]) * 66, 10),
+            "read_holding_registers": (array("H", [0]) * 51, 100),
+        }
+        for unit in units
+    }
+    if not connection.connect("benchmark"):
+        raise RuntimeError(f"Cannot connect to port {port}")
+    # Warm up caches, lazily created objects and the server thread
+    for _ in range(20):
+        poll(connection, blocks, units, registers)
+
+    started = time.perf_counter()
+    started_cpu = time.process_time()
+    for _ in range(polls):
+        poll(connection, blocks, units, registers)
+    cpu = (time.process_time() - started_cpu) / polls
+    wall = (time.perf_counter() - started) / polls
+
+    tracemalloc.start()
+    peak = 0
+    for _ in range(polls // 10 or 1):
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        poll(connection, blocks, units, registers)
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+    connection.close()
+    return wall, cpu, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=2000)
+    parser.add_argument("--units", default="1", help="comma separated device IDs")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="response delay in seconds"
+    )
+    args = parser.parse_args()
+    units = [int(unit) for unit in args.units.split(",")]
+
+    server = ModbusTcpServer(Controller(units), args.latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    print(f"{'codec':<18} {'time/poll':>10} {'CPU/poll':>10} {'peak alloc/poll':>16}")
+    runs = [(codec, False) for codec in CODECS] + [(CODEC_NATIVE, True)]
+    for codec, pipelined in runs:
+        wall, cpu, peak = measure(codec, pipelined, port, args.polls, units)
+        label = f"{codec} pipelined" if pipelined else codec
+        print(
+            f"{label:<18} {wall * 1e3:>8.3f}ms {cpu * 1e3:>8.3f}ms {peak:>14d} B"
+        )
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""Run the integration inside a minimal in-process Home Assistant.
+
+Used by the benchmark and load scripts: sets up a Home Assistant core with
+its registries in a temporary config directory that links this repository's
+custom_components, and adds config entries for simulated heat pumps.
+"""
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import tempfile
+
+from homeassistant import bootstrap, config_entries, loader
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant
+
+DOMAIN = "ha_heliotherm"
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@contextlib.asynccontextmanager
+async def async_home_assistant():
+    """Yield a started Home Assistant instance, stopped on exit."""
+    # Keep the warning about custom integrations out of the reports
+    logging.getLogger("homeassistant.loader").setLevel(logging.ERROR)
+    with tempfile.TemporaryDirectory() as config_dir:
+        os.symlink(
+            os.path.join(REPOSITORY, "custom_components"),
+            os.path.join(config_dir, "custom_components"),
+        )
+        hass = HomeAssistant(config_dir)
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        await hass.async_start()
+        try:
+            yield hass
+        finally:
+            await hass.async_stop()
+
+
+async def async_add_hub(
+    hass: HomeAssistant, name: str, host: str, port: int, data=None, options=None
+):
+    """Set up a config entry for a heat pump and return its hub."""
+    entry = config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=name,
+        data={CONF_NAME: name, CONF_HOST: host, CONF_PORT: port, **(data or {})},
+        source=config_entries.SOURCE_USER,
+        options=options or {},
+    )
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    return hass.data[DOMAIN][name]["hub"]
+
+
+async def async_remove_hub(hass: HomeAssistant, hub) -> None:
+    """Unload and remove the config entry of a hub."""
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.data[CONF_NAME] == hub.name:
+            await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,143 @@
+"""Measure the import time of the integration and its platforms against a budget.
+
+Every module is imported in a fresh interpreter with ``-X importtime``. The
+Home Assistant modules that are already loaded when Home Assistant imports the
+integration (core, config entries and, for platforms, the entity component)
+are imported first, so only the cost added by the integration is measured.
+The package is byte-compiled first, compiling stale sources would otherwise
+be measured as import time when bytecode is not written.
+
+Budgets are relative to the import of pymodbus.client, measured alongside in
+the same way, so they hold on slower or busy machines. Absolute times are
+printed for reference.
+
+Usage: python scripts/import_budget.py [--runs N]
+"""
+import argparse
+import compileall
+import os
+import subprocess
+import sys
+
+PACKAGE = "custom_components.ha_heliotherm"
+
+PRELOADED = [
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.config_validation",
+]
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import the budgets are measured against, the largest dependency of the
+# package and unchanged by the integration
+REFERENCE = "pymodbus.client"
+
+# Budget per module as a multiple of the REFERENCE import (on top of
+# PRELOADED). The package includes pymodbus and measures about 1.4 times the
+# reference (21 ms of 15 ms here), its own modules add about 6 ms. Before the
+# descriptions were split from const.py it measured 3.3 times the reference
+# (52 ms), the budget of 2.5 catches that with room for noisy runs.
+# Platforms measure about 0.2 times the reference (2-4 ms); importing a Home
+# Assistant component or the descriptions of all platforms again exceeds 0.6.
+# The proxy, profiler, native codec and traffic log are imported on first
+# use and stay out of it, see LAZY_MODULES.
+BUDGETS = {
+    PACKAGE: 2.5,
+    f"{PACKAGE}.sensor": 0.6,
+    f"{PACKAGE}.binary_sensor": 0.6,
+    f"{PACKAGE}.number": 0.6,
+    f"{PACKAGE}.select": 0.6,
+    f"{PACKAGE}.switch": 0.6,
+    f"{PACKAGE}.climate": 0.6,
+    f"{PACKAGE}.button": 0.6,
+}
+
+# Modules only imported when their feature is used
+LAZY_MODULES = [
+    f"{PACKAGE}.codec",
+    f"{PACKAGE}.profiler",
+    f"{PACKAGE}.proxy",
+    f"{PACKAGE}.traffic_log",
+]
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    """Return the import time of a module and its parents in milliseconds.
+
+    Also returns the LAZY_MODULES the import loaded.
+    """
+    preload = list(PRELOADED)
+    if module.startswith(f"{PACKAGE}."):
+        platform = module.rsplit(".", 1)[1]
+        preload += [f"homeassistant.components.{platform}", PACKAGE]
+
+    code = ";".join(f"import {name}" for name in preload)
+    code += f";import sys;sys.stderr.write('--measure--\\n');import {module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPOSITORY,
+    )
+    measured = result.stderr.split("--measure--\n", 1)[1]
+    cumulative_time = 0.0
+    loaded = []
+    for line in measured.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, found, fields = line.partition("import time:")
+        if not found:
+            # e.g. deprecation warnings of Home Assistant
+            continue
+        _, cumulative, name = fields.split("|")
+        # One space follows the separator, nested imports are indented further
+        name = name.rstrip()[1:]
+        if name.strip() in LAZY_MODULES:
+            loaded.append(name.strip())
+        # Unindented lines are imported by the statement itself, e.g. the
+        # parent packages of a submodule
+        if not name.startswith(" "):
+            cumulative_time += int(cumulative) / 1000
+    return cumulative_time, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="runs per module")
+    args = parser.parse_args()
+    compileall.compile_dir(
+        os.path.join(REPOSITORY, *PACKAGE.split(".")), quiet=1
+    )
+
+    # Reference and modules are measured in turns, so load on the machine
+    # affects both alike
+    reference = []
+    results = {module: [] for module in BUDGETS}
+    for _ in range(args.runs):
+        for module in BUDGETS:
+            reference.append(measure(REFERENCE)[0])
+            results[module].append(measure(module))
+    reference_time = min(reference)
+    print(f"{REFERENCE:45} {reference_time:8.1f} ms  (reference)")
+
+    failed = False
+    for module, budget in BUDGETS.items():
+        best = min(duration for duration, _ in results[module])
+        ratio = best / reference_time
+        loaded = results[module][0][1]
+        status = "ok" if ratio <= budget else "OVER BUDGET"
+        if loaded:
+            status += f", loads {', '.join(loaded)}"
+        failed |= ratio > budget or bool(loaded)
+        print(
+            f"{module:45} {best:8.1f} ms  {ratio:5.2f} x (budget {budget} x)"
+            f"  {status}"
+        )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""Answer Modbus RTU requests on a pseudo-terminal like a Heliotherm controller.
+
+Opens a pty pair and prints the path of its device end. Configure that path
+as serial port of the integration (transport "serial") or point any Modbus
+RTU client at it. Frames are delimited by the silent interval of the chosen
+baud rate and responses are delayed by their transmission time, so the
+timing of the serial transport can be checked without hardware.
+
+Served registers: IR 10-52 and IR 60-75, HR 100-150 (FC03, FC04, FC06, FC16).
+Other addresses are answered with exception 2 (illegal data address).
+
+Usage: python scripts/rtu_standin.py [--baudrate 19200] [--units 1,2]
+"""
+import argparse
+import os
+import select
+import struct
+import sys
+import time
+import tty
+
+INPUT_REGISTERS = set(range(10, 53)) | set(range(60, 76))
+HOLDING_REGISTERS = set(range(100, 151))
+
+
+def crc16(frame: bytes) -> int:
+    """Return the Modbus CRC of a frame."""
+    crc = 0xFFFF
+    for byte in frame:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+
+def with_crc(frame: bytes) -> bytes:
+    """Append the CRC, low byte first."""
+    return frame + struct.pack("<H", crc16(frame))
+
+
+def initial_registers(unit: int) -> dict[int, int]:
+    """Return plausible register values, distinct per unit."""
+    registers = {address: 0 for address in INPUT_REGISTERS | HOLDING_REGISTERS}
+    registers.update(
+        {
+            10: 52 + unit,  # temp_aussen 5.x °C
+            11: 480,  # temp_brauchwasser 48.0 °C
+            12: 350,  # temp_vorlauf
+            13: 300,  # temp_ruecklauf
+            100: 1,  # Betriebsart Auto
+            101: 215,  # Raum soll 21.5 °C
+            105: 500,  # WW max
+            106: 450,  # WW min
+            135: 160,
+            136: 250,
+            137: 320,
+            138: 400,
+        }
+    )
+    return registers
+
+
+class Controller:
+    """Register memory of the simulated units."""
+
+    def __init__(self, units: list[int]) -> None:
+        self.input = {unit: initial_registers(unit) for unit in units}
+        self.holding = {unit: initial_registers(unit) for unit in units}
+
+    def handle(self, request: bytes) -> bytes | None:
+        """Return the response frame (without CRC), None for foreign units."""
+        unit, function = request[0], request[1]
+        if unit not in self.input:
+            return None
+        try:
+            if function in (3, 4):
+                address, count = struct.unpack_from(">HH", request, 2)
+                valid = INPUT_REGISTERS if function == 4 else HOLDING_REGISTERS
+                memory = (self.input if function == 4 else self.holding)[unit]
+                if not 1 <= count <= 125:
+                    return bytes((unit, function | 0x80, 3))
+                if not valid.issuperset(range(address, address + count)):
+                    return bytes((unit, function | 0x80, 2))
+                values = [memory[item] for item in range(address, address + count)]
+                return struct.pack(f">BBB{count}H", unit, function, 2 * count, *values)
+            if function == 6:
+                address, value = struct.unpack_from(">HH", request, 2)
+                if address not in HOLDING_REGISTERS:
+                    return bytes((unit, function | 0x80, 2))
+                self.holding[unit][address] = value
+                return request[:6]
+            if function == 16:
+                address, count, _ = struct.unpack_from(">HHB", request, 2)
+                if not HOLDING_REGISTERS.issuperset(range(address, address + count)):
+                    return bytes((unit, function | 0x80, 2))
+                values = struct.unpack_from(f">{count}H", request, 7)
+                for offset, value in enumerate(values):
+                    self.holding[unit][address + offset] = value
+                return request[:6]
+        except struct.error:
+            return bytes((unit, function | 0x80, 3))
+        return bytes((unit, function | 0x80, 1))
+
+
+def serve(master: int, controller: Controller, baudrate: int) -> None:
+    """Read frames from the pty and answer them."""
+    char_time = 11 / baudrate
+    silent_interval = 3.5 * char_time if baudrate <= 19200 else 0.00175
+    buffer = b""
+    while True:
+        timeout = silent_interval if buffer else None
+        readable, _, _ = select.select([master], [], [], timeout)
+        if readable:
+            buffer += os.read(master, 256)
+            continue
+
+        # Silent interval elapsed: the buffer holds one frame
+        frame, buffer = buffer, b""
+        if len(frame) < 4 or crc16(frame[:-2]) != struct.unpack("<H", frame[-2:])[0]:
+            print(f"dropped invalid frame {frame.hex()}")
+            continue
+        response = controller.handle(frame[:-2])
+        if response is None:
+            continue
+        response = with_crc(response)
+        # Receiving the request and sending the response take their wire time
+        time.sleep(len(response) * char_time)
+        os.write(master, response)
+        print(f"{frame.hex()} -> {response.hex()}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baudrate", type=int, default=19200)
+    parser.add_argument("--units", default="1", help="comma separated device IDs")
+    args = parser.parse_args()
+
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    print(f"Serial port: {os.ttyname(slave)} ({args.baudrate} baud)", flush=True)
+    controller = Controller([int(unit) for unit in args.units.split(",")])
+    try:
+        serve(master, controller, args.baudrate)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,524 @@
+"""Simulate a Heliotherm heat pump as a Modbus TCP server.
+
+Serves the register map the integration reads, IR 10-52, IR 60-75 and
+HR 100-150 (FC03, FC04, FC06, FC16), with simple dynamics: the compressor
+cycles between the return temperature limits of the heating curve, the hot
+water tank cools down and is reheated below its minimum, air source units
+defrost after a while, and operating hours and energy counters keep rising.
+Circuits or sensors listed in ``--absent`` report the sentinel -50.0 °C
+(raw -500) like a controller without them.
+
+Faults of slow or flaky links can be injected: a fixed response delay plus
+random jitter, lost responses and Modbus exception responses (6, slave
+device busy). ``--speed`` runs the dynamics faster than real time.
+
+With ``record`` every served request is kept in ``transactions``, e.g. to
+count the transactions and bytes of a poll.
+
+The simulator can also be used from other scripts::
+
+    simulator = HeatPumpSimulator(units=[1], latency=0.05)
+    port = await simulator.async_start("127.0.0.1", 0)
+    ...
+    await simulator.async_stop()
+
+Usage: python scripts/simulator.py [--port 5020] [--units 1,2] [--latency S]
+       [--jitter S] [--loss P] [--exceptions P] [--speed X] [--absent mkr2,solar]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from array import array
+from dataclasses import dataclass
+import math
+import random
+import struct
+import sys
+import time
+
+INPUT_BASE = 10
+HOLDING_BASE = 100
+INPUT_ADDRESSES = set(range(10, 53)) | set(range(60, 76))
+HOLDING_ADDRESSES = set(range(100, 151))
+
+# Raw value of a missing sensor or circuit, -50.0 °C
+MISSING = -500 & 0xFFFF
+
+# Sensors reported as missing per absent circuit or component, as IR addresses
+ABSENT = {
+    "puffer": (14,),
+    "mkr1": (35, 46, 47),
+    "mkr2": (36, 48, 49),
+    "raum": (50,),
+    "solar": (51,),
+    "frischwasser": (31,),
+}
+
+# Modbus exception codes
+ILLEGAL_FUNCTION = 1
+ILLEGAL_DATA_ADDRESS = 2
+ILLEGAL_DATA_VALUE = 3
+SLAVE_DEVICE_BUSY = 6
+GATEWAY_TARGET_FAILED = 0x0B
+
+# Model time step in seconds
+STEP = 5.0
+
+# Heat capacities in J/K: 200 l hot water tank, 400 l heating water, and the
+# heat flow per K of supply-return spread at 0.25 l/s in W/K
+TANK_CAPACITY = 200 * 4186
+HEATING_CAPACITY = 400 * 4186
+FLOW_CAPACITY = 0.25 * 4186
+
+
+@dataclass(frozen=True)
+class Transaction:
+    """A request served by the simulator, with the bytes of both ADUs."""
+
+    unit: int
+    function: int
+    address: int
+    count: int
+    request_bytes: int
+    response_bytes: int
+
+
+def describe(pdu: bytes) -> tuple[int, int]:
+    """Return address and register count of a request PDU."""
+    if len(pdu) < 5:
+        return 0, 0
+    address, count = struct.unpack_from(">HH", pdu, 1)
+    return address, 1 if pdu[0] == 6 else count
+
+
+class HeatPumpModel:
+    """Registers and thermal state of one simulated heat pump."""
+
+    def __init__(self, unit: int, absent=(), seed: int | None = None) -> None:
+        self.unit = unit
+        self.random = random.Random(seed)
+        self.input = array("H", [0]) * (76 - INPUT_BASE)
+        self.holding = array("H", [0]) * (151 - HOLDING_BASE)
+        self.missing = {address for name in absent for address in ABSENT[name]}
+
+        # Setpoints (HR, raw 0.1 °C), see registers.py
+        self._set_holding(100, 1)  # Betriebsart Auto
+        self._set_holding(101, 215)  # Raum soll
+        self._set_holding(102, 300)  # RL soll override value
+        self._set_holding(105, 500)  # WW max
+        self._set_holding(106, 450)  # WW min
+        self._set_holding(107, 1)
+        self._set_holding(108, 210)
+        self._set_holding(112, 1)
+        self._set_holding(113, 210)
+        for address, value in zip(range(135, 147), (160, 250, 320, 400) * 3):
+            self._set_holding(address, value)
+
+        # Simulated time in seconds and thermal state in °C
+        self.time = 0.0
+        self.outdoor = 5.0 + unit
+        self.supply = 30.0
+        self.return_ = 28.0
+        self.tank = 48.0
+        self.room = 21.0
+        self.compressor = False
+        self.hot_water = False
+        self.defrost = 0.0
+        self.run_time = 0.0
+        self.off_time = 600.0
+        self.since_defrost = 0.0
+        # Counters: operating seconds, energy in Wh
+        self.seconds_hot_water = 1234 * 3600.0
+        self.seconds_heating = 5678 * 3600.0
+        self.heat_heating = 12_345_000.0
+        self.power_heating = 3_456_000.0
+        self.heat_hot_water = 2_345_000.0
+        self.power_hot_water = 789_000.0
+        self._update_registers(0.0, 0.0)
+
+    def _set_holding(self, address: int, value: int) -> None:
+        self.holding[address - HOLDING_BASE] = value & 0xFFFF
+
+    def _holding(self, address: int) -> float:
+        """Return a holding register as signed value in °C."""
+        value = self.holding[address - HOLDING_BASE]
+        return (value - 0x10000 if value & 0x8000 else value) / 10
+
+    def return_target(self) -> float:
+        """Return the return temperature target from the heating curve."""
+        limit = self._holding(135)
+        # RL soll override (HR 103) replaces the heating curve
+        if self.holding[103 - HOLDING_BASE]:
+            return self._holding(102)
+        if self.outdoor >= limit:
+            return 20.0
+        # Linear between +20 °C (ohg), 0 °C and -20 °C (uhg)
+        points = ((20.0, self._holding(136)), (0.0, self._holding(137)))
+        if self.outdoor < 0:
+            points = ((0.0, self._holding(137)), (-20.0, self._holding(138)))
+        (x0, y0), (x1, y1) = points
+        outdoor = max(-20.0, min(20.0, self.outdoor))
+        return y0 + (y1 - y0) * (outdoor - x0) / (x1 - x0)
+
+    def advance(self, seconds: float) -> None:
+        """Run the dynamics for a span of simulated time."""
+        while seconds > 0:
+            dt = min(STEP, seconds)
+            self._step(dt)
+            seconds -= dt
+
+    def _step(self, dt: float) -> None:
+        self.time += dt
+        # Daily cycle of the outdoor temperature around 5 °C
+        day = 2 * math.pi * self.time / 86400
+        self.outdoor = (
+            5.0 + self.unit - 6.0 * math.cos(day) + self.random.gauss(0, 0.05)
+        )
+
+        mode = self.holding[0]
+        target = self.return_target()
+        hot_water_min, hot_water_max = self._holding(106), self._holding(105)
+
+        # Hot water has priority and ends at the upper limit
+        if self.tank < hot_water_min and mode != 0:
+            self.hot_water = True
+        if self.hot_water and self.tank >= hot_water_max:
+            self.hot_water = False
+
+        # Compressor with 4 K hysteresis and minimum run and pause times
+        demand = self.hot_water or (mode not in (0, 3) and self.return_ < target - 2)
+        satisfied = not self.hot_water and self.return_ > target + 2
+        if not self.compressor and demand and self.off_time >= 300:
+            self.compressor, self.run_time = True, 0.0
+        elif self.compressor and (satisfied or mode == 0) and self.run_time >= 600:
+            self.compressor, self.off_time = False, 0.0
+
+        if self.compressor:
+            self.run_time += dt
+            self.since_defrost += dt
+            # Air source units defrost every 45 minutes below 7 °C
+            if not self.defrost and self.outdoor < 7 and self.since_defrost > 2700:
+                self.defrost, self.since_defrost = 300.0, 0.0
+        else:
+            self.off_time += dt
+        if self.defrost:
+            self.defrost = max(0.0, self.defrost - dt)
+
+        heating = self.compressor and not self.defrost
+        heat_power = 0.0
+        electric_power = 0.0
+        if self.compressor:
+            cop = max(1.5, 5.5 + 0.1 * self.outdoor - 0.05 * (self.supply - 30))
+            heat_power = 6000.0 if heating else -2000.0
+            electric_power = abs(heat_power) / cop if heating else 1500.0
+        if self.hot_water and heating:
+            self.tank += heat_power * dt / TANK_CAPACITY
+            self.seconds_hot_water += dt
+            self.heat_hot_water += heat_power * dt / 3600
+            self.power_hot_water += electric_power * dt / 3600
+        else:
+            if heating:
+                self.seconds_heating += dt
+                self.heat_heating += heat_power * dt / 3600
+                self.power_heating += electric_power * dt / 3600
+            # Heating water: heated by the compressor, cooled by the house
+            loss = 150.0 * (self.return_ - self.outdoor)
+            self.return_ += (heat_power - loss) * dt / HEATING_CAPACITY
+        # Standby losses and the occasional tapping of the hot water tank
+        self.tank -= dt * (0.0003 + 0.05 * (self.random.random() < 0.01))
+        self.supply = self.return_ + heat_power / FLOW_CAPACITY
+        self.room += dt * (0.0001 * (self.return_ - 25) - 0.00005 * (self.room - 21))
+        self._update_registers(heat_power, electric_power)
+
+    def _update_registers(self, heat_power: float, electric_power: float) -> None:
+        """Write the state into the input registers."""
+        running = self.compressor
+
+        def tenth(value: float) -> int:
+            return round(10 * value) & 0xFFFF
+
+        cop = heat_power / electric_power if heat_power > 0 else 0.0
+        values = {
+            10: tenth(self.outdoor),
+            11: tenth(self.tank),
+            12: tenth(self.supply),
+            13: tenth(self.return_),
+            14: tenth(self.return_ + 1),
+            15: tenth(self.outdoor - 0.5),
+            16: tenth(self.outdoor - (4 if running else 0.5)),
+            17: tenth(self.outdoor - (1 if running else 0)),
+            18: tenth(self.outdoor - (8 if running else 0)),
+            19: tenth(self.supply + (5 if running else 0)),
+            20: tenth(self.supply + (35 if running else 0)),
+            21: tenth(8.5 if running else 12.0),
+            22: tenth(24.0 if running else 14.0),
+            23: 1,
+            24: 0 if self.hot_water else int(running),
+            25: int(running),
+            26: 0,
+            27: 1 if self.defrost else 0,
+            28: 170 if running else 0,
+            29: 70 + (int(self.outdoor < 0) * 15) if running else 0,
+            30: tenth(cop),
+            31: tenth(self.tank - 3),
+            32: 1,
+            33: tenth(self.outdoor + 0.3),
+            34: tenth(self.return_target()),
+            35: tenth(self.return_target() - 3),
+            36: tenth(self.return_target() - 3),
+            37: int(running),
+            38: int(self.hot_water),
+            39: 0,
+            40: 250 if running else 0,
+            41: 30 if self.hot_water else 20 if running else 0,
+            46: tenth(self.supply - 4),
+            47: tenth(self.return_ - 3),
+            48: tenth(self.supply - 4),
+            49: tenth(self.return_ - 3),
+            50: tenth(self.room),
+            51: tenth(self.outdoor + 10),
+            52: 150 if running else 0,
+        }
+        # 32-bit values, high word first
+        counters = {
+            42: self.seconds_hot_water / 3600,
+            44: self.seconds_heating / 3600,
+            60: self.heat_heating / 1000,
+            62: self.power_heating / 1000,
+            64: self.heat_hot_water / 1000,
+            66: self.power_hot_water / 1000,
+            68: (self.power_heating + self.power_hot_water) / 1000,
+            70: electric_power,
+            72: (self.heat_heating + self.heat_hot_water) / 1000,
+            74: max(heat_power, 0) / 100,
+        }
+        for address, value in counters.items():
+            value = int(value)
+            values[address] = (value >> 16) & 0xFFFF
+            values[address + 1] = value & 0xFFFF
+        for address, value in values.items():
+            if address in self.missing:
+                value = MISSING
+            self.input[address - INPUT_BASE] = value
+
+    def write(self, address: int, values) -> None:
+        """Apply a write to the holding registers."""
+        for offset, value in enumerate(values):
+            self._set_holding(address + offset, value)
+        # HR 128 acknowledges a fault, it always reads 0
+        self._set_holding(128, 0)
+
+    def handle(self, pdu: bytes) -> bytes:
+        """Return the response PDU to a request PDU."""
+        function = pdu[0]
+        try:
+            if function in (3, 4):
+                address, count = struct.unpack_from(">HH", pdu, 1)
+                valid = INPUT_ADDRESSES if function == 4 else HOLDING_ADDRESSES
+                if not 1 <= count <= 125:
+                    return bytes((function | 0x80, ILLEGAL_DATA_VALUE))
+                if not valid.issuperset(range(address, address + count)):
+                    return bytes((function | 0x80, ILLEGAL_DATA_ADDRESS))
+                registers, base = (
+                    (self.input, INPUT_BASE)
+                    if function == 4
+                    else (self.holding, HOLDING_BASE)
+                )
+                data = registers[address - base : address - base + count]
+                if sys.byteorder == "little":
+                    data.byteswap()
+                return struct.pack(">BB", function, 2 * count) + data.tobytes()
+            if function == 6:
+                address, value = struct.unpack_from(">HH", pdu, 1)
+                if address not in HOLDING_ADDRESSES:
+                    return bytes((function | 0x80, ILLEGAL_DATA_ADDRESS))
+                self.write(address, (value,))
+                return pdu[:5]
+            if function == 16:
+                address, count, _ = struct.unpack_from(">HHB", pdu, 1)
+                if not HOLDING_ADDRESSES.issuperset(range(address, address + count)):
+                    return bytes((function | 0x80, ILLEGAL_DATA_ADDRESS))
+                self.write(address, struct.unpack_from(f">{count}H", pdu, 6))
+                return pdu[:5]
+        except struct.error:
+            return bytes((function | 0x80, ILLEGAL_DATA_VALUE))
+        return bytes((function | 0x80, ILLEGAL_FUNCTION))
+
+
+class HeatPumpSimulator:
+    """Modbus TCP server for one or more simulated heat pumps."""
+
+    def __init__(
+        self,
+        units=(1,),
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        loss: float = 0.0,
+        exceptions: float = 0.0,
+        speed: float = 1.0,
+        absent=(),
+        seed: int | None = None,
+        record: bool = False,
+    ) -> None:
+        self.models = {
+            unit: HeatPumpModel(unit, absent, None if seed is None else seed + unit)
+            for unit in units
+        }
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.exceptions = exceptions
+        self.speed = speed
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.dropped = 0
+        self.injected = 0
+        # Served requests, only kept with ``record``
+        self.record = record
+        self.transactions: list[Transaction] = []
+        self._started = time.monotonic()
+        self._server: asyncio.Server | None = None
+        self._connections: dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving, return the port (a free one for port 0)."""
+        self._server = await asyncio.start_server(self._async_serve, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def async_stop(self) -> None:
+        """Stop serving and close all connections."""
+        if self._server is not None:
+            self._server.close()
+            # Closing the transports ends the connection handlers with an EOF
+            for writer in self._connections:
+                writer.close()
+            await asyncio.gather(*self._connections.values())
+            await self._server.wait_closed()
+            self._server = None
+
+    def advance(self) -> None:
+        """Bring all models to the current time."""
+        now = time.monotonic()
+        elapsed = (now - self._started) * self.speed
+        self._started = now
+        for model in self.models.values():
+            model.advance(elapsed)
+
+    def respond(self, unit: int, pdu: bytes) -> bytes | None:
+        """Return the response PDU, None to drop the request."""
+        self.requests += 1
+        if self.loss and self.random.random() < self.loss:
+            self.dropped += 1
+            return None
+        model = self.models.get(unit)
+        if model is None:
+            return bytes((pdu[0] | 0x80, GATEWAY_TARGET_FAILED))
+        if self.exceptions and self.random.random() < self.exceptions:
+            self.injected += 1
+            return bytes((pdu[0] | 0x80, SLAVE_DEVICE_BUSY))
+        self.advance()
+        return model.handle(pdu)
+
+    async def _async_serve(self, reader, writer) -> None:
+        self._connections[writer] = asyncio.current_task()
+        sending: set[asyncio.Task] = set()
+        try:
+            while True:
+                header = await reader.readexactly(7)
+                transaction_id, _, length, unit = struct.unpack(">HHHB", header)
+                pdu = await reader.readexactly(length - 1)
+                response = self.respond(unit, pdu)
+                if self.record:
+                    self.transactions.append(
+                        Transaction(
+                            unit,
+                            pdu[0],
+                            *describe(pdu),
+                            len(header) + len(pdu),
+                            0 if response is None else 7 + len(response),
+                        )
+                    )
+                if response is None:
+                    continue
+                frame = struct.pack(">HHHB", transaction_id, 0, len(response) + 1, unit)
+                delay = self.latency + self.random.uniform(0, self.jitter)
+                if not delay:
+                    writer.write(frame + response)
+                    continue
+                # Delayed responses overlap like on a real link
+                send = asyncio.create_task(
+                    self._async_send_later(writer, delay, frame + response)
+                )
+                sending.add(send)
+                send.add_done_callback(sending.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for send in sending:
+                send.cancel()
+            writer.close()
+            self._connections.pop(writer, None)
+
+    @staticmethod
+    async def _async_send_later(writer, delay: float, frame: bytes) -> None:
+        await asyncio.sleep(delay)
+        if not writer.is_closing():
+            writer.write(frame)
+
+
+async def async_main(args) -> None:
+    simulator = HeatPumpSimulator(
+        units=[int(unit) for unit in args.units.split(",")],
+        latency=args.latency,
+        jitter=args.jitter,
+        loss=args.loss,
+        exceptions=args.exceptions,
+        speed=args.speed,
+        absent=[name for name in args.absent.split(",") if name],
+        seed=args.seed,
+    )
+    port = await simulator.async_start(args.host, args.port)
+    print(f"Simulating units {args.units} on {args.host}:{port}", flush=True)
+    try:
+        while True:
+            await asyncio.sleep(60)
+            simulator.advance()
+            for unit, model in simulator.models.items():
+                print(
+                    f"unit {unit}: outdoor {model.outdoor:.1f}"
+                    f" return {model.return_:.1f} tank {model.tank:.1f}"
+                    f" compressor {int(model.compressor)}"
+                    f" defrost {int(bool(model.defrost))}, {simulator.requests}"
+                    f" requests, {simulator.dropped} dropped,"
+                    f" {simulator.injected} exceptions",
+                    flush=True,
+                )
+    finally:
+        await simulator.async_stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    parser.add_argument("--units", default="1", help="comma separated device IDs")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--loss", type=float, default=0.0, help="probability")
+    parser.add_argument("--exceptions", type=float, default=0.0, help="probability")
+    parser.add_argument("--speed", type=float, default=1.0, help="time factor")
+    parser.add_argument(
+        "--absent", default="", help=f"comma separated, of {', '.join(ABSENT)}"
+    )
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+    try:
+        asyncio.run(async_main(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""Poll many simulated heat pumps from one Home Assistant and watch the loop.
+
+Starts N simulators and sets up N hubs in one in-process Home Assistant (see
+ha_harness.py), then polls for the given duration. Recorded:
+
+- event loop lag: how late a 100 ms timer fires, as percentiles
+- poll latency: duration of every refresh of every hub, as percentiles
+- memory: resident set size and Python objects at start and end
+- file descriptors: open descriptors at start, peak and end
+
+``--reload`` reloads every config entry at that interval, so leaks in the
+connect and close cycle show up as growing memory or descriptors. A progress
+line is printed every ``--report`` seconds and a summary at the end,
+optionally also as JSON.
+
+Usage: python scripts/soak.py [--hubs N] [--duration S] [--scan-interval S]
+       [--reload S] [--latency S] [--loss P] [--json FILE]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+
+from ha_harness import DOMAIN, async_add_hub, async_home_assistant
+from simulator import HeatPumpSimulator
+
+LAG_INTERVAL = 0.1
+
+
+def percentiles(samples: list[float]) -> dict:
+    """Return p50, p95, p99 and max of samples in milliseconds."""
+    if len(samples) < 2:
+        value = samples[0] * 1000 if samples else 0.0
+        return {"p50": value, "p95": value, "p99": value, "max": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": cuts[49] * 1000,
+        "p95": cuts[94] * 1000,
+        "p99": cuts[98] * 1000,
+        "max": max(samples) * 1000,
+    }
+
+
+def resident_memory() -> int:
+    """Return the resident set size in bytes."""
+    with open("/proc/self/status", encoding="ascii") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def open_descriptors() -> int:
+    """Return the number of open file descriptors."""
+    return len(os.listdir("/proc/self/fd"))
+
+
+class Recorder:
+    """Samples of loop lag, poll latency and resource usage."""
+
+    def __init__(self) -> None:
+        self.lag: list[float] = []
+        self.polls: list[float] = []
+        self.failed_polls = 0
+        self.peak_descriptors = 0
+        self.start = {"rss": resident_memory(), "objects": len(gc.get_objects())}
+        self.start["fds"] = open_descriptors()
+
+    async def async_watch_loop(self) -> None:
+        """Measure how late a periodic timer fires."""
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + LAG_INTERVAL
+            await asyncio.sleep(LAG_INTERVAL)
+            self.lag.append(max(0.0, loop.time() - due))
+
+    def instrument(self, hub) -> None:
+        """Time every refresh of a hub."""
+        refresh = hub.async_refresh_modbus_data
+
+        async def timed_refresh(*args) -> None:
+            updates = [unit.last_update for unit in hub.units]
+            started = time.perf_counter()
+            await refresh(*args)
+            self.polls.append(time.perf_counter() - started)
+            # Units only get a new update time from a successful read
+            if any(
+                unit.last_update == update for unit, update in zip(hub.units, updates)
+            ):
+                self.failed_polls += 1
+
+        hub.async_refresh_modbus_data = timed_refresh
+
+    def sample(self) -> None:
+        self.peak_descriptors = max(self.peak_descriptors, open_descriptors())
+
+    def summary(self) -> dict:
+        gc.collect()
+        return {
+            "loop_lag_ms": percentiles(self.lag),
+            "poll_latency_ms": percentiles(self.polls),
+            "polls": len(self.polls),
+            "failed_polls": self.failed_polls,
+            "rss_start_mb": self.start["rss"] / 2**20,
+            "rss_end_mb": resident_memory() / 2**20,
+            "objects_start": self.start["objects"],
+            "objects_end": len(gc.get_objects()),
+            "fds_start": self.start["fds"],
+            "fds_peak": self.peak_descriptors,
+            "fds_end": open_descriptors(),
+        }
+
+
+async def async_run(args) -> dict:
+    """Run the soak test and return its summary."""
+    simulators = [
+        HeatPumpSimulator(
+            units=[1], latency=args.latency, loss=args.loss, speed=60, seed=index
+        )
+        for index in range(args.hubs)
+    ]
+    ports = [await simulator.async_start() for simulator in simulators]
+
+    async with async_home_assistant() as hass:
+        options = {"scan_interval": args.scan_interval, "timeout": args.timeout}
+        hubs = [
+            await async_add_hub(
+                hass, f"soak{index}", "127.0.0.1", port, options=options
+            )
+            for index, port in enumerate(ports)
+        ]
+        recorder = Recorder()
+        for hub in hubs:
+            recorder.instrument(hub)
+        watcher = asyncio.create_task(recorder.async_watch_loop())
+
+        started = time.monotonic()
+        next_reload = started + args.reload if args.reload else None
+        while (elapsed := time.monotonic() - started) < args.duration:
+            await asyncio.sleep(min(args.report, args.duration - elapsed))
+            recorder.sample()
+            if next_reload is not None and time.monotonic() >= next_reload:
+                for entry in hass.config_entries.async_entries(DOMAIN):
+                    await hass.config_entries.async_reload(entry.entry_id)
+                # Reloading creates new hubs
+                for entry in hass.config_entries.async_entries(DOMAIN):
+                    recorder.instrument(hass.data[DOMAIN][entry.data["name"]]["hub"])
+                next_reload += args.reload
+            lag = percentiles(recorder.lag)
+            print(
+                f"{time.monotonic() - started:7.0f}s  polls {len(recorder.polls)}"
+                f"  lag p99 {lag['p99']:.1f} ms"
+                f"  rss {resident_memory() / 2**20:.1f} MB"
+                f"  fds {open_descriptors()}",
+                flush=True,
+            )
+
+        watcher.cancel()
+        summary = recorder.summary()
+    for simulator in simulators:
+        await simulator.async_stop()
+    summary["hubs"] = args.hubs
+    summary["duration_s"] = args.duration
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hubs", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=3600, help="seconds")
+    parser.add_argument("--scan-interval", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=3)
+    parser.add_argument("--reload", type=float, default=0, help="seconds, 0 = off")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--report", type=float, default=60, help="seconds")
+    parser.add_argument("--json", help="write the summary to this file")
+    args = parser.parse_args()
+
+    summary = asyncio.run(async_run(args))
+    print(f"\n{args.hubs} hubs, {args.duration:.0f} s, {summary['polls']} polls")
+    for name in ("loop_lag_ms", "poll_latency_ms"):
+        values = summary[name]
+        print(
+            f"{name:<16} p50 {values['p50']:8.1f}  p95 {values['p95']:8.1f}"
+            f"  p99 {values['p99']:8.1f}  max {values['max']:8.1f}"
+        )
+    print(f"failed polls     {summary['failed_polls']}")
+    print(
+        f"memory           {summary['rss_start_mb']:.1f} -> "
+        f"{summary['rss_end_mb']:.1f} MB RSS, {summary['objects_start']} -> "
+        f"{summary['objects_end']} objects"
+    )
+    print(
+        f"descriptors      {summary['fds_start']} -> {summary['fds_end']}"
+        f" (peak {summary['fds_peak']})"
+    )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
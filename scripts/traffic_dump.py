@@ -0,0 +1,74 @@
+"""Print a Modbus traffic log written with the option traffic_log.
+
+Reads the log and its rotated files, oldest first, one line per transaction.
+Only needs the standard library, so logs copied from an installation can be
+read without Home Assistant.
+
+Usage: python scripts/traffic_dump.py FILE [--device-id N] [--address A]
+       [--summary]
+"""
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from datetime import datetime
+import importlib.util
+import os
+import sys
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded from its file, importing the package would need Home Assistant
+_spec = importlib.util.spec_from_file_location(
+    "traffic_log",
+    os.path.join(REPOSITORY, "custom_components", "ha_heliotherm", "traffic_log.py"),
+)
+traffic_log = sys.modules["traffic_log"] = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(traffic_log)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("--device-id", type=int)
+    parser.add_argument("--address", type=int, help="only blocks containing it")
+    parser.add_argument("--summary", action="store_true", help="counts only")
+    args = parser.parse_args()
+
+    counts = Counter()
+    errors = Counter()
+    for record in traffic_log.iter_traffic(args.file):
+        if args.device_id is not None and record.device_id != args.device_id:
+            continue
+        if args.address is not None and not (
+            record.address <= args.address < record.address + record.count
+        ):
+            continue
+        key = (record.device_id, record.function, record.address)
+        counts[key] += 1
+        errors[key] += record.error
+        if args.summary:
+            continue
+        time = datetime.fromtimestamp(record.timestamp).isoformat(
+            sep=" ", timespec="milliseconds"
+        )
+        values = " ".join(map(str, record.registers))
+        if record.error:
+            values = f"ERROR {values}".rstrip()
+        print(
+            f"{time}  unit {record.device_id}  FC{record.function:02d}"
+            f"  {record.address} x{record.count}  {values}"
+        )
+
+    if args.summary:
+        print(f"{'unit':>4} {'FC':>4} {'address':>8} {'transactions':>13} {'errors':>7}")
+        for (device_id, function, address), count in sorted(counts.items()):
+            print(
+                f"{device_id:>4} {function:>4} {address:>8} {count:>13}"
+                f" {errors[device_id, function, address]:>7}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Count the Modbus transactions of polls and writes against a budget.
+
+On slow links (e.g. the RCG interface) the number of transactions and bytes
+per poll and per write matters most. Every scenario runs the integration in
+an in-process Home Assistant (see ha_harness.py) against the recording
+simulator and counts the transactions, registers and bytes (Modbus TCP ADUs
+in both directions) it causes. A scenario over any of its budgets fails the
+run with exit code 1.
+
+Usage: python scripts/transaction_budget.py [--verbose]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from ha_harness import async_add_hub, async_home_assistant
+from simulator import HeatPumpSimulator
+
+# Budget per scenario: transactions, registers, bytes. A write costs the
+# write itself plus the reads of the refresh after it. The comments give the
+# cost before the budgets were introduced, when every poll read the three
+# blocks IR 10-52, IR 60-75 and HR 100-150 (110 registers) and every value
+# was written with FC06 and followed by a full refresh.
+BUDGETS = {
+    # Was (3, 110, 283): 3 block reads
+    "idle_poll": (3, 106, 275),
+    # Was (4, 111, 307): 1 write plus 3 block reads
+    "single_setter": (4, 107, 299),
+    # New, writes could not be confirmed before
+    "single_setter_confirmed": (5, 108, 322),
+    # Was (5, 112, 331): 2 writes plus 3 block reads
+    "set_ww_bereitung": (4, 108, 304),
+    # Was (48, 1332, 3684) as 12 setters: 12 writes plus 36 block reads
+    "bulk_profile": (4, 118, 324),
+}
+
+
+def scenarios(hub) -> dict:
+    """Return the scenarios as coroutine functions by name."""
+
+    async def idle_poll() -> None:
+        await hub.async_refresh_modbus_data()
+
+    async def single_setter() -> None:
+        await hub.async_write_value("climate_hkr_raum_soll", {"temperature": 22.0})
+
+    async def single_setter_confirmed() -> None:
+        await hub.async_write_parameters(
+            {"climate_hkr_raum_soll": {"temperature": 22.5}}, confirm_timeout=5
+        )
+
+    async def set_ww_bereitung() -> None:
+        await hub.async_write_value(
+            "climate_ww_bereitung", {"target_temp_high": 52.0, "target_temp_low": 44.0}
+        )
+
+    async def bulk_profile() -> None:
+        # Heating curves of all circuits, as a profile switch would write them
+        await hub.async_apply_profile(
+            {
+                f"{circuit}_{key}": value
+                for circuit in ("hkr", "mkr1", "mkr2")
+                for key, value in (
+                    ("heizgrenze", 15.0),
+                    ("rlt_soll_ohg", 26.0),
+                    ("rlt_soll_0", 33.0),
+                    ("rlt_soll_uhg", 41.0),
+                )
+            }
+        )
+
+    return {
+        "idle_poll": idle_poll,
+        "single_setter": single_setter,
+        "single_setter_confirmed": single_setter_confirmed,
+        "set_ww_bereitung": set_ww_bereitung,
+        "bulk_profile": bulk_profile,
+    }
+
+
+async def async_run(verbose: bool) -> dict:
+    """Run the scenarios and return transactions, registers and bytes by name."""
+    simulator = HeatPumpSimulator(units=[1], seed=1, record=True)
+    port = await simulator.async_start()
+    results = {}
+    async with async_home_assistant() as hass:
+        # Polls of the scheduler must not show up in the scenarios
+        hub = await async_add_hub(
+            hass, "budget", "127.0.0.1", port, options={"scan_interval": 3600}
+        )
+        while not hub.data:
+            await asyncio.sleep(0.05)
+        await hass.async_block_till_done()
+
+        for name, scenario in scenarios(hub).items():
+            simulator.transactions.clear()
+            await scenario()
+            await hass.async_block_till_done()
+            transactions = list(simulator.transactions)
+            results[name] = (
+                len(transactions),
+                sum(item.count for item in transactions),
+                sum(item.request_bytes + item.response_bytes for item in transactions),
+            )
+            if verbose:
+                for item in transactions:
+                    print(
+                        f"  {name}: FC{item.function:02d} {item.address}"
+                        f" x{item.count} {item.request_bytes}+{item.response_bytes} B"
+                    )
+    await simulator.async_stop()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--verbose", action="store_true", help="list transactions")
+    args = parser.parse_args()
+
+    results = asyncio.run(async_run(args.verbose))
+    failed = False
+    print(f"{'scenario':<26} {'transactions':>14} {'registers':>12} {'bytes':>12}")
+    for name, measured in results.items():
+        budget = BUDGETS[name]
+        over = any(value > limit for value, limit in zip(measured, budget))
+        failed |= over
+        columns = " ".join(
+            f"{f'{value}/{limit}':>{width}}"
+            for value, limit, width in zip(measured, budget, (14, 12, 12))
+        )
+        print(f"{name:<26} {columns}  {'OVER BUDGET' if over else 'ok'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""Fixtures for the tests, which run against scripts/simulator.py."""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The integration is imported as custom_components.ha_heliotherm, the
+# simulator and the Home Assistant harness from scripts/
+sys.path[:0] = [REPOSITORY, os.path.join(REPOSITORY, "scripts")]
+
+from simulator import HeatPumpSimulator  # noqa: E402
+
+
+@pytest.fixture
+def simulator():
+    """Yield a simulator serving on an event loop thread of its own.
+
+    Blocking clients can talk to it from the test. The dynamics are frozen,
+    so registers only change by writes.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    simulator = HeatPumpSimulator(units=[1], speed=0, seed=1, record=True)
+    simulator.port = asyncio.run_coroutine_threadsafe(
+        simulator.async_start(), loop
+    ).result()
+    try:
+        yield simulator
+    finally:
+        asyncio.run_coroutine_threadsafe(simulator.async_stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,33 @@
+"""Run the benchmarks of scripts/benchmark.py against the checked-in baseline.
+
+After a change that is slower or faster on purpose, store a new baseline
+with ``python scripts/benchmark.py --save``.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+import benchmark
+
+# Allowed increase over the baseline. Times are compared relative to the
+# reference workload, which leaves room for differences between machines
+# and Python versions; memory per cycle barely varies.
+TOLERANCE = {"us": 0.5, "B": 0.25}
+
+with open(benchmark.BASELINE, encoding="utf-8") as file:
+    BASELINE = json.load(file)
+
+
+@pytest.fixture(scope="module")
+def changes() -> dict:
+    """Return the change of every benchmark against the baseline."""
+    return benchmark.compare(asyncio.run(benchmark.async_run(300)), BASELINE)
+
+
+@pytest.mark.parametrize("name", [name for name in BASELINE if name != "reference"])
+def test_no_regression(changes, name):
+    """No benchmark got slower or allocates more than the baseline allows."""
+    assert changes[name] <= TOLERANCE[BASELINE[name]["unit"]]
@@ -0,0 +1,96 @@
+"""Tests of the native Modbus TCP codec against the simulator."""
+from __future__ import annotations
+
+from array import array
+import struct
+
+import pytest
+
+from custom_components.ha_heliotherm.codec import ModbusTcpCodecClient
+
+ILLEGAL_DATA_ADDRESS = 2
+GATEWAY_TARGET_FAILED = 0x0B
+
+
+@pytest.fixture
+def client(simulator):
+    """Yield a client connected to the simulator."""
+    client = ModbusTcpCodecClient("127.0.0.1", simulator.port, 2)
+    assert client.connect()
+    yield client
+    client.close()
+
+
+def _holding(simulator, address: int, count: int = 1) -> list[int]:
+    """Return holding registers of the simulated heat pump."""
+    return simulator.models[1].holding[address - 100 : address - 100 + count].tolist()
+
+
+def test_read_into(simulator, client):
+    """Register data is decoded into the target, in host byte order."""
+    out = array("H", [0]) * 51
+    assert client.read_into("read_holding_registers", 100, 51, 1, memoryview(out))
+    assert out.tolist() == _holding(simulator, 100, 51)
+
+    out = array("H", [0]) * 16
+    assert client.read_into("read_input_registers", 60, 16, 1, memoryview(out))
+    assert out.tolist() == simulator.models[1].input[50:66].tolist()
+
+
+def test_exception_responses(client):
+    """Exception responses are reported and leave the connection usable."""
+    assert client.read_holding_registers(151).exception_code == ILLEGAL_DATA_ADDRESS
+    assert (
+        client.read_input_registers(10, device_id=5).exception_code
+        == GATEWAY_TARGET_FAILED
+    )
+    assert client.write_register(99, 1).exception_code == ILLEGAL_DATA_ADDRESS
+    assert client.connected
+    assert not client.read_holding_registers(101).isError()
+
+
+def test_writes(simulator, client):
+    """Single and multiple register writes reach the device."""
+    assert not client.write_register(101, 205).isError()
+    assert not client.write_registers(135, [150, 260, 330]).isError()
+    assert _holding(simulator, 101) == [205]
+    assert client.read_holding_registers(135, 3).registers == [150, 260, 330]
+
+
+def test_stale_response_is_skipped(simulator, client):
+    """A response to another transaction, e.g. one that timed out, is skipped."""
+    stale_id = (client._transaction_id + 100) & 0xFFFF
+    client._socket.sendall(struct.pack(">HHHBBHH", stale_id, 0, 6, 1, 3, 135, 12))
+    assert client.read_holding_registers(101).registers == _holding(simulator, 101)
+    assert client.read_holding_registers(106).registers == _holding(simulator, 106)
+
+
+def test_pipelined_reads_match_transaction_ids(simulator, client):
+    """Responses arriving out of order land in the target of their request."""
+    # Random delays per response reorder them
+    simulator.latency = 0.001
+    simulator.jitter = 0.05
+    targets = [array("H", [0]) * count for count in (3, 7, 5, 2, 9)]
+    requests = [
+        ("read_holding_registers", address, len(target), 1, memoryview(target))
+        for address, target in zip((100, 103, 110, 128, 135), targets)
+    ]
+    for _ in range(5):
+        assert client.read_pipelined(requests) == [True] * len(requests)
+        for (_, address, count, _, _), target in zip(requests, targets):
+            assert target.tolist() == _holding(simulator, address, count)
+
+    served = [item.address for item in simulator.transactions[-len(requests) :]]
+    assert sorted(served) == [100, 103, 110, 128, 135]
+
+
+def test_pipelined_exception_response(client):
+    """An exception response fails only its own request."""
+    good = array("H", [0]) * 2
+    bad = array("H", [0]) * 2
+    requests = [
+        ("read_holding_registers", 101, 2, 1, memoryview(good)),
+        ("read_holding_registers", 150, 2, 1, memoryview(bad)),
+    ]
+    assert client.read_pipelined(requests) == [True, False]
+    assert client.connected
@@ -0,0 +1,131 @@
+"""Tests of the Modbus proxy: served reads and checked writes."""
+from __future__ import annotations
+
+import asyncio
+import socket
+
+import pytest
+
+from homeassistant.setup import async_setup_component
+
+from custom_components.ha_heliotherm.codec import ModbusTcpCodecClient
+from ha_harness import async_add_hub, async_home_assistant
+from simulator import HeatPumpSimulator
+
+ILLEGAL_DATA_ADDRESS = 2
+ILLEGAL_DATA_VALUE = 3
+
+WRITE_FUNCTIONS = (6, 16)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _async_with_proxy(test) -> None:
+    """Run ``test(hub, simulator, client)`` with a client of a started proxy."""
+    simulator = HeatPumpSimulator(units=[1], speed=0, seed=1, record=True)
+    port = await simulator.async_start()
+    proxy_port = _free_port()
+    try:
+        async with async_home_assistant() as hass:
+            # Refused setpoint writes create a notification
+            await async_setup_component(hass, "persistent_notification", {})
+            hub = await async_add_hub(
+                hass,
+                "proxy",
+                "127.0.0.1",
+                port,
+                options={"scan_interval": 3600, "proxy_port": proxy_port},
+            )
+            while not hub.data:
+                await asyncio.sleep(0.05)
+            client = ModbusTcpCodecClient("127.0.0.1", proxy_port, 2)
+
+            async def call(method, *args):
+                # The client blocks, the proxy runs on this loop
+                return await hass.async_add_executor_job(
+                    getattr(client, method), *args
+                )
+
+            try:
+                await test(hub, simulator, call)
+            finally:
+                client.close()
+    finally:
+        await simulator.async_stop()
+
+
+def _writes(simulator) -> list:
+    return [
+        item for item in simulator.transactions if item.function in WRITE_FUNCTIONS
+    ]
+
+
+def test_reads_are_served_from_the_last_poll():
+    """Reads of the whole register spans are answered, others are refused."""
+
+    async def test(hub, simulator, call):
+        reads = len(simulator.transactions)
+        result = await call("read_holding_registers", 100, 51)
+        assert result.registers == simulator.models[1].holding.tolist()
+        result = await call("read_input_registers", 10, 43)
+        assert result.registers == simulator.models[1].input[:43].tolist()
+        assert len(simulator.transactions) == reads
+
+        result = await call("read_input_registers", 53, 1)
+        assert result.exception_code == ILLEGAL_DATA_ADDRESS
+        result = await call("read_holding_registers", 150, 2)
+        assert result.exception_code == ILLEGAL_DATA_ADDRESS
+
+    asyncio.run(_async_with_proxy(test))
+
+
+@pytest.mark.parametrize(
+    ("method", "address", "values", "exception_code"),
+    [
+        ("write_register", 109, 1, ILLEGAL_DATA_ADDRESS),
+        ("write_register", 147, 1, ILLEGAL_DATA_ADDRESS),
+        ("write_registers", 146, [200, 1], ILLEGAL_DATA_ADDRESS),
+        ("write_register", 100, 65535, ILLEGAL_DATA_VALUE),
+        ("write_register", 135, 301, ILLEGAL_DATA_VALUE),
+        ("write_register", 117, 0, ILLEGAL_DATA_VALUE),
+        ("write_registers", 100, [1, 251], ILLEGAL_DATA_VALUE),
+        # Return temperature setpoint without its override
+        ("write_register", 102, 350, ILLEGAL_DATA_VALUE),
+        ("write_registers", 101, [215, 350], ILLEGAL_DATA_VALUE),
+        ("write_registers", 102, [350, 0], ILLEGAL_DATA_VALUE),
+    ],
+)
+def test_invalid_writes_are_refused(method, address, values, exception_code):
+    """Writes outside the register table or its ranges never reach the device."""
+
+    async def test(hub, simulator, call):
+        holding = simulator.models[1].holding.tolist()
+        result = await call(method, address, values)
+        assert result.exception_code == exception_code
+        assert not _writes(simulator)
+        assert simulator.models[1].holding.tolist() == holding
+
+    asyncio.run(_async_with_proxy(test))
+
+
+def test_valid_writes_are_forwarded():
+    """Valid writes reach the device and the hub refreshes its registers."""
+
+    async def test(hub, simulator, call):
+        assert not (await call("write_registers", 135, [150, 260])).isError()
+        assert not (await call("write_register", 129, -30 & 0xFFFF)).isError()
+        # The setpoint passes along with its override
+        assert not (await call("write_registers", 102, [350, 1])).isError()
+        assert simulator.models[1].holding[35:37].tolist() == [150, 260]
+        assert hub.data["hkr_heizgrenze"] == 15.0
+        assert [(item.function, item.address) for item in _writes(simulator)] == [
+            (16, 135),
+            (6, 129),
+            (16, 102),
+        ]
+
+    asyncio.run(_async_with_proxy(test))
@@ -0,0 +1,134 @@
+"""Tests of the register table: encoding, write plans and raw write checks."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.ha_heliotherm.registers import (
+    HOLDING_REGISTERS,
+    MAX_WRITE_REGISTERS,
+    check_raw_write,
+    encode_parameters,
+    plan_writes,
+)
+
+
+@pytest.mark.parametrize(
+    ("key", "value", "raw"),
+    [
+        ("select_betriebsart", "Auto", [1]),
+        ("climate_hkr_raum_soll", {"temperature": 21.5}, [215]),
+        ("climate_hkr_raum_soll", 21.5, [215]),
+        ("hkr_heizgrenze", -10, [-100 & 0xFFFF]),
+        ("aussentemp_override", True, [1]),
+        (
+            "climate_ww_bereitung",
+            {"target_temp_high": 52, "target_temp_low": 44},
+            [520, 440],
+        ),
+        ("pv_energie", 7000, [0, 7000]),
+    ],
+)
+def test_encode(key, value, raw):
+    """Values are scaled, signed and split into their registers."""
+    assert HOLDING_REGISTERS[key].encode(value) == raw
+
+
+@pytest.mark.parametrize(
+    ("key", "value"),
+    [
+        ("select_betriebsart", "Turbo"),
+        ("climate_hkr_raum_soll", 25.1),
+        ("hkr_heizgrenze", -10.1),
+        ("climate_ww_bereitung", {"target_temp_high": 52}),
+        ("climate_ww_bereitung", 52),
+        ("pv_energie", 10001),
+        ("button_entstoerung", 0),
+        ("hkr_heizgrenze", {"x": 1}),
+        ("hkr_heizgrenze", [15]),
+        ("hkr_heizgrenze", "warm"),
+        ("hkr_heizgrenze", float("nan")),
+        ("climate_ww_bereitung", {"target_temp_high": [52], "target_temp_low": 44}),
+    ],
+)
+def test_encode_invalid(key, value):
+    """Values out of range, unknown options and missing fields are rejected."""
+    with pytest.raises(ValueError):
+        HOLDING_REGISTERS[key].encode(value)
+
+
+def test_encode_parameters_reports_all_errors():
+    """Every invalid parameter is listed, not only the first one."""
+    with pytest.raises(ValueError) as err:
+        encode_parameters(
+            {"climate_hkr_raum_soll": 30, "unknown": 1, "hkr_heizgrenze": 15}
+        )
+    assert "climate_hkr_raum_soll" in str(err.value)
+    assert "unknown is not a writable register" in str(err.value)
+    assert "hkr_heizgrenze" not in str(err.value)
+
+
+def test_encode_parameters_rejects_values_of_the_wrong_type():
+    """Service data of the wrong type is a ValueError, not a TypeError."""
+    with pytest.raises(ValueError, match="hkr_heizgrenze"):
+        encode_parameters({"hkr_heizgrenze": {"x": 1}})
+
+
+def test_plan_writes_groups_consecutive_registers():
+    """Consecutive registers share one write, gaps start a new one."""
+    values = encode_parameters(
+        {
+            "hkr_heizgrenze": 15,
+            "hkr_rlt_soll_ohg": 26,
+            "hkr_rlt_soll_0": 33,
+            "select_betriebsart": "Auto",
+            "climate_hkr_raum_soll": 21,
+        }
+    )
+    assert plan_writes(values) == [(100, [1, 210]), (135, [150, 260, 330])]
+
+
+def test_plan_writes_splits_long_runs():
+    """Runs longer than one Modbus write are split."""
+    values = {address: 0 for address in range(2 * MAX_WRITE_REGISTERS + 10)}
+    plan = plan_writes(values)
+    assert [(address, len(run)) for address, run in plan] == [
+        (0, MAX_WRITE_REGISTERS),
+        (MAX_WRITE_REGISTERS, MAX_WRITE_REGISTERS),
+        (2 * MAX_WRITE_REGISTERS, 10),
+    ]
+
+
+@pytest.mark.parametrize("key", HOLDING_REGISTERS)
+def test_check_raw_write_accepts_encoded_values(key):
+    """Everything encode produces passes the raw check, at both range ends."""
+    register = HOLDING_REGISTERS[key]
+    values = (
+        register.options
+        if register.options
+        else (register.min_value, register.max_value)
+    )
+    for value in values:
+        if register.fields:
+            value = {field: value for field in register.fields}
+        check_raw_write(register.address, register.encode(value))
+
+
+@pytest.mark.parametrize(
+    ("address", "values"),
+    [
+        (100, [65535]),  # option index -1
+        (100, [8]),
+        (135, [301]),  # 30.1 °C
+        (135, [-101 & 0xFFFF]),
+        (103, [2]),
+        (117, [0]),  # half of a 32-bit value
+        (118, [5]),
+        (117, [0, 10001]),
+        (128, [0]),
+        (100, [1, 251]),  # second register out of range
+    ],
+)
+def test_check_raw_write_rejects(address, values):
+    """Raw writes out of range, with unknown options or partial are rejected."""
+    with pytest.raises(ValueError):
+        check_raw_write(address, values)
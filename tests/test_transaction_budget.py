@@ -0,0 +1,26 @@
+"""Run the scenarios of scripts/transaction_budget.py against their budgets."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import transaction_budget
+
+
+@pytest.fixture(scope="module")
+def results() -> dict:
+    """Return the measured transactions, registers and bytes by scenario."""
+    return asyncio.run(transaction_budget.async_run(verbose=False))
+
+
+@pytest.mark.parametrize("scenario", transaction_budget.BUDGETS)
+def test_scenario_within_budget(results, scenario):
+    """No scenario costs more transactions, registers or bytes than budgeted."""
+    transactions, registers, size = results[scenario]
+    budget_transactions, budget_registers, budget_size = transaction_budget.BUDGETS[
+        scenario
+    ]
+    assert transactions <= budget_transactions
+    assert registers <= budget_registers
+    assert size <= budget_size